@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Correction Candidates
+
+Compares SymSpell-style lookups (``CorrectionIndex.suggest``) against a
+brute-force Levenshtein scan over the same lexicon. Uses the generated
+Stage 1 dataset if present, otherwise a synthetic noun/verb paradigm.
+
+Usage:
+    python3 scripts/benchmark_correction.py [stage1.jsonl] [num_queries]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.correction import CorrectionIndex
+from dataset.json_stream import iter_json_records
+
+
+NOUN_ENDINGS = ["ah", "am", "ena", "aya", "at", "asya", "e", "au", "abhyam", "aih", "ebhyah", "anam", "esu"]
+VERB_ENDINGS = ["ati", "atah", "anti", "asi", "athah", "atha", "ami", "avah", "amah"]
+STEMS = ["ram", "bal", "dev", "nar", "putr", "vrks", "grh", "pustak", "jal", "as", "gacch", "path",
+         "likh", "vad", "pac", "smar", "cint", "bhaj", "raks", "khad"]
+
+
+def synthetic_rows(count):
+    """Stage 1-shaped rows from stems, a numbered variant and endings."""
+    rows = []
+    variant = 0
+    while len(rows) < count:
+        for stem in STEMS:
+            base = f"{stem}{'aiu'[variant % 3]}{'kgtdpb'[variant // 3 % 6]}" if variant else stem
+            for case, ending in enumerate(NOUN_ENDINGS):
+                rows.append({"output": base + ending, "pratipadika": base, "case": f"case{case}"})
+            for person, ending in enumerate(VERB_ENDINGS):
+                rows.append({"output": base + ending, "root": f"√{base}", "tense": "Present",
+                             "person": person // 3 + 1})
+        variant += 1
+    return rows[:count]
+
+
+def perturb(word, rng):
+    """Apply one or two random edits."""
+    chars = list(word)
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5 or len(chars) < 3:
+            chars[position] = rng.choice("aiukgtpnmrs")
+        else:
+            del chars[position]
+    return "".join(chars)
+
+
+def main():
+    """Run the benchmark."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("datasets/stage1_dhatupatha.jsonl")
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = list(iter_json_records(source)) if source.exists() else synthetic_rows(20_000)
+
+    start = time.perf_counter()
+    index = CorrectionIndex().fit(rows)
+    build_time = time.perf_counter() - start
+
+    rng = random.Random(0)
+    queries = [perturb(rng.choice(index.forms), rng) for _ in range(num_queries)]
+
+    print("=" * 60)
+    print(f"Correction candidates: {len(index):,} forms, {num_queries:,} queries, k=5")
+    print(f"Index build: {build_time:.2f} s")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    fast = [index.suggest(query) for query in queries]
+    fast_time = time.perf_counter() - start
+    start = time.perf_counter()
+    slow = [index.brute_force(query) for query in queries]
+    slow_time = time.perf_counter() - start
+
+    assert [[s["key"] for s in r] for r in fast] == [[s["key"] for s in r] for r in slow]
+    print(f"  {'Deletion index':<24} {fast_time / num_queries * 1e6:10.1f} µs/query")
+    print(f"  {'Brute-force Levenshtein':<24} {slow_time / num_queries * 1e6:10.1f} µs/query")
+    print(f"\n  Speedup: {slow_time / fast_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Symbolic Fast Path
+
+Routes a mixed request stream through ``SymbolicFastPath``: template-shaped
+sentences from the toy dataset and ``KarakaSentenceGenerator``, plus
+off-template sentences that must fall back to the model. The model is not
+loaded; its latency is an assumed constant used to estimate the savings.
+
+Usage:
+    python3 scripts/benchmark_fast_path.py [toy_dataset.jsonl] [model_ms]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.fast_path import SymbolicFastPath
+from generator.karaka_generator import KarakaSentenceGenerator
+
+
+OFF_TEMPLATE = [
+    "The boy quickly reads the book",
+    "Does the girl write a letter?",
+    "The teacher who lives in the house teaches Sanskrit",
+    "Rama went to the forest with Sita",
+    "The boy reads the book because he likes it",
+    "Read the book",
+    "The students will read the book tomorrow",
+    "The boy and the girl play in the garden",
+]
+
+
+def main():
+    """Run the benchmark."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("datasets/toy_dataset.jsonl")
+    model_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 250.0
+
+    rows = []
+    if source.exists():
+        with open(source, 'r', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    fast_path = SymbolicFastPath.from_rows(rows, model_latency_ms=model_ms)
+
+    requests = [row["input"] for row in rows]
+    requests += [row["input"] for row in KarakaSentenceGenerator().sample(200)]
+    requests += OFF_TEMPLATE * 10
+
+    misses = []
+    for text in requests:
+        if fast_path(text) is None:
+            misses.append(text)
+    report = fast_path.report()
+
+    print("=" * 60)
+    print(f"Symbolic fast path: {report['requests']:,} requests, model assumed at {model_ms:.0f} ms")
+    print("=" * 60)
+    print(f"  Hits:        {report['hits']:,} ({report['hit_rate']:.1%})")
+    print(f"  Fallbacks:   {len(misses):,} ({len(set(misses))} distinct sentences)")
+    print(f"  Fast path:   {report['fast_ms'] * 1000:.1f} µs/request")
+    print(f"  Model time saved: {report['saved_ms'] / 1000:.1f} s "
+          f"({report['saved_ms'] / report['requests']:.0f} ms/request on average)")
+
+
+if __name__ == "__main__":
+    main()
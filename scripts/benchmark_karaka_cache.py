@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Karaka Structure Cache
+
+Replays a skewed stream of karaka structures (a few structures requested
+often, most rarely, as in production traffic) through ``KarakaCache``:
+once with an empty SQLite store, then again after a restart with only the
+disk tier warm. Misses are assembled symbolically; the model is not loaded
+and its latency is an assumed constant used to estimate the savings.
+
+Usage:
+    python3 scripts/benchmark_karaka_cache.py [num_requests] [model_ms] [cache.sqlite]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.karaka_cache import KarakaCache
+from generator.karaka_generator import KarakaSentenceGenerator
+
+
+def replay(path, rows, stream):
+    """Serve the stream through a fresh cache instance; return (report, seconds)."""
+    with KarakaCache(path, capacity=256) as cache:
+        start = time.perf_counter()
+        for index in stream:
+            row = rows[index]
+            cache.get_or_compute(row["karaka"], lambda karaka, row=row: row)
+        return cache.report(), time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    model_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 250.0
+    temp_dir = tempfile.TemporaryDirectory()
+    path = Path(sys.argv[3]) if len(sys.argv) > 3 else Path(temp_dir.name) / "karaka_cache.sqlite"
+
+    rows = list(KarakaSentenceGenerator())
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(rows))]
+    stream = rng.choices(range(len(rows)), weights=weights, k=num_requests)
+
+    print("=" * 60)
+    print(f"Karaka cache: {num_requests:,} requests over {len(rows):,} structures, "
+          f"model assumed at {model_ms:.0f} ms")
+    print("=" * 60)
+    for label in ("Cold start", "After restart"):
+        report, elapsed = replay(path, rows, stream)
+        print(f"\n  {label}")
+        print(f"    Hit rate:   {report['hit_rate']:.1%} "
+              f"({report['memory_hits']:,} memory, {report['disk_hits']:,} disk, {report['misses']:,} misses)")
+        print(f"    Latency:    {elapsed / num_requests * 1e6:.1f} µs/request")
+        print(f"    Model calls avoided: {report['requests'] - report['misses']:,} "
+              f"(~{(report['requests'] - report['misses']) * model_ms / 1000:,.0f} s)")
+    temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
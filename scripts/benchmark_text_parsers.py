@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Streaming Sutra/Dhatu Line Parsers
+
+Compares the original read-everything parser (uncompiled ``re.match`` plus
+three ``split('.')`` calls per line) against the precompiled streaming parser
+in ``dataset.text_parsers``.
+
+Usage:
+    python3 scripts/benchmark_text_parsers.py                 # synthetic Ashtadhyayi
+    python3 scripts/benchmark_text_parsers.py path/to/sutras.txt
+"""
+
+import re
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.text_parsers import parse_sutra_lines
+
+
+# Roughly the size of the Ashtadhyayi: 8 adhyayas x 4 padas, ~4,000 sutras
+ADHYAYAS, PADAS, SUTRAS_PER_PADA = 8, 4, 125
+
+
+def legacy_parse_sutra_text(content):
+    """The original ``_parse_sutra_text`` implementation, kept for comparison."""
+    sutra_list = []
+    lines = content.split('\n')
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match = re.match(r'(\d+\.\d+\.\d+)[:\.]\s*(.+)', line)
+        if match:
+            sutra = {
+                "number": match.group(1),
+                "text": match.group(2).strip(),
+                "adhyaya": match.group(1).split('.')[0],
+                "pada": match.group(1).split('.')[1],
+                "sutra": match.group(1).split('.')[2]
+            }
+            sutra_list.append(sutra)
+    return sutra_list
+
+
+def synthetic_sutra_text():
+    """Build a sutra file with Ashtadhyayi-style numbering."""
+    lines = ["# Ashtadhyayi (synthetic benchmark text)"]
+    for adhyaya in range(1, ADHYAYAS + 1):
+        for pada in range(1, PADAS + 1):
+            for sutra in range(1, SUTRAS_PER_PADA + 1):
+                lines.append(f"{adhyaya}.{pada}.{sutra}: vṛddhirādaic adeṅ guṇaḥ iko guṇavṛddhī")
+    return "\n".join(lines) + "\n"
+
+
+def run_legacy(path):
+    """Parse the whole file with the legacy parser; return the sutra count."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return len(legacy_parse_sutra_text(f.read()))
+
+
+def run_streaming(path):
+    """Stream the file through the new parser; return the sutra count."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for _ in parse_sutra_lines(f))
+
+
+def main():
+    """Run the benchmark and print per-pass timings."""
+    if len(sys.argv) > 1:
+        path = Path(sys.argv[1])
+        cleanup = False
+    else:
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as tmp:
+            tmp.write(synthetic_sutra_text())
+            path = Path(tmp.name)
+        cleanup = True
+
+    try:
+        legacy_count = run_legacy(path)
+        streaming_count = run_streaming(path)
+        assert legacy_count == streaming_count, (legacy_count, streaming_count)
+
+        repeat = 20
+        legacy = min(timeit.repeat(lambda: run_legacy(path), number=1, repeat=repeat))
+        streaming = min(timeit.repeat(lambda: run_streaming(path), number=1, repeat=repeat))
+
+        print("=" * 60)
+        print(f"Sutra parser benchmark: {streaming_count} sutras ({path.name})")
+        print("=" * 60)
+        print(f"  Legacy (read + split + re.match): {legacy * 1000:8.2f} ms")
+        print(f"  Streaming (precompiled, lazy):    {streaming * 1000:8.2f} ms")
+        print(f"  Speedup: {legacy / streaming:.2f}x")
+    finally:
+        if cleanup:
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
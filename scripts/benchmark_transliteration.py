@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Devanagari to Romanization
+
+Compares a naive per-character loop against the table-driven
+``from_devanagari`` (single process and parallel chunks) on a synthetic
+corpus built from the toy dataset.
+
+Usage:
+    python3 scripts/benchmark_transliteration.py [num_lines] [workers]
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.transliteration import (
+    VIRAMA,
+    _DEVANAGARI_CONSONANTS,
+    _DEVANAGARI_OTHER,
+    _DEVANAGARI_VOWELS,
+    from_devanagari_batch,
+)
+
+
+NAIVE_CONSONANTS = {char: romans[0] for char, romans in _DEVANAGARI_CONSONANTS.items()}
+NAIVE_VOWELS = {independent: romans[0] for (independent, _), romans in _DEVANAGARI_VOWELS.items()}
+NAIVE_MATRAS = {matra: romans[0] for (_, matra), romans in _DEVANAGARI_VOWELS.items() if matra}
+NAIVE_OTHER = {char: romans[0] for char, romans in _DEVANAGARI_OTHER.items()}
+
+
+def naive_from_devanagari(text):
+    """Per-character state machine: the straightforward implementation."""
+    consonants, vowels, matras, other = NAIVE_CONSONANTS, NAIVE_VOWELS, NAIVE_MATRAS, NAIVE_OTHER
+    output = []
+    pending = False
+    for char in text:
+        if char in matras:
+            output.append(matras[char])
+            pending = False
+        elif char == VIRAMA:
+            pending = False
+        else:
+            if pending:
+                output.append('a')
+            if char in consonants:
+                output.append(consonants[char])
+                pending = True
+            else:
+                output.append(vowels.get(char, other.get(char, char)))
+                pending = False
+    if pending:
+        output.append('a')
+    return "".join(output)
+
+
+def load_corpus(num_lines):
+    """Repeat the toy dataset's Devanagari outputs up to ``num_lines``."""
+    dataset = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+    with open(dataset, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line)["output_devanagari"] for line in f if line.strip()]
+    return (lines * (num_lines // len(lines) + 1))[:num_lines]
+
+
+def timed(label, func, corpus):
+    """Run ``func`` on the corpus and print lines/sec."""
+    start = time.perf_counter()
+    result = func(corpus)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s  {len(corpus) / elapsed:12,.0f} lines/s")
+    return result, elapsed
+
+
+def main():
+    """Run the benchmark."""
+    num_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    corpus = load_corpus(num_lines)
+
+    print("=" * 60)
+    print(f"Devanagari -> IAST: {num_lines:,} lines, {workers} workers")
+    print("=" * 60)
+
+    naive, naive_time = timed("Naive per-character loop", lambda c: [naive_from_devanagari(t) for t in c], corpus)
+    table, table_time = timed("Table (single process)", from_devanagari_batch, corpus)
+    parallel, parallel_time = timed(f"Table ({workers} workers)",
+                                    lambda c: from_devanagari_batch(c, workers=workers), corpus)
+
+    assert naive == table == parallel
+    print(f"\n  Speedup (single process): {naive_time / table_time:.1f}x")
+    print(f"  Speedup (parallel):       {naive_time / parallel_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Inverse Form Index Builder
+
+Inverts generated Stage 1 paradigms into the memory-mapped surface form
+index used by the Auditor, then analyzes an example sentence.
+
+Usage:
+    python3 scripts/build_form_index.py [stage1.jsonl] [index_path] [sentence]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.form_index import FormIndex, build_form_index
+from dataset.json_stream import iter_json_records
+
+
+def main():
+    """Build the index and run a sample analysis."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("datasets/stage1_dhatupatha.jsonl")
+    index_path = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("datasets/form_index.bin")
+    sentence = sys.argv[3] if len(sys.argv) > 3 else "Ramah griham gacchati"
+
+    if not source.exists():
+        print(f"✗ {source} not found; run scripts/generate_dhatupatha_dataset.py first")
+        sys.exit(1)
+
+    forms = build_form_index(iter_json_records(source), index_path)
+    print(f"✓ Indexed {forms:,} surface forms from {source}")
+    print(f"✓ Saved to: {index_path} ({index_path.stat().st_size:,} bytes)")
+
+    with FormIndex(index_path) as index:
+        print(f"\nAnalysis of: {sentence}")
+        for token, analyses in index.analyze(sentence):
+            if not analyses:
+                print(f"  {token}: (unknown)")
+            for analysis in analyses:
+                features = ", ".join(f"{k}={v}" for k, v in analysis["features"].items())
+                print(f"  {token}: {analysis['lemma']} [{features}] sutras {analysis['sutras']}")
+
+
+if __name__ == "__main__":
+    main()
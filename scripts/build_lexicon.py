@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+DAWG Lexicon Builder
+
+Compiles generated Stage 1 paradigms into the minimal automaton lexicon
+(``src/auditor/dawg.py``) and runs sample membership, analysis and prefix
+queries against the memory-mapped file.
+
+Usage:
+    python3 scripts/build_lexicon.py [stage1.jsonl] [lexicon_path] [prefix]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.dawg import DawgLexicon, compile_lexicon
+from dataset.json_stream import iter_json_records
+
+
+def main():
+    """Compile the lexicon and run sample queries."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("datasets/stage1_dhatupatha.jsonl")
+    lexicon_path = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("datasets/lexicon.dawg")
+    prefix = sys.argv[3] if len(sys.argv) > 3 else "gacch"
+
+    if not source.exists():
+        print(f"✗ {source} not found; run scripts/generate_dhatupatha_dataset.py first")
+        sys.exit(1)
+
+    stats = compile_lexicon(iter_json_records(source), lexicon_path)
+    print(f"✓ Compiled {stats['words']:,} forms into {stats['states']:,} states / {stats['arcs']:,} arcs")
+    print(f"✓ Saved to: {lexicon_path} ({stats['bytes']:,} bytes)")
+
+    with DawgLexicon(lexicon_path) as lexicon:
+        completions = list(lexicon.complete(prefix, limit=10))
+        print(f"\nForms starting with {prefix!r}: {', '.join(completions) or '(none)'}")
+        for form in completions[:3]:
+            for analysis in lexicon.analyses(form):
+                features = ", ".join(f"{k}={v}" for k, v in analysis["features"].items())
+                print(f"  {form}: {analysis['lemma']} [{features}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Meaning Index Builder
+
+Builds the English-to-dhatu inverted index (``src/generator/root_mapper.py``)
+from the dhatu extracted from the ashtadhyayi-com/data repository, falling
+back to the common dhatu list when no extracted corpus is available, and
+runs sample lookups against the saved file.
+
+Usage:
+    python3 scripts/build_meaning_index.py [repo_path] [index_path] [verb ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generate_dhatupatha_dataset import AshtadhyayiDataExtractor
+from generator.root_mapper import COMMON_DHATU, MeaningIndex
+
+
+def main():
+    """Build the index and run sample lookups."""
+    repo_path = sys.argv[1] if len(sys.argv) > 1 else "data/ashtadhyayi-data"
+    index_path = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("datasets/meaning_index.json")
+    queries = sys.argv[3:] or ["reads", "gives", "went", "speaking", "is"]
+
+    dhatu_list = list(AshtadhyayiDataExtractor(repo_path).iter_dhatu())
+    if not dhatu_list:
+        print("⚠ No extracted dhatu; indexing the common dhatu list")
+        dhatu_list = COMMON_DHATU
+
+    start = time.perf_counter()
+    index = MeaningIndex.build(dhatu_list)
+    index.save(index_path)
+    print(f"✓ Indexed {len(index):,} dhatu under {len(index.postings):,} meaning tokens "
+          f"in {time.perf_counter() - start:.2f} s")
+    print(f"✓ Saved to: {index_path}")
+
+    index = MeaningIndex.load(index_path)
+    for query in queries:
+        start = time.perf_counter()
+        candidates = index.lookup(query)
+        elapsed = (time.perf_counter() - start) * 1e6
+        listed = ", ".join(f"{c['root']} (gana {c['gana']}, {c['score']:.2f})" for c in candidates)
+        print(f"  {query:<12} {listed or '(none)'}  [{elapsed:.1f} µs]")
+
+
+if __name__ == "__main__":
+    main()
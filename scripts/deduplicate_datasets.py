@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Dataset Deduplication
+
+Removes exact and near-duplicate rows across generated JSONL shards and
+prints how many rows were removed per stage.
+
+Usage:
+    python3 scripts/deduplicate_datasets.py output_dir shard1.jsonl [shard2.jsonl ...]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.dedup import Deduplicator
+
+
+def main():
+    """Deduplicate the shards and print the report."""
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    output_dir, shards = sys.argv[1], sys.argv[2:]
+    report = Deduplicator().deduplicate(shards, output_dir)
+
+    print(f"Rows: {report['rows']:,}  kept: {report['kept']:,}  removed: {report['removed']:,}")
+    print(f"  {'Stage':<14} {'Rows':>10} {'Exact':>10} {'Near':>10}")
+    for stage, counts in report["stages"].items():
+        print(f"  {stage:<14} {counts['rows']:>10,} {counts['exact']:>10,} {counts['near']:>10,}")
+    for output in report["outputs"]:
+        print(f"Output: {output}")
+
+
+if __name__ == "__main__":
+    main()
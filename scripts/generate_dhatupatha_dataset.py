@@ -11,9 +11,18 @@ Repository: https://github.com/ashtadhyayi-com/data
 import json
 import os
 import subprocess
+import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import re
+from typing import Iterator, List, Dict, Mapping, Tuple, Optional, Sequence
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.json_stream import iter_json_records
+from dataset.paradigm_coverage import ParadigmCoverage
+from dataset.records import ColumnarStore, DhatuRecord, SutraRecord
+from dataset.text_parsers import parse_dhatu_lines, parse_sutra_lines
+from generator.root_mapper import COMMON_DHATU
 
 
 class AshtadhyayiDataExtractor:
@@ -22,6 +31,9 @@ class AshtadhyayiDataExtractor:
     for Stage 1: Dhatu-Patha (Morphology) training.
     """
     
+    # Keys the Stage 1 generator actually reads from dhatu records
+    DHATU_FIELDS = ("root", "dhatu", "gana", "meaning")
+    
     def __init__(self, repo_path: Optional[str] = None):
         """
         Initialize extractor.
@@ -54,78 +66,54 @@ class AshtadhyayiDataExtractor:
                 check=False  # Don't fail if already up to date
             )
     
-    def extract_dhatu(self) -> List[Dict]:
+    def extract_dhatu(self) -> List[DhatuRecord]:
         """
         Extract verb roots (dhatu) from the repository.
         
         Returns:
-            List of dhatu dictionaries with root, meaning, gana, etc.
+            List of slotted dhatu records with root, meaning and gana
+        """
+        dhatu_list = [dhatu if isinstance(dhatu, DhatuRecord) else DhatuRecord.from_dict(dhatu)
+                      for dhatu in self.iter_dhatu()]
+        print(f"✓ Extracted {len(dhatu_list)} dhatu entries")
+        return dhatu_list
+    
+    def iter_dhatu(self, fields: Optional[Sequence[str]] = DHATU_FIELDS) -> Iterator[Mapping]:
+        """
+        Stream verb roots (dhatu) from the repository one record at a time.
+        
+        Args:
+            fields: Keys to keep from JSON records (None keeps every key)
+            
+        Returns:
+            Iterator over dhatu dictionaries (JSON) or records (text files)
         """
         dhatu_dir = Path(self.repo_path) / "dhatu"
         
         if not dhatu_dir.exists():
             print(f"⚠ Warning: dhatu directory not found at {dhatu_dir}")
-            return []
-        
-        dhatu_list = []
+            return
         
         # Look for JSON or text files in dhatu directory
         for file_path in dhatu_dir.rglob("*"):
             if file_path.is_file():
-                if file_path.suffix in ['.json', '.txt', '.md']:
+                if file_path.suffix in ['.json', '.jsonl', '.txt', '.md']:
                     try:
-                        if file_path.suffix == '.json':
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                if isinstance(data, list):
-                                    dhatu_list.extend(data)
-                                elif isinstance(data, dict):
-                                    dhatu_list.append(data)
+                        if file_path.suffix in ['.json', '.jsonl']:
+                            yield from iter_json_records(file_path, fields)
                         else:
-                            # Parse text files
+                            # Parse text files line by line
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                # Extract dhatu patterns
-                                dhatu_list.extend(self._parse_dhatu_text(content))
+                                yield from parse_dhatu_lines(f)
                     except Exception as e:
                         print(f"⚠ Error parsing {file_path}: {e}")
-        
-        print(f"✓ Extracted {len(dhatu_list)} dhatu entries")
-        return dhatu_list
-    
-    def _parse_dhatu_text(self, content: str) -> List[Dict]:
-        """Parse dhatu from text content."""
-        dhatu_list = []
-        
-        # Common patterns for dhatu notation
-        # Format: root_number gana meaning
-        # Example: "गम् 1 गतौ" (gam, gana 1, meaning: to go)
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Try to extract dhatu information
-            # This is a simplified parser - adjust based on actual format
-            parts = line.split()
-            if len(parts) >= 2:
-                dhatu = {
-                    "root": parts[0],
-                    "gana": parts[1] if len(parts) > 1 else "1",
-                    "meaning": " ".join(parts[2:]) if len(parts) > 2 else ""
-                }
-                dhatu_list.append(dhatu)
-        
-        return dhatu_list
     
-    def extract_sutras(self) -> List[Dict]:
+    def extract_sutras(self) -> List[SutraRecord]:
         """
         Extract Panini's sutras (rules) from the repository.
         
         Returns:
-            List of sutra dictionaries with number, text, meaning, etc.
+            List of slotted sutra records with number, text, adhyaya, etc.
         """
         sutra_dir = Path(self.repo_path) / "sutraani"
         
@@ -141,77 +129,54 @@ class AshtadhyayiDataExtractor:
                 if file_path.suffix in ['.json', '.txt', '.md']:
                     try:
                         if file_path.suffix == '.json':
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                if isinstance(data, list):
-                                    sutra_list.extend(data)
-                                elif isinstance(data, dict):
-                                    sutra_list.append(data)
+                            sutra_list.extend(SutraRecord.from_dict(sutra)
+                                              for sutra in iter_json_records(file_path))
                         else:
-                            # Parse text files
+                            # Parse text files line by line
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                sutra_list.extend(self._parse_sutra_text(content))
+                                sutra_list.extend(parse_sutra_lines(f))
                     except Exception as e:
                         print(f"⚠ Error parsing {file_path}: {e}")
         
         print(f"✓ Extracted {len(sutra_list)} sutras")
         return sutra_list
     
-    def _parse_sutra_text(self, content: str) -> List[Dict]:
-        """Parse sutras from text content."""
-        sutra_list = []
-        
-        # Common patterns: "1.1.1 text" or "1.1.1: text"
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Match sutra number pattern (e.g., "1.1.1", "1.2.3")
-            match = re.match(r'(\d+\.\d+\.\d+)[:\.]\s*(.+)', line)
-            if match:
-                sutra = {
-                    "number": match.group(1),
-                    "text": match.group(2).strip(),
-                    "adhyaya": match.group(1).split('.')[0],
-                    "pada": match.group(1).split('.')[1],
-                    "sutra": match.group(1).split('.')[2]
-                }
-                sutra_list.append(sutra)
+    def extract_shabda(self) -> ColumnarStore:
+        """
+        Extract word forms (shabda) from the repository.
         
-        return sutra_list
+        Returns:
+            Columnar store of word forms; rows are read-only mappings.
+        """
+        shabda_list = ColumnarStore.from_records(self.iter_shabda())
+        print(f"✓ Extracted {len(shabda_list)} shabda entries")
+        return shabda_list
     
-    def extract_shabda(self) -> List[Dict]:
+    def iter_shabda(self, fields: Optional[Sequence[str]] = None) -> Iterator[Dict]:
         """
-        Extract word forms (shabda) from the repository.
+        Stream word forms (shabda) from the repository one record at a time.
         
+        Shabda dumps run to hundreds of megabytes, so each file is decoded
+        incrementally and peak memory is bounded by a single record.
+        
+        Args:
+            fields: Keys to keep from each record (None keeps every key)
+            
         Returns:
-            List of word form dictionaries.
+            Iterator over word form dictionaries
         """
         shabda_dir = Path(self.repo_path) / "shabda"
         
         if not shabda_dir.exists():
             print(f"⚠ Warning: shabda directory not found at {shabda_dir}")
-            return []
-        
-        shabda_list = []
+            return
         
         for file_path in shabda_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix == '.json':
+            if file_path.is_file() and file_path.suffix in ['.json', '.jsonl']:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            shabda_list.extend(data)
-                        elif isinstance(data, dict):
-                            shabda_list.append(data)
+                    yield from iter_json_records(file_path, fields)
                 except Exception as e:
                     print(f"⚠ Error parsing {file_path}: {e}")
-        
-        print(f"✓ Extracted {len(shabda_list)} shabda entries")
-        return shabda_list
 
 
 class Stage1DatasetGenerator:
@@ -219,13 +184,13 @@ class Stage1DatasetGenerator:
     Generates Stage 1: Dhatu-Patha training dataset from extracted data.
     """
     
-    def __init__(self, dhatu_list: List[Dict], sutra_list: List[Dict]):
+    def __init__(self, dhatu_list: Sequence[Mapping], sutra_list: Sequence[Mapping]):
         """
         Initialize generator.
         
         Args:
-            dhatu_list: List of verb roots
-            sutra_list: List of Panini's sutras
+            dhatu_list: Verb roots (dicts or DhatuRecord)
+            sutra_list: Panini's sutras (dicts or SutraRecord)
         """
         self.dhatu_list = dhatu_list
         self.sutra_list = sutra_list
@@ -247,6 +212,16 @@ class Stage1DatasetGenerator:
         # Common noun declensions
         self.cases = ["Nominative", "Accusative", "Instrumental", "Dative", "Ablative", "Genitive", "Locative", "Vocative"]
         self.numbers = ["Singular", "Dual", "Plural"]
+        self.genders = ["masculine", "feminine", "neuter"]
+        
+        # Filled vs. attempted paradigm cells (forms that come back None are missing)
+        tenses = list(dict.fromkeys(tense for tense, _, _ in self.tense_person_number))
+        self.verb_coverage = ParadigmCoverage("root", [
+            ("tense", tenses), ("person", [1, 2, 3]), ("number", self.numbers),
+        ])
+        self.noun_coverage = ParadigmCoverage("pratipadika", [
+            ("case", self.cases), ("number", self.numbers), ("gender", self.genders),
+        ])
     
     def generate_verb_examples(self, max_examples: int = 10000) -> List[Dict]:
         """
@@ -260,22 +235,8 @@ class Stage1DatasetGenerator:
         """
         examples = []
         
-        # Use common dhatu or generate from list
-        common_dhatu = [
-            {"root": "√gam", "meaning": "to go", "gana": "1"},
-            {"root": "√path", "meaning": "to read", "gana": "1"},
-            {"root": "√likh", "meaning": "to write", "gana": "1"},
-            {"root": "√da", "meaning": "to give", "gana": "3"},
-            {"root": "√kri", "meaning": "to do", "gana": "8"},
-            {"root": "√bhu", "meaning": "to be", "gana": "1"},
-            {"root": "√as", "meaning": "to be", "gana": "2"},
-            {"root": "√dris", "meaning": "to see", "gana": "1"},
-            {"root": "√shru", "meaning": "to hear", "gana": "1"},
-            {"root": "√vac", "meaning": "to speak", "gana": "2"},
-        ]
-        
         # Use provided dhatu or fallback to common ones
-        dhatu_to_use = self.dhatu_list[:50] if self.dhatu_list else common_dhatu
+        dhatu_to_use = self.dhatu_list[:50] if self.dhatu_list else COMMON_DHATU
         
         for dhatu in dhatu_to_use:
             root = dhatu.get("root", dhatu.get("dhatu", "√gam"))
@@ -285,6 +246,7 @@ class Stage1DatasetGenerator:
             for tense, person, number in self.tense_person_number:
                 # Generate Sanskrit form (simplified - in production use Vidyut)
                 sanskrit_form = self._generate_verb_form(root, tense, person, number)
+                self.verb_coverage.record(root, (tense, person, number), bool(sanskrit_form))
                 
                 if sanskrit_form:
                     example = {
@@ -407,6 +369,7 @@ class Stage1DatasetGenerator:
                 for number in self.numbers:
                     # Generate declension (simplified)
                     declension = self._generate_noun_form(base, case, number, gender)
+                    self.noun_coverage.record(base, (case, number, gender), bool(declension))
                     
                     if declension:
                         example = {
@@ -521,6 +484,16 @@ class Stage1DatasetGenerator:
         print(f"  Verb conjugations: {verb_count}")
         print(f"  Noun declensions: {noun_count}")
         
+        # Paradigm coverage (which requested cells produced no form)
+        print(f"\nVerb paradigm coverage (root x tense):")
+        print(self.verb_coverage.heatmap())
+        print(f"\nNoun paradigm coverage (pratipadika x case):")
+        print(self.noun_coverage.heatmap())
+        stem = output_path.with_suffix("")
+        self.verb_coverage.save(f"{stem}.verb_coverage.npz")
+        self.noun_coverage.save(f"{stem}.noun_coverage.npz")
+        print(f"✓ Coverage saved to: {stem}.verb_coverage.npz, {stem}.noun_coverage.npz")
+        
         return all_examples
 
 
@@ -9,9 +9,16 @@ This dataset demonstrates Intent-to-Structure translation following Panini's rul
 """
 
 import json
+import sys
 from typing import List, Dict, Tuple
 from pathlib import Path
 
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.karaka_generator import assess_complexity, grammar_notes
+from generator.transliteration import to_devanagari
+
 
 class ToyDatasetGenerator:
     """
@@ -328,71 +335,25 @@ class ToyDatasetGenerator:
     
     def _transliterate_to_devanagari(self, transliterated: str) -> str:
         """
-        Simple transliteration to Devanagari (basic mapping).
-        For a full implementation, use a proper transliteration library.
-        """
-        # Basic IAST to Devanagari mapping (simplified)
-        # In production, use a proper library like indic-transliteration
-        mapping = {
-            'a': 'अ', 'aa': 'आ', 'i': 'इ', 'ii': 'ई', 'u': 'उ', 'uu': 'ऊ',
-            'e': 'ए', 'ai': 'ऐ', 'o': 'ओ', 'au': 'औ',
-            'k': 'क', 'kh': 'ख', 'g': 'ग', 'gh': 'घ', 'ng': 'ङ',
-            'ch': 'च', 'chh': 'छ', 'j': 'ज', 'jh': 'झ', 'ny': 'ञ',
-            't': 'त', 'th': 'थ', 'd': 'द', 'dh': 'ध', 'n': 'न',
-            'p': 'प', 'ph': 'फ', 'b': 'ब', 'bh': 'भ', 'm': 'म',
-            'y': 'य', 'r': 'र', 'l': 'ल', 'v': 'व', 'sh': 'श',
-            'sh': 'ष', 's': 'स', 'h': 'ह',
-            'ah': 'ः', 'am': 'ं', 'ah': 'ः'
-        }
+        Transliterate the romanized Sanskrit output to Devanagari.
         
-        # For now, return placeholder - proper transliteration requires a library
-        # This is a simplified version for the POC
-        return f"[Devanagari: {transliterated}]"  # Placeholder
+        Uses the trie-based engine in generator.transliteration, which
+        accepts both IAST and the loose ASCII spellings used here.
+        """
+        return to_devanagari(transliterated)
     
     def _generate_grammar_notes(self, karaka: Dict) -> str:
-        """Generate grammar explanation notes."""
-        notes = []
-        
-        if "karta" in karaka:
-            karta = karaka["karta"]
-            notes.append(f"Karta (Agent): '{karta['word']}' → {karta['sanskrit']} ({karta['case']} case, {karta['vibhakti']})")
-        
-        if "karma" in karaka:
-            karma = karaka["karma"]
-            notes.append(f"Karma (Object): '{karma['word']}' → {karma['sanskrit']} ({karma['case']} case, {karma['vibhakti']})")
-        
-        if "karana" in karaka:
-            karana = karaka["karana"]
-            notes.append(f"Karana (Instrument): '{karana['word']}' → {karana['sanskrit']} ({karana['case']} case, {karana['vibhakti']})")
-        
-        if "sampradana" in karaka:
-            sampradana = karaka["sampradana"]
-            notes.append(f"Sampradana (Recipient): '{sampradana['word']}' → {sampradana['sanskrit']} ({sampradana['case']} case, {sampradana['vibhakti']})")
-        
-        if "apadana" in karaka:
-            apadana = karaka["apadana"]
-            notes.append(f"Apadana (Source): '{apadana['word']}' → {apadana['sanskrit']} ({apadana['case']} case, {apadana['vibhakti']})")
-        
-        if "adhikarana" in karaka:
-            adhikarana = karaka["adhikarana"]
-            notes.append(f"Adhikarana (Location): '{adhikarana['word']}' → {adhikarana['sanskrit']} ({adhikarana['case']} case, {adhikarana['vibhakti']})")
-        
-        if "kriya" in karaka:
-            kriya = karaka["kriya"]
-            notes.append(f"Kriya (Verb): '{kriya['word']}' → {kriya['root']} → {kriya['tense']}, {kriya['person']}rd person, {kriya['number']}")
+        """
+        Generate grammar explanation notes.
         
-        return "; ".join(notes)
+        Formatting is compiled once per karaka signature (the roles present)
+        and cached, see generator.karaka_generator.grammar_notes.
+        """
+        return grammar_notes(karaka)
     
     def _assess_complexity(self, karaka: Dict) -> str:
-        """Assess sentence complexity."""
-        karaka_count = len([k for k in karaka.keys() if k != "kriya"])
-        
-        if karaka_count == 1:
-            return "simple"
-        elif karaka_count == 2:
-            return "medium"
-        else:
-            return "complex"
+        """Assess sentence complexity (cached per karaka signature)."""
+        return assess_complexity(karaka)
 
 
 def main():
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Load Generator: Sandhi Service
+
+Sends concurrent keep-alive requests to the Sandhi service and reports
+p50/p99 latency and requests/sec. Without a target it starts the service
+in-process on an ephemeral localhost port, so it runs with nothing else set up.
+
+Usage:
+    python3 scripts/load_test_sandhi.py [num_requests] [concurrency] [port | unix_socket_path]
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from service.sandhi_service import SandhiClient, SandhiService, run_load
+
+
+FIRST_WORDS = ["Deva", "Rama", "Krishna", "Ganga", "Sita", "Lakshmana", "Baalah", "Guru"]
+SECOND_WORDS = ["Alaya", "iti", "api", "uvaca", "eva", "Arjuna", "Uttara", "asti"]
+
+
+def make_payloads(num_requests):
+    """A seeded mix of apply, split and validate requests."""
+    rng = random.Random(0)
+    payloads = []
+    for _ in range(num_requests):
+        word1, word2 = rng.choice(FIRST_WORDS), rng.choice(SECOND_WORDS)
+        kind = rng.random()
+        if kind < 0.6:
+            payloads.append(("/sandhi", {"word1": word1, "word2": word2}))
+        elif kind < 0.8:
+            payloads.append(("/split", {"word": word1 + word2}))
+        else:
+            payloads.append(("/validate", {"word1": word1, "word2": word2, "expected": word1 + word2}))
+    return payloads
+
+
+async def run(num_requests, concurrency, target):
+    """Run the load against ``target`` or an in-process service."""
+    payloads = make_payloads(num_requests)
+    service = None
+    if target is None:
+        service = SandhiService()
+        server = await service.start(port=0)
+        port, unix_path = server.sockets[0].getsockname()[1], None
+    elif target.isdigit():
+        port, unix_path = int(target), None
+    else:
+        port, unix_path = 0, target
+    try:
+        report = await run_load(lambda: SandhiClient(port=port, unix_path=unix_path), payloads, concurrency)
+        async with SandhiClient(port=port, unix_path=unix_path) as client:
+            _, health = await client.request("GET", "/health")
+    finally:
+        if service:
+            await service.stop()
+    return report, health
+
+
+def main():
+    """Run the load test and print the report."""
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    target = sys.argv[3] if len(sys.argv) > 3 else None
+
+    report, health = asyncio.run(run(num_requests, concurrency, target))
+    print("=" * 60)
+    print(f"Sandhi service load: {report['requests']:,} requests, {concurrency} connections")
+    print("=" * 60)
+    print(f"  Throughput:  {report['rps']:10,.0f} req/s")
+    print(f"  Latency p50: {report['p50_ms']:10.2f} ms")
+    print(f"  Latency p99: {report['p99_ms']:10.2f} ms")
+    print(f"  Errors:      {report['errors']:10,}")
+    print(f"  Mean batch:  {health['mean_batch']:10.1f} requests")
+    for name, info in health["cache"].items():
+        total = info["hits"] + info["misses"]
+        print(f"  Cache {name:<6} {info['hits'] / total if total else 0:10.1%} hit rate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Sequence Packing for Curriculum Training
+
+Tokenizes a JSONL dataset (if needed) and first-fit-decreasing packs it into
+fixed-length sequences, then prints the packing report.
+
+Usage:
+    python3 scripts/pack_dataset.py datasets/toy_dataset.jsonl [max_length]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.packing import pack_token_dataset
+from dataset.token_store import ByteTokenizer, TokenDataset, tokenize_jsonl
+
+
+def main():
+    """Tokenize, pack and report."""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    source = Path(sys.argv[1])
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    prefix = source.with_suffix(".tok")
+
+    if not prefix.with_name(prefix.name + ".json").exists():
+        tokenize_jsonl(source, prefix)
+    data = TokenDataset(prefix)
+    packed_prefix = source.with_suffix(f".packed{max_length}")
+    report = pack_token_dataset(data, packed_prefix, max_length, ByteTokenizer.pad_token_id,
+                                drop_oversized=True)
+
+    print(f"Packed {report['documents']:,} examples into {report['sequences']:,} x {max_length} sequences")
+    print(f"  Packing efficiency:    {report['efficiency']:.1%}")
+    print(f"  Padded (1 per row):    {report['padded_efficiency']:.1%}")
+    print(f"  Examples per sequence: {report['examples_per_sequence']:.1f}")
+    if report["dropped"]:
+        print(f"  Dropped (too long):    {report['dropped']:,}")
+    print(f"  Output: {packed_prefix}.packed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Sandhi Service
+
+Runs the local asyncio Sandhi/validation service (``src/service/sandhi_service.py``)
+on a TCP port or a Unix socket until interrupted.
+
+Usage:
+    python3 scripts/serve_sandhi.py [port | unix_socket_path]
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from service.sandhi_service import SandhiService
+
+
+async def serve(target: str):
+    """Serve until cancelled."""
+    service = SandhiService()
+    if target.isdigit():
+        server = await service.start(port=int(target))
+        print(f"✓ Serving on http://127.0.0.1:{target} (/sandhi, /split, /validate, /health)")
+    else:
+        server = await service.start(unix_path=target)
+        print(f"✓ Serving on unix socket {target}")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    """Parse the target and serve."""
+    target = sys.argv[1] if len(sys.argv) > 1 else "8765"
+    try:
+        asyncio.run(serve(target))
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+
+
+if __name__ == "__main__":
+    main()
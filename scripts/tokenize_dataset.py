@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Packed Token Dataset Builder
+
+Tokenizes a generated JSONL dataset once into the flat ``.tokens`` /
+``.offsets`` format read by ``dataset.token_store.TokenDataset``.
+
+Usage:
+    python3 scripts/tokenize_dataset.py datasets/toy_dataset.jsonl [output_prefix] [hf_tokenizer]
+
+Without ``hf_tokenizer`` the local byte-level tokenizer is used.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.token_store import ByteTokenizer, TokenDataset, tokenize_jsonl
+
+
+class HuggingFaceTokenizer:
+    """Adapter that stops a Hugging Face tokenizer adding specials per field."""
+
+    def __init__(self, name: str):
+        from transformers import AutoTokenizer
+        self._tokenizer = AutoTokenizer.from_pretrained(name)
+        self.vocab_size = len(self._tokenizer)
+        self.eos_token_id = self._tokenizer.eos_token_id
+
+    def encode(self, text):
+        return self._tokenizer.encode(text, add_special_tokens=False)
+
+
+def main():
+    """Tokenize the dataset and print a summary."""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    source = Path(sys.argv[1])
+    prefix = Path(sys.argv[2]) if len(sys.argv) > 2 else source.with_suffix(".tok")
+    tokenizer = HuggingFaceTokenizer(sys.argv[3]) if len(sys.argv) > 3 else ByteTokenizer()
+
+    rows = tokenize_jsonl(source, prefix, tokenizer)
+    data = TokenDataset(prefix)
+    print(f"Tokenized {rows:,} rows from {source}")
+    print(f"  Tokens: {data.num_tokens:,} ({data.dtype.name})")
+    if rows:
+        print(f"  Mean row length: {data.lengths.mean():.1f} tokens")
+    print(f"  Output: {prefix}.tokens, {prefix}.offsets, {prefix}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Karaka Validator
+
+Checks the karaka structures of a Stage 2 JSONL dataset (case/vibhakti per
+role, karta-kriya agreement, surface forms, form collisions) in parallel
+batches and writes every violation with its row ID.
+
+Usage:
+    python3 scripts/validate_karaka.py [dataset.jsonl] [violations.jsonl] [workers]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.karaka_validator import validate_jsonl
+
+
+def main():
+    """Validate a dataset and print the report."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("datasets/toy_dataset.jsonl")
+    output = Path(sys.argv[2]) if len(sys.argv) > 2 else source.with_suffix(".violations.jsonl")
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+
+    if not source.exists():
+        print(f"✗ {source} not found")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    report = validate_jsonl(source, output, workers=workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Checked {report['rows']:,} rows in {elapsed:.2f} s "
+          f"({report['rows'] / elapsed * 60:,.0f} rows/min, {workers} workers)")
+    print(f"  Violations: {report['violations']:,} in {report['rows_with_violations']:,} rows")
+    print(f"  Warnings: {report['warnings']:,}")
+    for rule, count in sorted(report["by_rule"].items()):
+        print(f"    {rule:<18} {count:,}")
+    print(f"✓ Saved to: {output}")
+    sys.exit(1 if report["violations"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Correction Candidates Module
+
+Suggests the nearest valid forms for a misspelled or mis-inflected token
+(``Ramena`` -> ``Ramah``) for the Auditor's correction engine.
+
+Uses a SymSpell-style deletion neighborhood: every generated form's key
+(truncated to ``prefix_length`` characters) is expanded into all strings
+reachable by up to ``max_distance`` deletions, once, at build time. A lookup
+only generates the deletions of the query and verifies the few forms they
+hit with a bounded Levenshtein distance, instead of scanning the whole
+lexicon. Candidates can be restricted by lemma or grammatical features.
+
+Distances are measured on the Devanagari keys shared with the form index,
+so romanized and Devanagari queries behave the same.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from auditor.form_index import Analysis, form_key, iter_analyses
+
+
+def _dp_distance(a: str, b: str) -> int:
+    """Textbook dynamic-programming Levenshtein distance."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _match_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in ``pattern``."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | 1 << i
+    return masks
+
+
+def _bit_parallel_distance(masks: Mapping[str, int], length: int, text: str) -> int:
+    """Myers/Hyyrö bit-vector Levenshtein of a pattern (as ``masks``) against ``text``."""
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    high = 1 << (length - 1)
+    positive, negative, score = full, 0, length
+    for char in text:
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        plus = negative | ~(horizontal | positive) & full
+        minus = positive & horizontal
+        if plus & high:
+            score += 1
+        elif minus & high:
+            score -= 1
+        plus = (plus << 1 | 1) & full
+        minus = (minus << 1) & full
+        positive = minus | ~(vertical | plus) & full
+        negative = plus & vertical
+    return score
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Edit distance between two strings (bit-parallel over ``b``).
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Distances above this bound are reported as ``max_distance + 1``
+
+    Returns:
+        The distance, capped at ``max_distance + 1``
+    """
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    distance = _bit_parallel_distance(_match_masks(b), len(b), a)
+    return distance if max_distance is None else min(distance, max_distance + 1)
+
+
+def _matches(analysis: Analysis, filters: Mapping[str, Any]) -> bool:
+    for name, wanted in filters.items():
+        value = analysis["lemma"] if name == "lemma" else analysis["features"].get(name)
+        if str(value).casefold() != str(wanted).casefold():
+            return False
+    return True
+
+
+class CorrectionIndex:
+    """
+    Deletion-neighborhood index over generated surface forms.
+
+    Example:
+        >>> index = CorrectionIndex().fit(iter_json_records("datasets/stage1_dhatupatha.jsonl"))
+        >>> index.suggest("Ramena", k=3, case="Nominative")[0]["form"]
+        'Ramah'
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        """
+        Configure the index.
+
+        Args:
+            max_distance: Largest edit distance supported by lookups
+            prefix_length: Characters of each key expanded into deletions;
+                           bounds index size for long forms
+
+        Raises:
+            ValueError: If ``max_distance`` < 0 or ``prefix_length`` <= ``max_distance``
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must exceed max_distance")
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.keys: List[str] = []
+        self.forms: List[str] = []
+        self.analyses: List[List[Analysis]] = []
+        self._ids: Dict[str, int] = {}
+        self._deletes: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _deletion_levels(self, word: str, depth: int) -> List[List[str]]:
+        """Strings reachable from ``word`` by exactly 0, 1, ..., ``depth`` deletions."""
+        found = {word}
+        levels = [[word]]
+        for _ in range(depth):
+            level = []
+            for item in levels[-1]:
+                for i in range(len(item)):
+                    deleted = item[:i] + item[i + 1:]
+                    if deleted not in found:
+                        found.add(deleted)
+                        level.append(deleted)
+            levels.append(level)
+        return levels
+
+    def add(self, form: str, analysis: Analysis) -> int:
+        """Add one analysis of a surface form; returns the form's ID."""
+        key = form_key(form)
+        term_id = self._ids.get(key)
+        if term_id is None:
+            term_id = len(self.keys)
+            self._ids[key] = term_id
+            self.keys.append(key)
+            self.forms.append(form)
+            self.analyses.append([])
+            for level in self._deletion_levels(key[:self.prefix_length], self.max_distance):
+                for deleted in level:
+                    self._deletes.setdefault(deleted, []).append(term_id)
+        if analysis not in self.analyses[term_id]:
+            self.analyses[term_id].append(analysis)
+        return term_id
+
+    def fit(self, rows: Iterable[Mapping[str, Any]]) -> "CorrectionIndex":
+        """Add every Stage 1 verb and noun form in ``rows``."""
+        for form, analysis in iter_analyses(rows):
+            self.add(form, analysis)
+        return self
+
+    def suggest(self, token: str, k: int = 5, max_distance: Optional[int] = None,
+                **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Nearest valid forms for ``token``.
+
+        Query deletions are visited by increasing depth, and once ``k``
+        candidates are found the bound shrinks to the ``k``-th best distance,
+        so dense neighborhoods stop early.
+
+        Args:
+            token: Query in any supported script
+            k: Maximum number of candidates
+            max_distance: Edit distance bound (at most the index's)
+            **filters: ``lemma=`` or feature values (``pos``, ``case``,
+                       ``number``, ``tense``, ...) every returned analysis
+                       must match, compared case-insensitively
+
+        Returns:
+            Up to ``k`` dicts with ``form``, ``key``, ``distance`` and the
+            matching ``analyses``, nearest first (ties by key)
+
+        Raises:
+            ValueError: If ``max_distance`` exceeds the index's
+        """
+        bound = self.max_distance if max_distance is None else max_distance
+        if bound > self.max_distance:
+            raise ValueError(f"max_distance is limited to {self.max_distance} by this index")
+        key = form_key(token)
+        prefix = key[:self.prefix_length]
+        masks = _match_masks(key)
+
+        seen: Set[int] = set()
+        results: List[Tuple[int, str, int, List[Analysis]]] = []
+        for depth, level in enumerate(self._deletion_levels(prefix, bound)):
+            if depth > bound:
+                break
+            for deleted in level:
+                for term_id in self._deletes.get(deleted, ()):
+                    if term_id in seen:
+                        continue
+                    seen.add(term_id)
+                    candidate = self.keys[term_id]
+                    if abs(len(candidate) - len(key)) > bound:
+                        continue
+                    analyses = [a for a in self.analyses[term_id] if _matches(a, filters)]
+                    if not analyses:
+                        continue
+                    distance = _bit_parallel_distance(masks, len(key), candidate)
+                    if distance > bound:
+                        continue
+                    results.append((distance, candidate, term_id, analyses))
+                    if len(results) > k:
+                        results.sort(key=lambda result: result[:2])
+                        del results[k:]
+                        bound = results[-1][0]
+        results.sort(key=lambda result: result[:2])
+        return [{"form": self.forms[term_id], "key": candidate, "distance": distance, "analyses": analyses}
+                for distance, candidate, term_id, analyses in results[:k]]
+
+    def brute_force(self, token: str, k: int = 5, max_distance: Optional[int] = None,
+                    **filters: Any) -> List[Dict[str, Any]]:
+        """Reference implementation of ``suggest``: a linear Levenshtein scan."""
+        bound = self.max_distance if max_distance is None else max_distance
+        key = form_key(token)
+        results = []
+        for term_id, candidate in enumerate(self.keys):
+            distance = _dp_distance(key, candidate)
+            if distance <= bound:
+                analyses = [a for a in self.analyses[term_id] if _matches(a, filters)]
+                if analyses:
+                    results.append((distance, candidate, term_id, analyses))
+        results.sort(key=lambda result: result[:2])
+        return [{"form": self.forms[term_id], "key": candidate, "distance": distance, "analyses": analyses}
+                for distance, candidate, term_id, analyses in results[:k]]
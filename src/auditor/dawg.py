@@ -0,0 +1,399 @@
+"""
+DAWG Lexicon Module
+
+Compiles generated Sanskrit forms into a minimal acyclic automaton (DAWG)
+that maps every form to its analysis IDs, stored as flat arrays that are
+memory-mapped and queried in place.
+
+- Forms are streamed, externally sorted in bounded chunks, and added to the
+  automaton in order (Daciuk et al.'s incremental minimization), so shared
+  prefixes *and* shared suffixes (inflectional endings) are stored once.
+- Each state stores how many words its arcs skip, which turns the automaton
+  into a minimal perfect hash: a form's rank indexes a flat array of
+  ``(lemma_id, tag_id)`` analysis IDs. Lemma and tag (features + sutras)
+  tables are tiny compared with the form set.
+
+Keys are Devanagari (``form_key``), like the inverse form index.
+"""
+
+import heapq
+import json
+import mmap
+import struct
+import tempfile
+from array import array
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from auditor.form_index import form_key, iter_analyses
+
+
+_MAGIC = b"PNDAWG01"
+_HEADER_LENGTH = struct.Struct("<Q")
+_VIRAMA = '्'
+
+Value = Tuple[int, int]
+
+
+class DawgBuilder:
+    """
+    Incremental minimal DAWG construction over lexicographically sorted words.
+
+    Example:
+        >>> builder = DawgBuilder()
+        >>> builder.add("गच्छति", [(0, 0)])
+        >>> builder.add("गच्छन्ति", [(0, 1)])
+        >>> builder.save("lexicon.dawg", lemmas=["√gam"], tags=[{...}, {...}])
+    """
+
+    def __init__(self):
+        self._final: Dict[int, bool] = {0: False}
+        self._arcs: Dict[int, List[Tuple[str, int]]] = {0: []}
+        self._next_state = 1
+        self._register: Dict[Tuple, int] = {}
+        self._unchecked: List[Tuple[int, str, int]] = []
+        self._previous: Optional[str] = None
+        # Analysis IDs streamed into flat buffers: word i owns the
+        # (lemma_id, tag_id) pairs value_ids[2*offsets[i]:2*offsets[i+1]]
+        self._value_offsets = array('I', [0])
+        self._value_ids = array('I')
+        self.words = 0
+
+    def add(self, word: str, values: Sequence[Value]):
+        """
+        Add the next word and its analysis IDs.
+
+        Raises:
+            ValueError: If ``word`` is empty or not strictly after the previous word
+        """
+        if not word:
+            raise ValueError("Cannot add an empty word")
+        if self._previous is not None and word <= self._previous:
+            raise ValueError(f"Words must be added in sorted order: {word!r} after {self._previous!r}")
+        common = 0
+        if self._previous is not None:
+            for a, b in zip(word, self._previous):
+                if a != b:
+                    break
+                common += 1
+        self._minimize(common)
+
+        state = self._unchecked[-1][2] if self._unchecked else 0
+        for char in word[common:]:
+            child = self._next_state
+            self._next_state += 1
+            self._final[child] = False
+            self._arcs[child] = []
+            self._arcs[state].append((char, child))
+            self._unchecked.append((state, char, child))
+            state = child
+        self._final[state] = True
+        self._previous = word
+        for lemma_id, tag_id in sorted(set(values)):
+            self._value_ids.append(lemma_id)
+            self._value_ids.append(tag_id)
+        self._value_offsets.append(len(self._value_ids) // 2)
+        self.words += 1
+
+    def _minimize(self, down_to: int):
+        while len(self._unchecked) > down_to:
+            parent, char, child = self._unchecked.pop()
+            signature = (self._final[child], tuple(self._arcs[child]))
+            existing = self._register.get(signature)
+            if existing is None:
+                self._register[signature] = child
+            else:
+                self._arcs[parent][-1] = (char, existing)
+                del self._final[child], self._arcs[child]
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Close the automaton and lay it out as flat arrays.
+
+        Returns:
+            Dictionary of arrays: ``first_arc``, ``final``, ``labels``,
+            ``targets``, ``skips``, ``value_offsets``, ``value_ids``
+        """
+        self._minimize(0)
+        order: Dict[int, int] = {}
+        stack = [0]
+        while stack:
+            state = stack.pop()
+            if state in order:
+                continue
+            order[state] = len(order)
+            stack.extend(target for _, target in reversed(self._arcs[state]))
+
+        # Right-language sizes, children before parents
+        counts: Dict[int, int] = {}
+        visit = [(0, False)]
+        while visit:
+            state, expanded = visit.pop()
+            if state in counts:
+                continue
+            if expanded:
+                counts[state] = int(self._final[state]) + sum(counts[t] for _, t in self._arcs[state])
+            else:
+                visit.append((state, True))
+                visit.extend((t, False) for _, t in self._arcs[state] if t not in counts)
+
+        first_arc, final = array('I', [0]), array('B')
+        labels, targets, skips = array('I'), array('I'), array('I')
+        for state in sorted(order, key=order.get):
+            skip = int(self._final[state])
+            for char, target in self._arcs[state]:
+                labels.append(ord(char))
+                targets.append(order[target])
+                skips.append(skip)
+                skip += counts[target]
+            first_arc.append(len(labels))
+            final.append(int(self._final[state]))
+
+        return {
+            "first_arc": first_arc, "final": final, "labels": labels, "targets": targets,
+            "skips": skips, "value_offsets": self._value_offsets, "value_ids": self._value_ids,
+        }
+
+    def save(self, path: Union[str, Path], lemmas: Sequence[str], tags: Sequence[Mapping[str, Any]]) -> Dict[str, int]:
+        """
+        Write the automaton, value arrays and lemma/tag tables to ``path``.
+
+        Returns:
+            Statistics: ``words``, ``states``, ``arcs`` and file ``bytes``
+        """
+        arrays = self.finish()
+        sections = [(name, arrays[name]) for name in
+                    ("first_arc", "final", "labels", "targets", "skips", "value_offsets", "value_ids")]
+        header: Dict[str, Any] = {
+            "words": self.words,
+            "states": len(arrays["final"]),
+            "lemmas": list(lemmas),
+            "tags": list(tags),
+            "sections": {},
+        }
+        layout: Dict[str, List[int]] = {}
+        for _ in range(3):
+            header["sections"] = layout
+            header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+            position = len(_MAGIC) + _HEADER_LENGTH.size + len(header_bytes)
+            new_layout = {}
+            for name, data in sections:
+                position += -position % 8
+                new_layout[name] = [position, len(data)]
+                position += data.itemsize * len(data)
+            if new_layout == layout:
+                break
+            layout = new_layout
+        header["sections"] = layout
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for name, data in sections:
+                f.write(b"\0" * (-f.tell() % 8))
+                data.tofile(f)
+        return {"words": header["words"], "states": header["states"],
+                "arcs": len(arrays["labels"]), "bytes": path.stat().st_size}
+
+
+def _sorted_runs(entries: Iterable[Tuple[str, int, int]], chunk_size: int, scratch: Path) -> List[Path]:
+    runs = []
+    iterator = iter(entries)
+    while True:
+        chunk = sorted(islice(iterator, chunk_size))
+        if not chunk:
+            return runs
+        run = scratch / f"run{len(runs)}.tsv"
+        with open(run, 'w', encoding='utf-8') as f:
+            f.writelines(f"{key}\t{lemma}\t{tag}\n" for key, lemma, tag in chunk)
+        runs.append(run)
+
+
+def _read_run(path: Path) -> Iterator[Tuple[str, int, int]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            key, lemma, tag = line.rstrip('\n').split('\t')
+            yield key, int(lemma), int(tag)
+
+
+def compile_lexicon(rows: Iterable[Mapping[str, Any]], path: Union[str, Path],
+                    chunk_size: int = 1_000_000) -> Dict[str, int]:
+    """
+    Stream Stage 1 paradigm rows into a DAWG lexicon file.
+
+    Forms are sorted externally in runs of ``chunk_size`` entries, so memory
+    is bounded by one run plus the minimized automaton; analysis IDs are
+    streamed into flat ``array('I')`` buffers (4 bytes per ID and per form).
+
+    Args:
+        rows: Stage 1 rows (generator output or ``iter_json_records``)
+        path: Output file
+        chunk_size: Entries per in-memory sorted run
+
+    Returns:
+        Statistics from ``DawgBuilder.save``
+    """
+    lemmas: Dict[str, int] = {}
+    tags: Dict[str, int] = {}
+
+    def entries() -> Iterator[Tuple[str, int, int]]:
+        for form, analysis in iter_analyses(rows):
+            key = form_key(form)
+            if not key or '\t' in key or '\n' in key:
+                continue
+            lemma_id = lemmas.setdefault(analysis["lemma"], len(lemmas))
+            tag = json.dumps({"features": analysis["features"], "sutras": analysis["sutras"]},
+                             ensure_ascii=False, sort_keys=True)
+            yield key, lemma_id, tags.setdefault(tag, len(tags))
+
+    builder = DawgBuilder()
+    with tempfile.TemporaryDirectory() as scratch:
+        runs = _sorted_runs(entries(), chunk_size, Path(scratch))
+        merged = heapq.merge(*(_read_run(run) for run in runs))
+        for key, group in groupby(merged, key=lambda entry: entry[0]):
+            builder.add(key, [(lemma, tag) for _, lemma, tag in group])
+    return builder.save(path, list(lemmas), [json.loads(tag) for tag in tags])
+
+
+class DawgLexicon:
+    """
+    Memory-mapped DAWG lexicon with membership, prefix and analysis queries.
+
+    Example:
+        >>> lexicon = DawgLexicon("datasets/lexicon.dawg")
+        >>> "gacchati" in lexicon
+        True
+        >>> lexicon.analyses("gacchati")[0]["lemma"]
+        '√gam'
+        >>> list(lexicon.complete("gacch"))
+        ['गच्छति', 'गच्छन्ति', 'गच्छसि', ...]
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a lexicon written by ``compile_lexicon``.
+
+        Raises:
+            ValueError: If the file is not a DAWG lexicon
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(_MAGIC)] != _MAGIC:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a DAWG lexicon")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._map, len(_MAGIC))
+        start = len(_MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(self._map[start:start + header_length])
+        self.lemmas: List[str] = header["lemmas"]
+        self.tags: List[Dict[str, Any]] = header["tags"]
+        self._words = header["words"]
+
+        view = memoryview(self._map)
+        formats = {"final": 'B'}
+
+        def section(name: str) -> memoryview:
+            offset, count = header["sections"][name]
+            fmt = formats.get(name, 'I')
+            return view[offset:offset + count * struct.calcsize(fmt)].cast(fmt)
+
+        self._first_arc = section("first_arc")
+        self._final = section("final")
+        self._labels = section("labels")
+        self._targets = section("targets")
+        self._skips = section("skips")
+        self._value_offsets = section("value_offsets")
+        self._value_ids = section("value_ids")
+
+    def __len__(self) -> int:
+        return self._words
+
+    def _arc(self, state: int, char: str) -> int:
+        """Index of the arc leaving ``state`` on ``char``, or -1 (binary search)."""
+        low, high = self._first_arc[state], self._first_arc[state + 1]
+        code = ord(char)
+        labels = self._labels
+        while low < high:
+            middle = (low + high) // 2
+            if labels[middle] < code:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self._first_arc[state + 1] and labels[low] == code else -1
+
+    def _walk(self, key: str) -> Tuple[int, int]:
+        """Follow ``key``; returns ``(state, rank offset)`` or ``(-1, 0)``."""
+        state, rank = 0, 0
+        for char in key:
+            arc = self._arc(state, char)
+            if arc < 0:
+                return -1, 0
+            rank += self._skips[arc]
+            state = self._targets[arc]
+        return state, rank
+
+    def index(self, form: str) -> int:
+        """Rank of ``form`` among all words (its perfect hash), or -1."""
+        state, rank = self._walk(form_key(form))
+        return rank if state >= 0 and self._final[state] else -1
+
+    def __contains__(self, form: str) -> bool:
+        return self.index(form) >= 0
+
+    def analysis_ids(self, form: str) -> List[Value]:
+        """``(lemma_id, tag_id)`` pairs for ``form``."""
+        rank = self.index(form)
+        if rank < 0:
+            return []
+        ids = self._value_ids
+        return [(ids[2 * i], ids[2 * i + 1])
+                for i in range(self._value_offsets[rank], self._value_offsets[rank + 1])]
+
+    def analyses(self, form: str) -> List[Dict[str, Any]]:
+        """Analyses of ``form`` as ``{"lemma", "features", "sutras"}`` dicts."""
+        return [{"lemma": self.lemmas[lemma_id], **self.tags[tag_id]}
+                for lemma_id, tag_id in self.analysis_ids(form)]
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield stored forms starting with ``prefix``, in sorted order.
+
+        A trailing virama from transliterating a romanized prefix that ends
+        in a consonant (``"gacch"`` -> ``"गच्छ्"``) is dropped, so the prefix
+        also matches the following vowel sign.
+        """
+        key = form_key(prefix) if prefix else ""
+        if key.endswith(_VIRAMA):
+            key = key[:-1]
+        state, _ = self._walk(key)
+        if state < 0:
+            return
+        emitted = 0
+        stack = [(state, key)]
+        while stack:
+            state, word = stack.pop()
+            if self._final[state]:
+                yield word
+                emitted += 1
+                if limit is not None and emitted >= limit:
+                    return
+            for arc in range(self._first_arc[state + 1] - 1, self._first_arc[state] - 1, -1):
+                stack.append((self._targets[arc], word + chr(self._labels[arc])))
+
+    def close(self):
+        """Release the memory map."""
+        for name in ("_first_arc", "_final", "_labels", "_targets", "_skips",
+                     "_value_offsets", "_value_ids"):
+            getattr(self, name).release()
+        self._map.close()
+
+    def __enter__(self) -> "DawgLexicon":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
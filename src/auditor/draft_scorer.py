@@ -0,0 +1,130 @@
+"""
+Draft Scorer Module
+
+Scores several candidate Sanskrit drafts at once for Tree-of-Thoughts
+refinement, by rule compliance:
+
+- ``unknown_form``: a token with no analysis in the lexicon
+- ``sandhi``: two adjacent words that ``SandhiGenerator`` would join
+  (e.g. ``Rama iti`` should be ``Rameti``)
+- ``agreement``: a finite verb whose number matches no nominative in the draft
+
+Drafts of one refinement step share most of their words, so tokens and
+word junctions are deduplicated across the whole batch: each unique token
+is analyzed once and each unique junction is sandhi-checked once, and the
+per-draft checks only combine those cached results.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from generator.sandhi_generator import SandhiGenerator
+
+from auditor.form_index import Analysis, tokenize
+
+
+RULES = ("unknown_form", "sandhi", "agreement")
+
+
+def _numbers(analyses: Sequence[Analysis], pos: str, case: Optional[str] = None) -> Set[str]:
+    found = set()
+    for analysis in analyses:
+        features = analysis["features"]
+        if features.get("pos") != pos:
+            continue
+        if case is not None and str(features.get("case", "")).casefold() != case:
+            continue
+        if features.get("number"):
+            found.add(str(features["number"]).casefold())
+    return found
+
+
+class DraftScorer:
+    """
+    Batched rule-compliance scorer for candidate drafts.
+
+    Example:
+        >>> with FormIndex("datasets/form_index.bin") as index:
+        ...     result = DraftScorer(index.lookup).score(["Baalah gacchati", "Baalah gacchanti"])
+        >>> result["best"]
+        0
+    """
+
+    def __init__(self, analyze: Callable[[str], List[Analysis]],
+                 sandhi: Optional[SandhiGenerator] = None):
+        """
+        Configure the scorer.
+
+        Args:
+            analyze: Token to analyses (``FormIndex.lookup``,
+                     ``DawgLexicon.analyses``, ...)
+            sandhi: Junction rules (defaults to ``SandhiGenerator()``)
+        """
+        self.analyze = analyze
+        self.sandhi = sandhi or SandhiGenerator()
+
+    def _junction(self, pair: Tuple[str, str]) -> Optional[str]:
+        """Expected joined form if a sandhi rule applies across ``pair``."""
+        word1, word2 = pair
+        joined = self.sandhi.apply_sandhi(word1, word2)
+        return joined if joined != word1 + word2 else None
+
+    def _check(self, tokens: List[str], analyses: Dict[str, List[Analysis]],
+               junctions: Dict[Tuple[str, str], Optional[str]]) -> Dict[str, Any]:
+        violations: Dict[str, List[str]] = {rule: [] for rule in RULES}
+        for token in tokens:
+            if not analyses[token]:
+                violations["unknown_form"].append(token)
+        for pair in zip(tokens, tokens[1:]):
+            joined = junctions[pair]
+            if joined is not None:
+                violations["sandhi"].append(f"{pair[0]} + {pair[1]} -> {joined}")
+
+        nominative = set()
+        for token in tokens:
+            nominative |= _numbers(analyses[token], "noun", "nominative")
+        verbs = [(token, _numbers(analyses[token], "verb")) for token in tokens]
+        verbs = [(token, numbers) for token, numbers in verbs if numbers]
+        if nominative:
+            for token, numbers in verbs:
+                if not numbers & nominative:
+                    listed = "/".join(sorted(numbers))
+                    violations["agreement"].append(f"{token} ({listed}) has no {listed} karta")
+
+        checks = len(tokens) + max(len(tokens) - 1, 0) + (len(verbs) if nominative else 0)
+        failed = sum(len(found) for found in violations.values())
+        return {
+            "score": 1.0 - failed / checks if checks else 0.0,
+            "checks": checks,
+            "violations": {rule: found for rule, found in violations.items() if found},
+        }
+
+    def score(self, drafts: Sequence[str]) -> Dict[str, Any]:
+        """
+        Score every draft.
+
+        Args:
+            drafts: Candidate Sanskrit sentences
+
+        Returns:
+            ``scores`` (per draft: ``draft``, ``score`` in [0, 1], ``checks``
+            and ``violations`` by rule), the ``best`` draft index (first on
+            ties; None if no drafts), and total vs unique ``tokens`` and
+            ``junctions`` work counts
+        """
+        tokenized = [tokenize(draft) for draft in drafts]
+        unique_tokens = {token for tokens in tokenized for token in tokens}
+        unique_junctions = {pair for tokens in tokenized for pair in zip(tokens, tokens[1:])}
+        analyses = {token: self.analyze(token) for token in unique_tokens}
+        junctions = {pair: self._junction(pair) for pair in unique_junctions}
+
+        scores = []
+        for draft, tokens in zip(drafts, tokenized):
+            scores.append({"draft": draft, **self._check(tokens, analyses, junctions)})
+        best = max(range(len(scores)), key=lambda i: (scores[i]["score"], -i)) if scores else None
+        return {
+            "scores": scores,
+            "best": best,
+            "tokens": {"total": sum(len(tokens) for tokens in tokenized), "unique": len(unique_tokens)},
+            "junctions": {"total": sum(max(len(tokens) - 1, 0) for tokens in tokenized),
+                          "unique": len(unique_junctions)},
+        }
@@ -0,0 +1,181 @@
+"""
+Inverse Form Index Module
+
+Maps a surface form back to every analysis that produces it, for the
+Auditor (Path B): ``gacchati`` -> ``(√gam, Present 3rd Singular, sutras)``.
+
+The index is built once from generated Stage 1 paradigm rows and written as
+an open-addressing hash table (``<QII`` slots: key hash, payload offset,
+payload length) followed by JSON payloads. ``FormIndex`` memory-maps the
+file, so loading is instant and analyzing a sentence costs one hash probe
+per token.
+
+Keys are Devanagari: romanized tokens (loose ASCII or IAST) are converted
+with ``to_devanagari`` first, so ``gacchati``, ``Gacchati`` and ``गच्छति``
+all hit the same entry.
+"""
+
+import hashlib
+import json
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+
+from generator.transliteration import to_devanagari
+
+
+_MAGIC = b"PNFIDX01"
+_HEADER = struct.Struct("<8sQQ")
+_SLOT = struct.Struct("<QII")
+_TOKEN = re.compile(r"[^\s|।॥.,;:!?\"'()]+")
+
+Analysis = Dict[str, Any]
+
+
+def form_key(form: str) -> str:
+    """Canonical (Devanagari) key for a surface form in any supported script."""
+    return to_devanagari(form.strip())
+
+
+def tokenize(sentence: str) -> List[str]:
+    """Split a sentence into word tokens, dropping punctuation and dandas."""
+    return _TOKEN.findall(sentence)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def iter_analyses(rows: Iterable[Mapping[str, Any]]) -> Iterator[Tuple[str, Analysis]]:
+    """
+    Yield ``(surface form, analysis)`` pairs from Stage 1 paradigm rows.
+
+    Verb rows give ``{"lemma": root, "features": {pos, tense, person,
+    number}, "sutras": rules_applied}``; noun rows give case, number and
+    gender features for their pratipadika. Other rows are skipped.
+    """
+    for row in rows:
+        form = row.get("output")
+        if not form:
+            continue
+        if row.get("root") and row.get("tense"):
+            lemma = row["root"]
+            features = {"pos": "verb", "tense": row["tense"], "person": row.get("person"),
+                        "number": row.get("number")}
+        elif row.get("pratipadika"):
+            lemma = row["pratipadika"]
+            features = {"pos": "noun", "case": row.get("case"), "number": row.get("number"),
+                        "gender": row.get("gender")}
+        else:
+            continue
+        yield form, {"lemma": lemma, "features": features, "sutras": list(row.get("rules_applied") or ())}
+
+
+def build_form_index(rows: Iterable[Mapping[str, Any]], index_path: Union[str, Path]) -> int:
+    """
+    Invert paradigm rows into an on-disk form index.
+
+    Args:
+        rows: Stage 1 rows (e.g. ``iter_json_records("datasets/stage1_dhatupatha.jsonl")``)
+        index_path: Output file
+
+    Returns:
+        Number of distinct surface forms indexed
+    """
+    forms: Dict[str, List[Analysis]] = {}
+    for form, analysis in iter_analyses(rows):
+        analyses = forms.setdefault(form_key(form), [])
+        if analysis not in analyses:
+            analyses.append(analysis)
+
+    slots = 8
+    while slots < 2 * len(forms):
+        slots *= 2
+    table = [(0, 0, 0)] * slots
+    payload = bytearray()
+    payload_start = _HEADER.size + slots * _SLOT.size
+    for key, analyses in forms.items():
+        blob = json.dumps([key, analyses], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        key_hash = _hash(key)
+        slot = key_hash & (slots - 1)
+        while table[slot][2]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = (key_hash, payload_start + len(payload), len(blob))
+        payload += blob
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(index_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, slots, len(forms)))
+        for entry in table:
+            f.write(_SLOT.pack(*entry))
+        f.write(payload)
+    return len(forms)
+
+
+class FormIndex:
+    """
+    Memory-mapped surface form -> analyses lookup.
+
+    Example:
+        >>> index = FormIndex("datasets/form_index.bin")
+        >>> index.lookup("gacchati")[0]["lemma"]
+        '√gam'
+        >>> [token for token, analyses in index.analyze("Ramena gacchati") if not analyses]
+        ['Ramena']
+    """
+
+    def __init__(self, index_path: Union[str, Path]):
+        """
+        Open an index written by ``build_form_index``.
+
+        Raises:
+            ValueError: If the file is not a form index
+        """
+        self.index_path = Path(index_path)
+        with open(self.index_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._slots, self._forms = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError(f"{self.index_path} is not a form index")
+        self._mask = self._slots - 1
+
+    def __len__(self) -> int:
+        return self._forms
+
+    def _find(self, key: str) -> List[Analysis]:
+        key_hash = _hash(key)
+        slot = key_hash & self._mask
+        while True:
+            stored_hash, offset, length = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+            if not length:
+                return []
+            if stored_hash == key_hash:
+                stored_key, analyses = json.loads(self._map[offset:offset + length])
+                if stored_key == key:
+                    return analyses
+            slot = (slot + 1) & self._mask
+
+    def lookup(self, form: str) -> List[Analysis]:
+        """All analyses of ``form`` (empty if unknown)."""
+        return self._find(form_key(form))
+
+    def __contains__(self, form: str) -> bool:
+        return bool(self.lookup(form))
+
+    def analyze(self, sentence: str) -> List[Tuple[str, List[Analysis]]]:
+        """Analyze every token of a sentence with one lookup each."""
+        return [(token, self.lookup(token)) for token in tokenize(sentence)]
+
+    def close(self):
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "FormIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,287 @@
+"""
+Karaka Validator Module
+
+Checks the ``karaka`` dicts of generated or model-produced Stage 2 rows
+before training:
+
+- every role carries the case and vibhakti Panini assigns it
+  (``ROLE_CASES``: karta -> nominative/prathama, karma -> accusative/dvitiya, ...)
+- the karta agrees with the kriya in number and person
+- each role's Sanskrit word actually appears in the row's ``output``
+- one Sanskrit form is not glossed as different English words in the same
+  role, number and gender across the file (e.g. ``Chhaatrah`` for both
+  "student" and "teacher")
+
+The constraints are compiled once into a rule table. Files are checked in
+batches of raw JSONL lines, optionally in a process pool, and violations
+are reported with the row's ``id`` (or its 1-based line number). Form
+collisions are only warnings (``"severity": "warning"``): without gender in
+the karaka dict, true homographs such as ``Baalaah`` ("boys" and "girls")
+cannot be told apart from glossing mistakes.
+"""
+
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from generator.karaka_generator import ROLE_CASES
+
+
+Violation = Dict[str, Any]
+
+# Rules reported as warnings rather than errors
+WARNING_RULES = frozenset({"form_collision"})
+
+# (role, sanskrit form, number, gender) -> {english word: first row id}
+_Glosses = Dict[Tuple[str, str, str, str], Dict[str, Any]]
+
+
+def _norm(value: Any) -> str:
+    return str(value).strip().casefold()
+
+
+class KarakaValidator:
+    """
+    Rule-table validator for karaka structures.
+
+    Example:
+        >>> validator = KarakaValidator()
+        >>> karaka = {"karta": {"word": "boys", "sanskrit": "Baalaah", "case": "nominative",
+        ...                     "vibhakti": "prathama"},
+        ...           "kriya": {"root": "√path", "person": 3, "number": "plural"}}
+        >>> [v["rule"] for v in validator.check(karaka)]
+        ['number_agreement']
+    """
+
+    def __init__(self, role_cases: Mapping[str, Tuple[str, str]] = ROLE_CASES,
+                 default_number: str = "singular", default_person: int = 3):
+        """
+        Compile the rule table.
+
+        Args:
+            role_cases: Role to expected ``(case, vibhakti)``
+            default_number: Karta number when the karta dict omits it
+            default_person: Karta person when the karta dict omits it
+        """
+        self.rules: Dict[str, Tuple[str, str]] = {
+            role: (_norm(case), _norm(vibhakti)) for role, (case, vibhakti) in role_cases.items()
+        }
+        self.default_number = _norm(default_number)
+        self.default_person = default_person
+
+    def check(self, karaka: Any, output: Optional[str] = None) -> List[Violation]:
+        """
+        Violations of one karaka dict.
+
+        Args:
+            karaka: The row's ``karaka`` value
+            output: The row's Sanskrit output, to check that role words appear in it
+
+        Returns:
+            Dicts with ``rule``, ``role`` and ``message`` (no row ID)
+        """
+        if not isinstance(karaka, Mapping):
+            return [{"rule": "structure", "role": None, "message": "karaka is missing or not an object"}]
+        violations = []
+        kriya = karaka.get("kriya")
+        if not isinstance(kriya, Mapping):
+            violations.append({"rule": "structure", "role": "kriya", "message": "no kriya"})
+        if "karta" not in karaka:
+            violations.append({"rule": "structure", "role": "karta", "message": "no karta"})
+        words = set(_norm(output).split()) if output is not None else None
+
+        for role, slot in karaka.items():
+            if role == "kriya":
+                continue
+            expected = self.rules.get(role)
+            if expected is None:
+                violations.append({"rule": "role", "role": role, "message": f"unknown karaka role {role!r}"})
+                continue
+            if not isinstance(slot, Mapping):
+                violations.append({"rule": "structure", "role": role, "message": f"{role} is not an object"})
+                continue
+            case, vibhakti = expected
+            if _norm(slot.get("case")) != case:
+                violations.append({"rule": "case", "role": role,
+                                   "message": f"{role} must be {case}, got {slot.get('case')!r}"})
+            if _norm(slot.get("vibhakti")) != vibhakti:
+                violations.append({"rule": "vibhakti", "role": role,
+                                   "message": f"{role} must be {vibhakti}, got {slot.get('vibhakti')!r}"})
+            sanskrit = slot.get("sanskrit")
+            if words is not None and sanskrit and not set(_norm(sanskrit).split()) <= words:
+                violations.append({"rule": "surface", "role": role,
+                                   "message": f"{role} form {sanskrit!r} does not appear in the output"})
+
+        karta = karaka.get("karta")
+        if isinstance(kriya, Mapping) and isinstance(karta, Mapping):
+            karta_number = _norm(karta.get("number", self.default_number))
+            kriya_number = _norm(kriya.get("number", self.default_number))
+            if karta_number != kriya_number:
+                violations.append({"rule": "number_agreement", "role": "kriya",
+                                   "message": f"karta is {karta_number} but kriya is {kriya_number}"})
+            karta_person = karta.get("person", self.default_person)
+            kriya_person = kriya.get("person", self.default_person)
+            if str(karta_person) != str(kriya_person):
+                violations.append({"rule": "person_agreement", "role": "kriya",
+                                   "message": f"karta is person {karta_person} but kriya is person {kriya_person}"})
+        return violations
+
+    def check_batch(self, lines: List[str], first_line: int) -> Tuple[List[Violation], _Glosses, int]:
+        """
+        Check a batch of raw JSONL lines.
+
+        Returns:
+            ``(violations, glosses, rows)`` where ``glosses`` records the first
+            row using each English word for a ``(role, sanskrit, number, gender)``
+            key
+        """
+        violations: List[Violation] = []
+        glosses: _Glosses = {}
+        rows = 0
+        for line_number, line in enumerate(lines, first_line):
+            if not line.strip():
+                continue
+            rows += 1
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                violations.append({"row": line_number, "rule": "json", "role": None, "message": str(e)})
+                continue
+            row_id = row.get("id", line_number) if isinstance(row, dict) else line_number
+            karaka = row.get("karaka") if isinstance(row, dict) else None
+            output = row.get("output") if isinstance(row, dict) else None
+            for violation in self.check(karaka, output):
+                violations.append({"row": row_id, **violation})
+            if isinstance(karaka, Mapping):
+                for role, slot in karaka.items():
+                    if role != "kriya" and isinstance(slot, Mapping) and slot.get("sanskrit") and slot.get("word"):
+                        number = _norm(slot.get("number", self.default_number))
+                        key = (role, _norm(slot["sanskrit"]), number, _norm(slot.get("gender", "")))
+                        words = glosses.setdefault(key, {})
+                        words.setdefault(_norm(slot["word"]), row_id)
+        return violations, glosses, rows
+
+
+def _check_batch(args: Tuple[KarakaValidator, List[str], int]) -> Tuple[List[Violation], _Glosses, int]:
+    """Worker entry point."""
+    validator, lines, first_line = args
+    return validator.check_batch(lines, first_line)
+
+
+def _batches(lines: Iterable[str], batch_size: int) -> Iterator[Tuple[List[str], int]]:
+    iterator = iter(lines)
+    first_line = 1
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch, first_line
+        first_line += len(batch)
+
+
+def iter_violations(jsonl_path: Union[str, Path], validator: Optional[KarakaValidator] = None,
+                    workers: Optional[int] = None, batch_size: int = 20000,
+                    stats: Optional[Dict[str, int]] = None) -> Iterator[Violation]:
+    """
+    Stream violations of a JSONL file in row order.
+
+    Per-row violations come first; ``form_collision`` warnings, which need
+    the whole file, follow at the end and name the first row of each
+    conflicting gloss.
+
+    Args:
+        jsonl_path: Dataset to check
+        validator: Rule table (defaults to ``KarakaValidator()``)
+        workers: Worker processes; None or 1 checks in-process
+        batch_size: Lines per batch
+        stats: If given, receives the ``rows`` count
+
+    Returns:
+        Iterator over violation dicts (``row``, ``rule``, ``role``, ``message``)
+    """
+    validator = validator or KarakaValidator()
+    glosses: _Glosses = {}
+    rows = 0
+
+    def merge(result: Tuple[List[Violation], _Glosses, int]) -> List[Violation]:
+        nonlocal rows
+        violations, batch_glosses, batch_rows = result
+        rows += batch_rows
+        for key, words in batch_glosses.items():
+            merged = glosses.setdefault(key, {})
+            for word, row_id in words.items():
+                merged.setdefault(word, row_id)
+        return violations
+
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        batches = ((validator, lines, first) for lines, first in _batches(f, batch_size))
+        if not workers or workers <= 1:
+            for batch in batches:
+                yield from merge(_check_batch(batch))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for batch in batches:
+                    pending.append(executor.submit(_check_batch, batch))
+                    if len(pending) >= 2 * workers:
+                        yield from merge(pending.popleft().result())
+                while pending:
+                    yield from merge(pending.popleft().result())
+
+    for (role, sanskrit, number, gender), words in glosses.items():
+        if len(words) > 1:
+            listed = ", ".join(f"{word!r} (row {row_id})" for word, row_id in words.items())
+            features = " ".join(filter(None, (number, gender)))
+            for row_id in list(words.values())[1:]:
+                yield {"row": row_id, "rule": "form_collision", "role": role, "severity": "warning",
+                       "message": f"{role} form {sanskrit!r} ({features}) is glossed as {listed}"}
+    if stats is not None:
+        stats["rows"] = rows
+
+
+def validate_jsonl(jsonl_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None,
+                   validator: Optional[KarakaValidator] = None, workers: Optional[int] = None,
+                   batch_size: int = 20000) -> Dict[str, Any]:
+    """
+    Validate a JSONL file and summarize the violations.
+
+    Args:
+        jsonl_path: Dataset to check
+        output_path: Optional JSONL file receiving every violation
+        validator: Rule table (defaults to ``KarakaValidator()``)
+        workers: Worker processes for parallel batches
+        batch_size: Lines per batch
+
+    Returns:
+        Report with ``rows``, ``violations`` and ``rows_with_violations``
+        (errors only), ``warnings``, and counts of both ``by_rule``
+    """
+    stats: Dict[str, int] = {}
+    by_rule: Dict[str, int] = {}
+    flagged = set()
+    total = 0
+    warnings = 0
+    out = open(output_path, 'w', encoding='utf-8') if output_path else None
+    try:
+        for violation in iter_violations(jsonl_path, validator, workers, batch_size, stats):
+            by_rule[violation["rule"]] = by_rule.get(violation["rule"], 0) + 1
+            if violation["rule"] in WARNING_RULES:
+                warnings += 1
+            else:
+                total += 1
+                flagged.add(violation["row"])
+            if out:
+                out.write(json.dumps(violation, ensure_ascii=False) + '\n')
+    finally:
+        if out:
+            out.close()
+    return {
+        "rows": stats.get("rows", 0),
+        "violations": total,
+        "rows_with_violations": len(flagged),
+        "warnings": warnings,
+        "by_rule": by_rule,
+    }
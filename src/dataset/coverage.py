@@ -0,0 +1,242 @@
+"""
+Coverage Selection Module
+
+Chooses a small subset of generated rows that still covers every grammatical
+feature the curriculum cares about: sutras (``rules_applied``), verb and
+noun paradigm cells, sandhi junction classes and karaka role/case pairs.
+
+Each row's features become a bitset (a Python ``int``); a lazy greedy
+weighted set cover then picks rows until every feature is covered by ``k``
+examples (or by as many as exist), or until the requested fraction of that
+demand is met.
+"""
+
+import json
+from heapq import heapify, heappop, heappush
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from dataset.json_stream import iter_json_records
+
+
+_VOWEL_CLASSES = {
+    "a": "a", "ā": "a", "i": "i", "ī": "i", "u": "u", "ū": "u",
+    "ṛ": "r", "ṝ": "r", "e": "e", "o": "o",
+}
+
+
+def _edge_class(char: str) -> str:
+    return _VOWEL_CLASSES.get(char.lower(), "C")
+
+
+def _sandhi_words(row: Mapping[str, Any]) -> Optional[Sequence[str]]:
+    if "word1" in row and "word2" in row:
+        return row["word1"], row["word2"]
+    if "sandhi" in str(row.get("instruction", "")).lower() and " + " in str(row.get("input", "")):
+        return row["input"].split(" + ", 1)
+    return None
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def row_features(row: Mapping[str, Any]) -> List[str]:
+    """
+    Coverage features of a generated row.
+
+    Returns:
+        Feature names prefixed by kind: ``sutra:``, ``verb:`` (root, tense,
+        person, number), ``noun:`` (pratipadika, case, number, gender),
+        ``sandhi:`` (final/initial vowel class, e.g. ``a+a`` or ``C+u``) and
+        ``karaka:`` (role and case). A ``rules_applied`` string (as in
+        Sandhi dict rows) is one rule, not a sequence of characters.
+    """
+    rules = row.get("rules_applied") or ()
+    if isinstance(rules, str):
+        rules = (rules,)
+    features = [f"sutra:{rule}" for rule in rules]
+    if row.get("root") and row.get("tense"):
+        features.append(f"verb:{row['root']}|{row['tense']}|{row.get('person')}|{row.get('number')}")
+    if row.get("pratipadika"):
+        features.append(f"noun:{row['pratipadika']}|{row.get('case')}|{row.get('number')}|{row.get('gender')}")
+    words = _sandhi_words(row)
+    if words and words[0] and words[1]:
+        features.append(f"sandhi:{_edge_class(words[0][-1])}+{_edge_class(words[1][0])}")
+    karaka = row.get("karaka")
+    if isinstance(karaka, Mapping):
+        for role, slot in karaka.items():
+            if role != "kriya" and isinstance(slot, Mapping):
+                features.append(f"karaka:{role}|{slot.get('case')}")
+    return features
+
+
+class CoverageSelector:
+    """
+    Greedy weighted set cover over row feature bitsets.
+
+    Example:
+        >>> selector = CoverageSelector(k=2)
+        >>> selector.fit(iter_json_records("datasets/stage1_dhatupatha.jsonl"))
+        >>> chosen = selector.select()
+        >>> selector.report(chosen)["coverage"]
+        1.0
+    """
+
+    def __init__(self, k: int = 1, target: float = 1.0, weights: Optional[Mapping[str, float]] = None,
+                 feature_func: Callable[[Mapping[str, Any]], Iterable[str]] = row_features):
+        """
+        Configure the selector.
+
+        Args:
+            k: Examples wanted per feature
+            target: Fraction of the total (weighted) demand to meet
+            weights: Weight per feature kind (e.g. ``{"sutra": 2.0}``) or
+                     per full feature name; unlisted features weigh 1
+            feature_func: Row to feature names
+
+        Raises:
+            ValueError: If ``k`` < 1 or ``target`` is outside (0, 1]
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if not 0 < target <= 1:
+            raise ValueError("target must be in (0, 1]")
+        self.k = k
+        self.target = target
+        self.weights = dict(weights or {})
+        self.feature_func = feature_func
+        self.features: List[str] = []
+        self._feature_ids: Dict[str, int] = {}
+        self._feature_weights: List[float] = []
+        self._available: List[int] = []
+        self.bitsets: List[int] = []
+
+    def _feature_id(self, feature: str) -> int:
+        feature_id = self._feature_ids.get(feature)
+        if feature_id is None:
+            feature_id = len(self.features)
+            self._feature_ids[feature] = feature_id
+            self.features.append(feature)
+            kind = feature.split(":", 1)[0]
+            self._feature_weights.append(float(self.weights.get(feature, self.weights.get(kind, 1.0))))
+            self._available.append(0)
+        return feature_id
+
+    def add(self, row: Mapping[str, Any]) -> int:
+        """Record a row's bitset; returns its index."""
+        bits = 0
+        for feature in self.feature_func(row):
+            bits |= 1 << self._feature_id(feature)
+        for feature_id in _bits(bits):
+            self._available[feature_id] += 1
+        self.bitsets.append(bits)
+        return len(self.bitsets) - 1
+
+    def fit(self, rows: Iterable[Mapping[str, Any]]) -> "CoverageSelector":
+        """Record every row."""
+        for row in rows:
+            self.add(row)
+        return self
+
+    def _demand(self) -> List[int]:
+        return [min(self.k, available) for available in self._available]
+
+    def _gain(self, bits: int, open_bits: int) -> float:
+        useful = bits & open_bits
+        if not useful:
+            return 0.0
+        if not self.weights:
+            return float(bin(useful).count("1"))
+        return sum(self._feature_weights[f] for f in _bits(useful))
+
+    def select(self) -> List[int]:
+        """
+        Choose rows greedily by weighted newly-covered demand.
+
+        Gains only shrink as features fill up, so stale heap entries are
+        re-scored lazily instead of rescanning every row per pick.
+
+        Returns:
+            Selected row indices in ascending order
+        """
+        need = self._demand()
+        total = sum(n * w for n, w in zip(need, self._feature_weights))
+        goal = self.target * total
+        open_bits = sum(1 << f for f, n in enumerate(need) if n > 0)
+
+        heap = [(-self._gain(bits, open_bits), index) for index, bits in enumerate(self.bitsets)]
+        heap = [entry for entry in heap if entry[0] < 0]
+        heapify(heap)
+        selected: List[int] = []
+        met = 0.0
+        while heap and met < goal - 1e-9:
+            _, index = heappop(heap)
+            gain = self._gain(self.bitsets[index], open_bits)
+            if gain <= 0:
+                continue
+            if heap and gain < -heap[0][0]:
+                heappush(heap, (-gain, index))
+                continue
+            selected.append(index)
+            met += gain
+            for feature_id in _bits(self.bitsets[index] & open_bits):
+                need[feature_id] -= 1
+                if need[feature_id] == 0:
+                    open_bits &= ~(1 << feature_id)
+        return sorted(selected)
+
+    def report(self, selected: Sequence[int]) -> Dict[str, Any]:
+        """
+        Coverage achieved by ``selected``.
+
+        Returns:
+            Dictionary with row counts, weighted ``coverage`` of the demand,
+            and per-kind ``features`` and ``satisfied`` counts
+        """
+        counts = [0] * len(self.features)
+        for index in selected:
+            for feature_id in _bits(self.bitsets[index]):
+                counts[feature_id] += 1
+        demand = self._demand()
+        total = sum(n * w for n, w in zip(demand, self._feature_weights))
+        met = sum(min(c, n) * w for c, n, w in zip(counts, demand, self._feature_weights))
+        kinds: Dict[str, Dict[str, int]] = {}
+        for feature, count, need in zip(self.features, counts, demand):
+            entry = kinds.setdefault(feature.split(":", 1)[0], {"features": 0, "satisfied": 0})
+            entry["features"] += 1
+            entry["satisfied"] += count >= need
+        return {
+            "rows": len(self.bitsets),
+            "selected": len(selected),
+            "features": len(self.features),
+            "coverage": met / total if total else 1.0,
+            "kinds": kinds,
+        }
+
+
+def select_jsonl(jsonl_path: Union[str, Path], output_path: Union[str, Path],
+                 selector: Optional[CoverageSelector] = None) -> Dict[str, Any]:
+    """
+    Write the coverage-selected subset of a dataset, preserving row order.
+
+    Args:
+        jsonl_path: Source JSON/JSONL dataset
+        output_path: Destination JSONL file
+        selector: Configured selector (defaults to ``CoverageSelector()``)
+
+    Returns:
+        Coverage report for the selection
+    """
+    selector = selector or CoverageSelector()
+    selector.fit(iter_json_records(jsonl_path))
+    selected = selector.select()
+    keep = set(selected)
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for index, row in enumerate(iter_json_records(jsonl_path)):
+            if index in keep:
+                out.write(json.dumps(row, ensure_ascii=False) + '\n')
+    return selector.report(selected)
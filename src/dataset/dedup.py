@@ -0,0 +1,333 @@
+"""
+Deduplication Module
+
+Removes exact and near-duplicate rows across JSONL shards produced by the
+generators (cycled Sandhi word pairs, repeated Karaka templates, ...).
+
+- Exact duplicates: a 64-bit hash of the normalized instruction, input and
+  output (NFC, case-folded, whitespace collapsed)
+- Near duplicates: MinHash signatures of character shingles of the output,
+  bucketed with LSH bands; within a bucket (ordered by full signature) every
+  member is compared with the next ``window`` members, which covers all
+  pairs of buckets up to ``window + 1`` rows, and pairs whose estimated
+  Jaccard similarity reaches ``threshold`` are joined into clusters
+
+The first occurrence (in shard order) of every duplicate cluster is kept.
+Rows are streamed twice; per-row hashes and signatures go to memory-mapped
+scratch files, so RAM use stays small and fixed per row rather than
+holding any row text.
+"""
+
+import hashlib
+import json
+import re
+import tempfile
+import unicodedata
+import zlib
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from dataset.json_stream import iter_json_records
+from dataset.splits import group_key
+
+
+EXACT_FIELDS = ("instruction", "input", "output")
+
+_WHITESPACE = re.compile(r'\s+')
+_PRIME = 4294967291  # largest prime below 2**32
+
+
+def normalize_text(value: Any) -> str:
+    """NFC-normalize, case-fold and collapse whitespace."""
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text).casefold()).strip()
+
+
+def content_hash(row: Mapping[str, Any], fields: Sequence[str] = EXACT_FIELDS) -> int:
+    """Stable 64-bit hash of a row's normalized content fields."""
+    content = "\x1f".join(normalize_text(row.get(field, "")) for field in fields)
+    return int.from_bytes(hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _stage_of(row: Mapping[str, Any]) -> str:
+    stage = row.get("stage")
+    if stage:
+        return str(stage)
+    return "sandhi" if group_key(row).startswith("sandhi:") else "unknown"
+
+
+class MinHasher:
+    """
+    MinHash over character shingles with universal hashing.
+
+    Example:
+        >>> hasher = MinHasher(num_perm=64)
+        >>> a = hasher.signature("baalah pustakam pathati")
+        >>> b = hasher.signature("baalaah pustakam pathati")
+        >>> MinHasher.similarity(a, b) > 0.5
+        True
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 4, seed: int = 1):
+        """
+        Draw the hash permutations.
+
+        Args:
+            num_perm: Signature length
+            shingle_size: Characters per shingle
+            seed: Seed for the permutation coefficients
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # (a * x + b) mod p with 31-bit a and x < p stays below 2**64
+        self._a = rng.integers(1, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Distinct CRC32 hashes of the text's character shingles."""
+        size = self.shingle_size
+        grams = {text[i:i + size] for i in range(max(len(text) - size + 1, 1))}
+        return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, text: str) -> np.ndarray:
+        """``uint32`` MinHash signature of ``text``."""
+        shingles = self.shingles(text) % np.uint64(_PRIME)
+        hashed = (self._a * shingles[None, :] + self._b) % np.uint64(_PRIME)
+        return hashed.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(a == b))
+
+
+def _iter_shards(paths: Sequence[Path]) -> Iterator[Dict]:
+    for path in paths:
+        yield from iter_json_records(path)
+
+
+_PAIR_CHUNK = 1 << 16
+
+
+def _void_keys(block: np.ndarray) -> np.ndarray:
+    """One sortable bytes key per row of a 2-D ``uint32`` array."""
+    block = np.ascontiguousarray(block)
+    return block.view(np.dtype((np.void, block.dtype.itemsize * block.shape[1]))).ravel()
+
+
+def _components(size: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Smallest node of each node's connected component.
+
+    Vectorized union-find: edges pull both endpoints to the smaller label
+    and pointer jumping shortcuts label chains, until nothing changes.
+    """
+    labels = np.arange(size, dtype=np.int64)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, low)
+        np.minimum.at(updated, right, low)
+        while True:
+            jumped = updated[updated]
+            if np.array_equal(jumped, updated):
+                break
+            updated = jumped
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+class Deduplicator:
+    """
+    Two-pass exact + near-duplicate removal over JSONL shards.
+
+    Example:
+        >>> report = Deduplicator().deduplicate(
+        ...     ["datasets/stage1_dhatupatha.jsonl", "datasets/stage2_karaka.jsonl"],
+        ...     "datasets/dedup")
+        >>> report["removed"]
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 4, near_field: str = "output", min_near_length: int = 12,
+                 exact_fields: Sequence[str] = EXACT_FIELDS, window: int = 32):
+        """
+        Configure deduplication.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity for near duplicates
+            num_perm: MinHash signature length
+            bands: LSH bands (``num_perm`` must be divisible by it)
+            shingle_size: Characters per shingle
+            near_field: Row field compared for near duplicates
+            min_near_length: Shorter values (e.g. single Stage 1 forms) only
+                             get exact deduplication
+            exact_fields: Fields hashed for exact duplicates
+            window: Later bucket members each member is compared with
+
+        Raises:
+            ValueError: If ``num_perm`` is not divisible by ``bands`` or
+                        ``window`` is not positive
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        if window < 1:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.threshold = threshold
+        self.bands = bands
+        self.near_field = near_field
+        self.min_near_length = min_near_length
+        self.exact_fields = tuple(exact_fields)
+        self.hasher = MinHasher(num_perm, shingle_size)
+
+    def find_duplicates(self, paths: Sequence[Union[str, Path]],
+                        work_dir: Optional[Union[str, Path]] = None) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """
+        First pass: classify every row without keeping row text.
+
+        Args:
+            paths: JSON/JSONL shards, in priority order
+            work_dir: Directory for scratch files (defaults to a temp dir)
+
+        Returns:
+            ``(status, stages, stage_ids)`` where ``status`` is 0 (keep),
+            1 (exact duplicate) or 2 (near duplicate) per row
+        """
+        paths = [Path(p) for p in paths]
+        with tempfile.TemporaryDirectory(dir=work_dir) as scratch:
+            scratch = Path(scratch)
+            stages: Dict[str, int] = {}
+            empty = np.zeros(self.hasher.num_perm, dtype=np.uint32)
+            rows = 0
+            with ExitStack() as files:
+                exact_file, stage_file, signature_file, near_file = (
+                    files.enter_context(open(scratch / name, 'wb'))
+                    for name in ("exact.u64", "stage.u16", "signatures.u32", "near.bool"))
+                for row in _iter_shards(paths):
+                    stage = stages.setdefault(_stage_of(row), len(stages))
+                    text = normalize_text(row.get(self.near_field, ""))
+                    eligible = len(text) >= self.min_near_length
+                    exact_file.write(content_hash(row, self.exact_fields).to_bytes(8, 'little'))
+                    stage_file.write(stage.to_bytes(2, 'little'))
+                    near_file.write(b"\1" if eligible else b"\0")
+                    signature_file.write((self.hasher.signature(text) if eligible else empty).tobytes())
+                    rows += 1
+
+            status = np.zeros(rows, dtype=np.uint8)
+            stage_ids = np.fromfile(scratch / "stage.u16", dtype='<u2')
+            if rows:
+                exact = np.fromfile(scratch / "exact.u64", dtype='<u8')
+                _, first = np.unique(exact, return_index=True)
+                status[:] = 1
+                status[first] = 0
+                del exact
+
+                eligible = np.fromfile(scratch / "near.bool", dtype=np.bool_) & (status == 0)
+                signatures = np.memmap(scratch / "signatures.u32", dtype=np.uint32, mode='r',
+                                       shape=(rows, self.hasher.num_perm))
+                near = self._near_duplicates(signatures, np.flatnonzero(eligible))
+                status[near] = 2
+                del signatures
+        return status, list(stages), stage_ids
+
+    def _near_duplicates(self, signatures: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Rows (other than the first of each near-duplicate cluster) similar to another row."""
+        if len(candidates) < 2:
+            return np.zeros(0, dtype=np.int64)
+        candidate_signatures = np.asarray(signatures[candidates])
+        # Rank by full signature, so each bucket is ordered with similar rows adjacent
+        full_rank = np.empty(len(candidates), dtype=np.int64)
+        full_rank[np.argsort(_void_keys(candidate_signatures), kind='stable')] = np.arange(len(candidates))
+
+        width = self.hasher.num_perm // self.bands
+        lefts, rights = [], []
+        for band in range(self.bands):
+            keys = _void_keys(candidate_signatures[:, band * width:(band + 1) * width])
+            _, bucket = np.unique(keys, return_inverse=True)
+            order = np.lexsort((full_rank, bucket.ravel()))
+            bucket = bucket.ravel()[order]
+            for distance in range(1, min(self.window, len(order) - 1) + 1):
+                same = np.flatnonzero(bucket[distance:] == bucket[:-distance])
+                if not len(same):
+                    break
+                for start in range(0, len(same), _PAIR_CHUNK):
+                    positions = same[start:start + _PAIR_CHUNK]
+                    left, right = order[positions], order[positions + distance]
+                    similar = (candidate_signatures[left] == candidate_signatures[right]).mean(axis=1) >= self.threshold
+                    lefts.append(left[similar])
+                    rights.append(right[similar])
+        if not lefts:
+            return np.zeros(0, dtype=np.int64)
+        labels = _components(len(candidates), np.concatenate(lefts), np.concatenate(rights))
+        return candidates[labels != np.arange(len(candidates))]
+
+    @staticmethod
+    def output_names(paths: Sequence[Union[str, Path]]) -> List[str]:
+        """
+        Output file name of every shard.
+
+        ``<stem>.dedup.jsonl``, or ``<stem>.<shard index>.dedup.jsonl`` for
+        shards whose stem is shared with another shard (``stage1/part.jsonl``
+        and ``stage2/part.jsonl``, or one file passed twice), so no output
+        overwrites another.
+        """
+        stems = [Path(p).stem for p in paths]
+        counts: Dict[str, int] = {}
+        for stem in stems:
+            counts[stem] = counts.get(stem, 0) + 1
+        return [f"{stem}.dedup.jsonl" if counts[stem] == 1 else f"{stem}.{index}.dedup.jsonl"
+                for index, stem in enumerate(stems)]
+
+    def deduplicate(self, paths: Sequence[Union[str, Path]], output_dir: Union[str, Path],
+                    work_dir: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+        """
+        Write ``<stem>.dedup.jsonl`` for every shard and report removals.
+
+        Shards sharing a stem are written with their index in the name
+        (see ``output_names``).
+
+        Args:
+            paths: JSON/JSONL shards, in priority order
+            output_dir: Directory for the deduplicated shards
+            work_dir: Directory for scratch files
+
+        Returns:
+            Report with total ``rows``, ``kept`` and ``removed`` counts,
+            per-stage ``exact``/``near`` removal counts, and the ``outputs``
+            written (one path per shard, in input order)
+        """
+        paths = [Path(p) for p in paths]
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        status, stages, stage_ids = self.find_duplicates(paths, work_dir)
+
+        outputs = [output_dir / name for name in self.output_names(paths)]
+        index = 0
+        for path, output in zip(paths, outputs):
+            with open(output, 'w', encoding='utf-8') as out:
+                for row in iter_json_records(path):
+                    if status[index] == 0:
+                        out.write(json.dumps(row, ensure_ascii=False) + '\n')
+                    index += 1
+
+        report: Dict[str, Any] = {
+            "rows": int(len(status)),
+            "kept": int((status == 0).sum()),
+            "removed": int((status != 0).sum()),
+            "stages": {},
+            "outputs": [str(output) for output in outputs],
+        }
+        for code, stage in enumerate(stages):
+            in_stage = stage_ids == code
+            report["stages"][stage] = {
+                "rows": int(in_stage.sum()),
+                "exact": int((in_stage & (status == 1)).sum()),
+                "near": int((in_stage & (status == 2)).sum()),
+            }
+        return report
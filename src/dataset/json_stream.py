@@ -0,0 +1,172 @@
+"""
+Streaming JSON Reader Module
+
+Incremental readers for the large JSON and JSONL files shipped with the
+ashtadhyayi-com/data repository (shabda dumps, dhatu lists, sutra tables).
+
+Instead of materializing a whole file with ``json.load``, the readers decode
+one top-level array element at a time from a bounded text buffer, so peak
+memory is bounded by the largest single record rather than by the file.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, Optional, Sequence, Union
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_NON_WHITESPACE = re.compile(r'\S')
+
+
+class _ChunkReader:
+    """
+    Bounded text buffer over a file object.
+
+    Consumed text is dropped every time a new chunk is read, so the buffer
+    only ever holds the record being decoded plus one chunk of look-ahead.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to ``size`` characters; return False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of file)."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buf, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def advance(self):
+        """Consume the character returned by the last ``peek``."""
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """Decode the next JSON value, skipping leading whitespace."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete record: grow geometrically so a huge record is
+                # re-scanned O(log n) times rather than once per chunk.
+                if self._fill(max(self._chunk_size, len(self._buf))):
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the
+            # next chunk ("12" | "34"), so only accept it with look-ahead.
+            if end == len(self._buf) and self._fill(self._chunk_size):
+                continue
+            self._pos = end
+            return value
+
+
+def _project(value: Any, fields: Optional[Sequence[str]]) -> Any:
+    """Keep only ``fields`` of a dict record; other values pass through."""
+    if fields is None or not isinstance(value, dict):
+        return value
+    return {key: value[key] for key in fields if key in value}
+
+
+def iter_json_array(fp: IO[str], fields: Optional[Sequence[str]] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    A file whose top-level value is not an array (e.g. a single dhatu object)
+    yields that value once, mirroring how the extractors treat such files.
+
+    Args:
+        fp: Text file object positioned at the start of the JSON document
+        fields: Optional keys to keep from each dict record (projection)
+        chunk_size: Number of characters to read per chunk
+
+    Returns:
+        Iterator over (projected) records
+
+    Raises:
+        json.JSONDecodeError: If a record is malformed
+        ValueError: If array elements are not separated by commas
+    """
+    reader = _ChunkReader(fp, chunk_size)
+
+    first = reader.peek()
+    if first != "[":
+        if first:
+            yield _project(reader.decode(), fields)
+        return
+
+    reader.advance()
+    if reader.peek() == "]":
+        return
+
+    while True:
+        yield _project(reader.decode(), fields)
+        separator = reader.peek()
+        if separator == ",":
+            reader.advance()
+        elif separator == "]":
+            return
+        else:
+            raise ValueError(f"Expected ',' or ']' between array elements, got {separator!r}")
+
+
+def iter_jsonl(fp: IO[str], fields: Optional[Sequence[str]] = None) -> Iterator[Any]:
+    """
+    Yield one record per non-empty line of a JSONL file.
+
+    Args:
+        fp: Text file object
+        fields: Optional keys to keep from each dict record (projection)
+
+    Returns:
+        Iterator over (projected) records
+    """
+    for line in fp:
+        line = line.strip()
+        if line:
+            yield _project(json.loads(line), fields)
+
+
+def iter_json_records(path: Union[str, Path], fields: Optional[Sequence[str]] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Stream records from a ``.json`` or ``.jsonl`` file.
+
+    Args:
+        path: Path to the file; ``.jsonl`` files are read line by line,
+              anything else is parsed as a (possibly huge) JSON array
+        fields: Optional keys to keep from each dict record (projection)
+        chunk_size: Number of characters to read per chunk for JSON arrays
+
+    Returns:
+        Iterator over (projected) records
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix == '.jsonl':
+            yield from iter_jsonl(f, fields)
+        else:
+            yield from iter_json_array(f, fields, chunk_size)
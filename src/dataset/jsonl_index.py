@@ -0,0 +1,335 @@
+"""
+JSONL Offset Index Module
+
+Sidecar random-access index for JSONL datasets (e.g.
+``datasets/toy_dataset.jsonl`` or the Stage 1 output).
+
+``build_jsonl_index`` makes one streaming pass over a JSONL file and writes a
+binary ``.idx`` file next to it holding:
+
+- the byte offset of every row (``uint64``)
+- optional key columns (by default ``id``, ``stage`` and ``complexity``):
+  integer keys as ``int64``, other keys as ``uint32`` codes into a small
+  value table
+
+``JsonlIndex`` memory-maps both the index and the JSONL file, so fetching
+row ``i``, a strided slice, or every row matching a key only parses the rows
+that are actually returned.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+
+INDEX_SUFFIX = ".idx"
+DEFAULT_KEY_FIELDS = ("id", "stage", "complexity")
+
+_MAGIC = b"PNJLIDX1"
+_HEADER_LENGTH = struct.Struct("<Q")
+_INT_MISSING = -(1 << 63)
+_CATEGORY_MISSING = 0xFFFFFFFF
+
+
+def default_index_path(jsonl_path: Union[str, Path]) -> Path:
+    """Return the sidecar index path for a JSONL file."""
+    return Path(str(jsonl_path) + INDEX_SUFFIX)
+
+
+class _KeyColumn:
+    """Accumulates one key column during the build pass."""
+
+    def __init__(self):
+        self.ints: Optional[array] = array('q')
+        self.codes = array('I')
+        self.values: List[Any] = []
+        self._value_codes: Dict[str, int] = {}
+
+    def _code(self, value: Any) -> int:
+        if value is None:
+            return _CATEGORY_MISSING
+        key = json.dumps(value, sort_keys=True)
+        code = self._value_codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._value_codes[key] = code
+        return code
+
+    def append(self, value: Any):
+        if self.ints is not None:
+            if value is None:
+                self.ints.append(_INT_MISSING)
+                self.codes.append(_CATEGORY_MISSING)
+                return
+            if type(value) is int and _INT_MISSING < value < (1 << 63):
+                self.ints.append(value)
+                self.codes.append(0)
+                return
+            # First non-integer value: fall back to a categorical column
+            previous, self.ints = self.ints, None
+            self.codes = array('I', (_CATEGORY_MISSING if v == _INT_MISSING else self._code(v)
+                                     for v in previous))
+        self.codes.append(self._code(value))
+
+
+def _pad(handle, alignment: int = 8):
+    remainder = handle.tell() % alignment
+    if remainder:
+        handle.write(b"\0" * (alignment - remainder))
+
+
+def build_jsonl_index(jsonl_path: Union[str, Path],
+                      key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+                      index_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Build the sidecar index for a JSONL file in one streaming pass.
+
+    Args:
+        jsonl_path: JSONL file to index
+        key_fields: Top-level fields to store as filterable key columns
+        index_path: Output path (defaults to ``<jsonl_path>.idx``)
+
+    Returns:
+        Path to the written index file
+    """
+    jsonl_path = Path(jsonl_path)
+    index_path = Path(index_path) if index_path else default_index_path(jsonl_path)
+
+    offsets = array('Q')
+    columns = {field: _KeyColumn() for field in key_fields}
+    position = 0
+    with open(jsonl_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                offsets.append(position)
+                if columns:
+                    row = json.loads(line)
+                    for field, column in columns.items():
+                        column.append(row.get(field))
+            position += len(line)
+    offsets.append(position)
+
+    stat = jsonl_path.stat()
+    header: Dict[str, Any] = {
+        "byteorder": sys.byteorder,
+        "rows": len(offsets) - 1,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "columns": {},
+    }
+    sections = [("offsets", offsets)]
+    for field, column in columns.items():
+        if column.ints is not None:
+            header["columns"][field] = {"kind": "int"}
+            sections.append((field, column.ints))
+        else:
+            header["columns"][field] = {"kind": "category", "values": column.values}
+            sections.append((field, column.codes))
+
+    # Section positions depend on the header length, so lay out twice
+    layout: Dict[str, List[int]] = {}
+    for _ in range(2):
+        header["sections"] = layout
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        position = len(_MAGIC) + _HEADER_LENGTH.size + len(header_bytes)
+        new_layout = {}
+        for name, data in sections:
+            position += -position % 8
+            new_layout[name] = [position, len(data)]
+            position += data.itemsize * len(data)
+        if new_layout == layout:
+            break
+        layout = new_layout
+    header["sections"] = layout
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, 'wb') as out:
+        out.write(_MAGIC)
+        out.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        out.write(header_bytes)
+        for name, data in sections:
+            _pad(out)
+            assert out.tell() == layout[name][0]
+            data.tofile(out)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+class JsonlIndex:
+    """
+    Memory-mapped random access into an indexed JSONL file.
+
+    Example:
+        >>> index = JsonlIndex.open("datasets/toy_dataset.jsonl")
+        >>> index[5]["input"]
+        'The boy reads the book'
+        >>> [row["id"] for row in index.select(complexity="complex")][:2]
+        [21, 22]
+    """
+
+    def __init__(self, jsonl_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Open an existing index.
+
+        Args:
+            jsonl_path: Indexed JSONL file
+            index_path: Index file (defaults to ``<jsonl_path>.idx``)
+
+        Raises:
+            ValueError: If the index is malformed, from another platform
+                        byte order, or stale relative to the JSONL file
+        """
+        self.jsonl_path = Path(jsonl_path)
+        self.index_path = Path(index_path) if index_path else default_index_path(self.jsonl_path)
+
+        with open(self.index_path, 'rb') as f:
+            self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._index_map[:len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{self.index_path} is not a JSONL index")
+        start = len(_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._index_map, len(_MAGIC))
+        header = json.loads(self._index_map[start:start + header_length])
+
+        stat = self.jsonl_path.stat()
+        if header["byteorder"] != sys.byteorder:
+            self.close()
+            raise ValueError(f"{self.index_path} was built with {header['byteorder']} byte order")
+        if (header["source_size"], header["source_mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            self.close()
+            raise ValueError(f"{self.index_path} is stale; rebuild it with build_jsonl_index")
+
+        self._rows = header["rows"]
+        view = memoryview(self._index_map)
+        sections = header["sections"]
+
+        def section(name: str, fmt: str) -> memoryview:
+            offset, count = sections[name]
+            return view[offset:offset + count * struct.calcsize(fmt)].cast(fmt)
+
+        self._offsets = section("offsets", 'Q')
+        self._columns: Dict[str, memoryview] = {}
+        self._values: Dict[str, List[Any]] = {}
+        for field, spec in header["columns"].items():
+            if spec["kind"] == "int":
+                self._columns[field] = section(field, 'q')
+            else:
+                self._columns[field] = section(field, 'I')
+                self._values[field] = spec["values"]
+
+        with open(self.jsonl_path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+
+    @classmethod
+    def open(cls, jsonl_path: Union[str, Path], key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+             index_path: Optional[Union[str, Path]] = None) -> "JsonlIndex":
+        """
+        Open the index for a JSONL file, (re)building it if missing or stale.
+
+        Args:
+            jsonl_path: JSONL file
+            key_fields: Key columns to store when building
+            index_path: Index file (defaults to ``<jsonl_path>.idx``)
+
+        Returns:
+            JsonlIndex
+        """
+        path = Path(index_path) if index_path else default_index_path(jsonl_path)
+        if path.exists():
+            try:
+                return cls(jsonl_path, path)
+            except ValueError:
+                pass
+        build_jsonl_index(jsonl_path, key_fields, path)
+        return cls(jsonl_path, path)
+
+    def close(self):
+        """Release the memory maps."""
+        for name in ("_offsets", "_columns"):
+            if hasattr(self, name):
+                delattr(self, name)
+        for name in ("_data", "_index_map"):
+            handle = getattr(self, name, None)
+            if isinstance(handle, mmap.mmap):
+                handle.close()
+
+    def __enter__(self) -> "JsonlIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def key_fields(self) -> List[str]:
+        """Names of the stored key columns."""
+        return list(self._columns)
+
+    def raw(self, index: int) -> bytes:
+        """Return the undecoded bytes of row ``index``."""
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("JsonlIndex row out of range")
+        return self._data[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index: int) -> Dict:
+        """Parse and return row ``index``."""
+        return json.loads(self.raw(index))
+
+    def iter_rows(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> Iterator[Dict]:
+        """Parse rows ``start:stop:step`` only (strided access)."""
+        for index in range(*slice(start, stop, step).indices(self._rows)):
+            yield self[index]
+
+    def key(self, index: int, field: str) -> Any:
+        """Read a key column value for row ``index`` without parsing the row."""
+        value = self._columns[field][index]
+        if field in self._values:
+            return None if value == _CATEGORY_MISSING else self._values[field][value]
+        return None if value == _INT_MISSING else value
+
+    def find(self, **criteria: Any) -> Iterator[int]:
+        """
+        Yield indices of rows whose key columns equal every given value.
+
+        Only the key columns are scanned; no row is parsed.
+
+        Raises:
+            KeyError: If a criterion names a field that is not indexed
+        """
+        targets = []
+        for field, wanted in criteria.items():
+            column = self._columns[field]
+            if field in self._values:
+                codes = [code for code, value in enumerate(self._values[field]) if value == wanted]
+                if not codes:
+                    return
+                code = codes[0]
+            else:
+                if type(wanted) is not int:
+                    return
+                code = wanted
+            targets.append((column, code))
+
+        if not targets:
+            yield from range(self._rows)
+            return
+        (first_column, first_code), rest = targets[0], targets[1:]
+        for index, value in enumerate(first_column):
+            if value == first_code and all(column[index] == code for column, code in rest):
+                yield index
+
+    def select(self, **criteria: Any) -> Iterator[Dict]:
+        """Parse and yield only the rows matching ``find(**criteria)``."""
+        for index in self.find(**criteria):
+            yield self[index]
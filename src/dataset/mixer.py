@@ -0,0 +1,274 @@
+"""
+Curriculum Mixer Module
+
+Lazily interleaves any number of JSONL sources (e.g. Stage 1 Dhatu-Patha,
+Stage 2 Karaka, Stage 3 Kavya) according to a weight schedule that can
+shift over training, such as 70/25/5 moving towards 40/40/20.
+
+Each source keeps a small seeded shuffle buffer; at every step a source is
+drawn by its current weight and a random row is taken from its buffer, so
+proportions follow the schedule exactly while memory stays bounded by
+``buffer_size`` rows per source. The mixer's position, RNG and buffers
+(stored as byte offsets) can be checkpointed and resumed.
+"""
+
+import json
+import random
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+Weights = Mapping[str, float]
+
+
+class WeightSchedule:
+    """
+    Piecewise-linear source weights over training steps.
+
+    Example:
+        >>> schedule = WeightSchedule([
+        ...     (0, {"dhatupatha": 70, "karaka": 25, "kavya": 5}),
+        ...     (10000, {"dhatupatha": 40, "karaka": 40, "kavya": 20}),
+        ... ])
+        >>> schedule(5000)["karaka"]
+        0.325
+    """
+
+    def __init__(self, points: Union[Weights, Sequence[Tuple[int, Weights]]]):
+        """
+        Create a schedule.
+
+        Args:
+            points: Constant weights, or ``(step, weights)`` breakpoints;
+                    weights are interpolated between breakpoints and held
+                    constant outside them
+
+        Raises:
+            ValueError: If there are no breakpoints, two share a step,
+                        or weights are negative
+        """
+        if isinstance(points, Mapping):
+            points = [(0, points)]
+        self.points = sorted(((int(step), dict(weights)) for step, weights in points), key=lambda point: point[0])
+        if not self.points:
+            raise ValueError("WeightSchedule needs at least one breakpoint")
+        steps = [step for step, _ in self.points]
+        if len(set(steps)) != len(steps):
+            raise ValueError("WeightSchedule breakpoints must have distinct steps")
+        self.steps = steps
+        self.names = sorted({name for _, weights in self.points for name in weights})
+        if any(w < 0 for _, weights in self.points for w in weights.values()):
+            raise ValueError("Weights must be non-negative")
+
+    def __call__(self, step: int) -> Dict[str, float]:
+        """Normalized weights at ``step``."""
+        position = bisect_right(self.steps, step)
+        if position == 0:
+            raw = self.points[0][1]
+        elif position == len(self.points):
+            raw = self.points[-1][1]
+        else:
+            (left_step, left), (right_step, right) = self.points[position - 1], self.points[position]
+            t = (step - left_step) / (right_step - left_step)
+            raw = {name: left.get(name, 0.0) * (1 - t) + right.get(name, 0.0) * t for name in self.names}
+        total = sum(raw.values())
+        return {name: (raw.get(name, 0.0) / total if total else 0.0) for name in self.names}
+
+
+class _Source:
+    """Line reader with a shuffle buffer of ``(byte_offset, row)`` pairs."""
+
+    def __init__(self, name: str, path: Path, buffer_size: int, cycle: bool):
+        self.name = name
+        self.path = path
+        self.buffer_size = buffer_size
+        self.cycle = cycle
+        self.handle = open(path, 'rb')
+        self.offset = 0
+        self.epoch = 0
+        self.exhausted = False
+        self.buffer: List[Tuple[int, Dict]] = []
+
+    def _read(self) -> Optional[Tuple[int, Dict]]:
+        while True:
+            offset = self.handle.tell()
+            line = self.handle.readline()
+            if not line:
+                return None
+            if line.strip():
+                return offset, json.loads(line)
+
+    def fill(self):
+        while len(self.buffer) < self.buffer_size and not self.exhausted:
+            item = self._read()
+            if item is None:
+                if self.cycle and self.epoch_has_rows():
+                    self.epoch += 1
+                    self.handle.seek(0)
+                    continue
+                self.exhausted = True
+                break
+            self.buffer.append(item)
+        self.offset = self.handle.tell()
+
+    def epoch_has_rows(self) -> bool:
+        position = self.handle.tell()
+        self.handle.seek(0)
+        has_rows = self._read() is not None
+        self.handle.seek(position)
+        return has_rows
+
+    def take(self, rng: random.Random) -> Dict:
+        index = rng.randrange(len(self.buffer))
+        self.buffer[index], self.buffer[-1] = self.buffer[-1], self.buffer[index]
+        _, row = self.buffer.pop()
+        self.fill()
+        return row
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "epoch": self.epoch,
+            "exhausted": self.exhausted,
+            "buffer": [offset for offset, _ in self.buffer],
+        }
+
+    def restore(self, state: Mapping[str, Any]):
+        self.buffer = []
+        for offset in state["buffer"]:
+            self.handle.seek(offset)
+            self.buffer.append((offset, json.loads(self.handle.readline())))
+        self.offset = state["offset"]
+        self.epoch = state["epoch"]
+        self.exhausted = state["exhausted"]
+        self.handle.seek(self.offset)
+
+    def close(self):
+        self.handle.close()
+
+
+class CurriculumMixer:
+    """
+    Streaming, resumable, weighted interleaving of JSONL datasets.
+
+    Example:
+        >>> mixer = CurriculumMixer(
+        ...     {"dhatupatha": "datasets/stage1_dhatupatha.jsonl",
+        ...      "karaka": "datasets/stage2_karaka.jsonl"},
+        ...     WeightSchedule({"dhatupatha": 0.7, "karaka": 0.3}),
+        ...     seed=42,
+        ... )
+        >>> batch = [next(mixer) for _ in range(32)]
+        >>> mixer.save_state("checkpoints/mixer.json")
+    """
+
+    def __init__(self, sources: Mapping[str, Union[str, Path]],
+                 schedule: Union[WeightSchedule, Weights, Callable[[int], Weights]],
+                 seed: int = 0, buffer_size: int = 1000, cycle: bool = False):
+        """
+        Open every source lazily.
+
+        Args:
+            sources: Source name to JSONL path
+            schedule: ``WeightSchedule``, constant weights, or any
+                      ``step -> weights`` callable
+            seed: Seed for source selection and buffer shuffling
+            buffer_size: Shuffle buffer rows per source
+            cycle: Restart exhausted sources instead of dropping them
+
+        Raises:
+            ValueError: If the schedule names an unknown source or
+                        ``buffer_size`` is not positive
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        self.schedule = WeightSchedule(schedule) if isinstance(schedule, Mapping) else schedule
+        unknown = set(getattr(self.schedule, "names", ())) - set(sources)
+        if unknown:
+            raise ValueError(f"Schedule weights for unknown sources: {sorted(unknown)}")
+        self.seed = seed
+        self.step = 0
+        self._rng = random.Random(seed)
+        self._sources = {name: _Source(name, Path(path), buffer_size, cycle)
+                         for name, path in sources.items()}
+        for source in self._sources.values():
+            source.fill()
+        self._counts = {name: 0 for name in self._sources}
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self
+
+    def __next__(self) -> Dict:
+        weights = self.schedule(self.step)
+        names = [name for name, source in self._sources.items()
+                 if source.buffer and weights.get(name, 0.0) > 0]
+        if not names:
+            raise StopIteration
+        target = self._rng.random() * sum(weights[name] for name in names)
+        chosen = names[-1]
+        for name in names:
+            target -= weights[name]
+            if target < 0:
+                chosen = name
+                break
+        row = self._sources[chosen].take(self._rng)
+        self.step += 1
+        self._counts[chosen] += 1
+        return row
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Rows emitted per source so far."""
+        return dict(self._counts)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable checkpoint of the mixer position."""
+        version, internal, gauss = self._rng.getstate()
+        return {
+            "seed": self.seed,
+            "step": self.step,
+            "rng": [version, list(internal), gauss],
+            "counts": dict(self._counts),
+            "sources": {name: source.state() for name, source in self._sources.items()},
+        }
+
+    def load_state_dict(self, state: Mapping[str, Any]):
+        """
+        Resume from ``state_dict()`` output.
+
+        Raises:
+            ValueError: If the checkpoint was taken with different sources
+        """
+        if set(state["sources"]) != set(self._sources):
+            raise ValueError("Checkpoint sources do not match mixer sources")
+        version, internal, gauss = state["rng"]
+        self._rng.setstate((version, tuple(internal), gauss))
+        self.seed = state["seed"]
+        self.step = state["step"]
+        self._counts = dict(state["counts"])
+        for name, source_state in state["sources"].items():
+            self._sources[name].restore(source_state)
+
+    def save_state(self, path: Union[str, Path]):
+        """Write ``state_dict()`` to a JSON file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.state_dict(), f)
+
+    def load_state(self, path: Union[str, Path]):
+        """Resume from a file written by ``save_state``."""
+        with open(path, 'r', encoding='utf-8') as f:
+            self.load_state_dict(json.load(f))
+
+    def close(self):
+        """Close all source files."""
+        for source in self._sources.values():
+            source.close()
+
+    def __enter__(self) -> "CurriculumMixer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
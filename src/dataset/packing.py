@@ -0,0 +1,241 @@
+"""
+Sequence Packing Module
+
+Bin-packs tokenized examples (see ``token_store``) into fixed-length
+training sequences with first-fit-decreasing, so tiny Stage 1 rows no longer
+waste most of every padded batch.
+
+``pack_token_dataset`` writes, for an output prefix ``P``:
+
+- ``P.packed``: ``(sequences, max_length)`` tokens, right-padded
+- ``P.docs``: one ``uint32`` row ``(source_row, start, length, label_start)``
+  per packed document; positions are relative to the sequence, and
+  ``label_start`` is where the last field (the output) begins
+- ``P.bins``: ``uint64`` boundaries into ``P.docs`` per sequence
+- ``P.json``: metadata and the packing report
+
+``PackedDataset`` memory-maps these and derives ``cu_seqlens``,
+``position_ids`` and a loss mask per sequence for document-aware attention.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from dataset.token_store import TokenDataset, token_path
+
+
+def first_fit_decreasing(lengths: np.ndarray, max_length: int) -> List[List[int]]:
+    """
+    Assign items to bins of capacity ``max_length`` with first-fit-decreasing.
+
+    Items are placed longest first into the lowest-numbered bin that still
+    fits them; a max segment tree over remaining capacities finds that bin in
+    O(log n), so the whole pass is O(n log n).
+
+    Args:
+        lengths: Item sizes
+        max_length: Bin capacity
+
+    Returns:
+        Item indices per bin, in placement order
+
+    Raises:
+        ValueError: If an item is longer than ``max_length``
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if max_length <= 0:
+        raise ValueError("max_length must be positive")
+    if lengths.size and lengths.max() > max_length:
+        raise ValueError(f"Item of length {int(lengths.max())} exceeds max_length {max_length}")
+
+    size = 1
+    while size < max(len(lengths), 1):
+        size *= 2
+    tree = [max_length] * (2 * size)
+    bins: List[List[int]] = []
+
+    for item in np.argsort(-lengths, kind='stable').tolist():
+        length = int(lengths[item])
+        node = 1
+        while node < size:
+            node = 2 * node if tree[2 * node] >= length else 2 * node + 1
+        slot = node - size
+        if slot == len(bins):
+            bins.append([])
+        bins[slot].append(item)
+        tree[node] -= length
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+    return bins
+
+
+def packing_report(lengths: np.ndarray, bins: List[List[int]], max_length: int) -> Dict[str, Any]:
+    """
+    Summarize how well ``bins`` use the available sequence slots.
+
+    Returns:
+        Dictionary with sequence/document/token counts, packing efficiency,
+        the efficiency of padding every example to ``max_length`` instead,
+        and mean examples per sequence
+    """
+    tokens = int(np.asarray(lengths, dtype=np.int64).sum())
+    documents = sum(len(b) for b in bins)
+    capacity = len(bins) * max_length
+    return {
+        "sequences": len(bins),
+        "documents": documents,
+        "tokens": tokens,
+        "max_length": max_length,
+        "efficiency": tokens / capacity if capacity else 0.0,
+        "padded_efficiency": tokens / (documents * max_length) if documents else 0.0,
+        "examples_per_sequence": documents / len(bins) if bins else 0.0,
+    }
+
+
+def pack_token_dataset(data: TokenDataset, output_prefix: Union[str, Path], max_length: int,
+                       pad_token_id: int = 0, drop_oversized: bool = False) -> Dict[str, Any]:
+    """
+    Pack a tokenized dataset into fixed-length sequences.
+
+    Args:
+        data: Tokenized dataset
+        output_prefix: Path prefix for the packed files
+        max_length: Sequence length
+        pad_token_id: Token used for unused positions
+        drop_oversized: Skip rows longer than ``max_length`` instead of raising
+
+    Returns:
+        Packing report (see ``packing_report``) plus ``dropped`` row count
+
+    Raises:
+        ValueError: If a row exceeds ``max_length`` and ``drop_oversized`` is False
+    """
+    prefix = Path(output_prefix)
+    prefix.parent.mkdir(parents=True, exist_ok=True)
+    lengths = data.lengths.astype(np.int64)
+    rows = np.arange(len(lengths))
+    oversized = lengths > max_length
+    if oversized.any():
+        if not drop_oversized:
+            raise ValueError(f"{int(oversized.sum())} rows exceed max_length {max_length}")
+        rows, lengths = rows[~oversized], lengths[~oversized]
+
+    bins = first_fit_decreasing(lengths, max_length)
+    report = packing_report(lengths, bins, max_length)
+    report["dropped"] = int(oversized.sum())
+
+    width = len(data.fields)
+    label_field = width - 1
+    bin_offsets = np.zeros(len(bins) + 1, dtype=np.uint64)
+    docs = np.zeros((report["documents"], 4), dtype=np.uint32)
+    packed_path = token_path(prefix, ".packed")
+    if bins:
+        packed = np.memmap(packed_path, dtype=data.dtype, mode='w+', shape=(len(bins), max_length))
+        packed[:] = pad_token_id
+        doc = 0
+        for sequence, items in enumerate(bins):
+            start = 0
+            for item in items:
+                row, length = int(rows[item]), int(lengths[item])
+                row_start = int(data.offsets[row * width])
+                label_start = int(data.offsets[row * width + label_field]) - row_start
+                packed[sequence, start:start + length] = data[row]
+                docs[doc] = (row, start, length, start + label_start)
+                start += length
+                doc += 1
+            bin_offsets[sequence + 1] = doc
+        packed.flush()
+        del packed
+    else:
+        open(packed_path, 'wb').close()
+
+    docs.tofile(token_path(prefix, ".docs"))
+    bin_offsets.tofile(token_path(prefix, ".bins"))
+    meta = {
+        "dtype": data.dtype.name,
+        "pad_token_id": pad_token_id,
+        "source": str(data.prefix),
+        "report": report,
+    }
+    with open(token_path(prefix, ".json"), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    return report
+
+
+class PackedDataset:
+    """
+    Memory-mapped reader over packed sequences.
+
+    Example:
+        >>> packed = PackedDataset("datasets/stage1_packed")
+        >>> batch = packed[0]
+        >>> batch["input_ids"], batch["cu_seqlens"], batch["position_ids"]
+    """
+
+    def __init__(self, prefix: Union[str, Path]):
+        """
+        Memory-map a packed dataset.
+
+        Args:
+            prefix: Path prefix given to ``pack_token_dataset``
+        """
+        self.prefix = Path(prefix)
+        with open(token_path(self.prefix, ".json"), 'r', encoding='utf-8') as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        self.report: Dict[str, Any] = self.meta["report"]
+        self.max_length: int = self.report["max_length"]
+        sequences = self.report["sequences"]
+        dtype = np.dtype(self.meta["dtype"])
+
+        if sequences:
+            self.sequences = np.memmap(token_path(self.prefix, ".packed"), dtype=dtype, mode='r',
+                                       shape=(sequences, self.max_length))
+            self.docs = np.memmap(token_path(self.prefix, ".docs"), dtype=np.uint32, mode='r',
+                                  shape=(self.report["documents"], 4))
+        else:
+            self.sequences = np.empty((0, self.max_length), dtype=dtype)
+            self.docs = np.empty((0, 4), dtype=np.uint32)
+        self.bins = np.fromfile(token_path(self.prefix, ".bins"), dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return self.report["sequences"]
+
+    def documents(self, index: int) -> np.ndarray:
+        """``(source_row, start, length, label_start)`` rows for sequence ``index``."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedDataset sequence out of range")
+        return self.docs[int(self.bins[index]):int(self.bins[index + 1])]
+
+    def __getitem__(self, index: int) -> Dict[str, np.ndarray]:
+        """
+        Tokens and attention metadata for sequence ``index``.
+
+        Returns:
+            Dictionary with ``input_ids`` (view), ``cu_seqlens`` (document
+            boundaries, ending at the used length), ``position_ids`` that
+            restart at every document, and ``loss_mask`` covering each
+            document's output tokens
+        """
+        docs = self.documents(index)
+        starts, lengths, label_starts = (docs[:, 1].astype(np.int64), docs[:, 2].astype(np.int64),
+                                         docs[:, 3].astype(np.int64))
+        cu_seqlens = np.append(starts, starts[-1] + lengths[-1] if len(docs) else 0).astype(np.int32)
+
+        position_ids = np.zeros(self.max_length, dtype=np.int64)
+        loss_mask = np.zeros(self.max_length, dtype=bool)
+        for start, length, label_start in zip(starts, lengths, label_starts):
+            position_ids[start:start + length] = np.arange(length)
+            loss_mask[label_start:start + length] = True
+        return {
+            "input_ids": self.sequences[index],
+            "cu_seqlens": cu_seqlens,
+            "position_ids": position_ids,
+            "loss_mask": loss_mask,
+        }
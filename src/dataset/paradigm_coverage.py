@@ -0,0 +1,165 @@
+"""
+Paradigm Coverage Module
+
+Tracks which paradigm cells a generator attempted and which it actually
+filled, as dense NumPy boolean tensors, e.g.
+(root x lakara x person x number) for verbs and
+(base x case x number x gender) for nouns.
+
+Recording a cell is a couple of dict lookups and one array store, so the
+tracker can stay switched on during generation. Tensors are saved bit-packed
+and summarized as a text heatmap.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+_SHADES = " ░▒▓█"
+_UNTRIED = "·"
+
+
+class ParadigmCoverage:
+    """
+    Filled/attempted boolean tensors over a lemma axis plus fixed axes.
+
+    Example:
+        >>> coverage = ParadigmCoverage("root", [("tense", ["Present", "Past"]),
+        ...                                      ("person", [1, 2, 3]),
+        ...                                      ("number", ["Singular", "Plural"])])
+        >>> coverage.record("√gam", ("Present", 3, "Singular"), filled=True)
+        >>> coverage.record("√gam", ("Past", 3, "Singular"), filled=False)
+        >>> coverage.counts()["missing"]
+        1
+    """
+
+    def __init__(self, lemma_axis: str, axes: Sequence[Tuple[str, Sequence[Hashable]]],
+                 capacity: int = 16):
+        """
+        Create empty tensors.
+
+        Args:
+            lemma_axis: Name of the growing first axis (e.g. ``"root"``)
+            axes: ``(name, labels)`` for every fixed axis
+            capacity: Initial lemma capacity (doubles as needed)
+        """
+        self.axis_names = [lemma_axis] + [name for name, _ in axes]
+        self.labels: List[List[Hashable]] = [[]] + [list(labels) for _, labels in axes]
+        self._positions: List[Dict[Hashable, int]] = [
+            {label: i for i, label in enumerate(labels)} for labels in self.labels
+        ]
+        shape = (max(capacity, 1),) + tuple(len(labels) for labels in self.labels[1:])
+        self._attempted = np.zeros(shape, dtype=bool)
+        self._filled = np.zeros(shape, dtype=bool)
+
+    def _lemma_position(self, lemma: Hashable) -> int:
+        position = self._positions[0].get(lemma)
+        if position is None:
+            position = len(self.labels[0])
+            if position == len(self._attempted):
+                grow = ((position,) + self._attempted.shape[1:])
+                self._attempted = np.concatenate([self._attempted, np.zeros(grow, dtype=bool)])
+                self._filled = np.concatenate([self._filled, np.zeros(grow, dtype=bool)])
+            self.labels[0].append(lemma)
+            self._positions[0][lemma] = position
+        return position
+
+    def record(self, lemma: Hashable, cell: Sequence[Hashable], filled: bool):
+        """
+        Mark a cell as attempted, and as filled if a form was produced.
+
+        Raises:
+            ValueError: If a cell label is not on its axis
+        """
+        try:
+            key = (self._lemma_position(lemma),) + tuple(
+                positions[label] for positions, label in zip(self._positions[1:], cell))
+        except KeyError as e:
+            raise ValueError(f"Unknown paradigm cell label {e.args[0]!r} for {lemma!r}") from None
+        self._attempted[key] = True
+        if filled:
+            self._filled[key] = True
+
+    @property
+    def attempted(self) -> np.ndarray:
+        """Attempted cells, shape ``(lemmas, *axes)``."""
+        return self._attempted[:len(self.labels[0])]
+
+    @property
+    def filled(self) -> np.ndarray:
+        """Filled cells, shape ``(lemmas, *axes)``."""
+        return self._filled[:len(self.labels[0])]
+
+    def counts(self) -> Dict[str, Any]:
+        """Total cells, attempted, filled and missing (attempted but empty)."""
+        attempted = int(self.attempted.sum())
+        filled = int(self.filled.sum())
+        return {
+            "cells": int(self.attempted.size),
+            "attempted": attempted,
+            "filled": filled,
+            "missing": attempted - filled,
+            "fill_rate": filled / attempted if attempted else 0.0,
+        }
+
+    def missing_cells(self) -> List[Tuple[Hashable, ...]]:
+        """Labels of every attempted cell that produced no form."""
+        return [tuple(labels[i] for labels, i in zip(self.labels, index))
+                for index in np.argwhere(self.attempted & ~self.filled)]
+
+    def heatmap(self, column_axis: int = 1) -> str:
+        """
+        Text heatmap of fill rate: lemmas down, ``column_axis`` labels across.
+
+        Each cell's shade is the filled fraction of attempted cells over the
+        remaining axes; ``·`` marks columns never attempted.
+        """
+        others = tuple(axis for axis in range(1, len(self.labels)) if axis != column_axis)
+        attempted = self.attempted.sum(axis=others)
+        filled = self.filled.sum(axis=others)
+
+        columns = [str(label)[:4] for label in self.labels[column_axis]]
+        name_width = max([len(str(lemma)) for lemma in self.labels[0]] + [len(self.axis_names[0])])
+        lines = [f"{self.axis_names[0]:<{name_width}}  " + " ".join(f"{c:<4}" for c in columns) + "  fill"]
+        for row, lemma in enumerate(self.labels[0]):
+            cells = []
+            for column in range(len(columns)):
+                if attempted[row, column] == 0:
+                    cells.append(_UNTRIED * 4)
+                else:
+                    ratio = filled[row, column] / attempted[row, column]
+                    cells.append(_SHADES[int(round(ratio * (len(_SHADES) - 1)))] * 4)
+            total = attempted[row].sum()
+            rate = f"{filled[row].sum() / total:5.0%}" if total else "    -"
+            lines.append(f"{str(lemma):<{name_width}}  " + " ".join(cells) + f"  {rate}")
+        counts = self.counts()
+        lines.append(f"{counts['filled']}/{counts['attempted']} attempted cells filled "
+                     f"({counts['fill_rate']:.0%}), {counts['missing']} missing; "
+                     f"legend: '{_SHADES[-1]}' full, ' ' empty, '{_UNTRIED}' not attempted")
+        return "\n".join(lines)
+
+    def save(self, path: Union[str, Path]):
+        """Write bit-packed tensors and axis labels to a ``.npz`` file."""
+        meta = {"axis_names": self.axis_names, "labels": self.labels}
+        np.savez_compressed(path,
+                            attempted=np.packbits(self.attempted),
+                            filled=np.packbits(self.filled),
+                            meta=np.array(json.dumps(meta, ensure_ascii=False)))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ParadigmCoverage":
+        """Read a tracker written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            names, labels = meta["axis_names"], meta["labels"]
+            coverage = cls(names[0], list(zip(names[1:], labels[1:])), capacity=len(labels[0]))
+            for lemma in labels[0]:
+                coverage._lemma_position(lemma)
+            shape = coverage.attempted.shape
+            size = int(np.prod(shape))
+            coverage._attempted[:len(labels[0])] = np.unpackbits(data["attempted"], count=size).reshape(shape)
+            coverage._filled[:len(labels[0])] = np.unpackbits(data["filled"], count=size).reshape(shape)
+        return coverage
@@ -0,0 +1,302 @@
+"""
+Compact Record Types Module
+
+Memory-lean containers for the dhatu, sutra and shabda data extracted from the
+ashtadhyayi-com/data repository.
+
+A ``dict`` per record repeats every key and carries a hash table, which
+dominates RSS once the full shabda corpus is loaded. This module provides:
+
+- ``DhatuRecord`` / ``SutraRecord``: ``__slots__`` records for the small,
+  fixed-schema dhatu and sutra tables
+- ``ColumnarStore``: a column-per-field store backed by ``array('I')`` with
+  an interned value table, for hundreds of thousands of shabda entries
+
+All record types are read-only ``Mapping`` objects, so generator code that
+does ``record["root"]`` or ``record.get("gana", "1")`` works unchanged.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence
+
+
+# Column slot marker for a field that is absent from a row
+_MISSING = 0xFFFFFFFF
+
+
+def _intern(value: Any) -> Any:
+    """Intern short categorical strings so equal values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _SlottedRecord(Mapping):
+    """
+    Base class for fixed-schema records stored in ``__slots__``.
+
+    Fields set to None read as missing, matching ``dict.get`` semantics for
+    absent keys.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.__slots__ if getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "_SlottedRecord":
+        """Build a record from a dict, ignoring unknown keys."""
+        return cls(**{key: data.get(key) for key in cls.__slots__})
+
+
+class DhatuRecord(_SlottedRecord):
+    """A verb root (dhatu) with its gana and meaning."""
+
+    __slots__ = ("root", "gana", "meaning")
+
+    def __init__(self, root: Optional[str], gana: Optional[str] = "1", meaning: Optional[str] = ""):
+        self.root = root
+        self.gana = _intern(gana)
+        self.meaning = meaning
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "DhatuRecord":
+        """Build a record from a dict; ``dhatu`` is accepted as an alias of ``root``."""
+        return cls(
+            root=data.get("root", data.get("dhatu")),
+            gana=data.get("gana"),
+            meaning=data.get("meaning"),
+        )
+
+
+class SutraRecord(_SlottedRecord):
+    """A sutra with its number split into adhyaya, pada and sutra."""
+
+    __slots__ = ("number", "text", "adhyaya", "pada", "sutra")
+
+    def __init__(self, number: Optional[str], text: Optional[str] = None,
+                 adhyaya: Optional[str] = None, pada: Optional[str] = None,
+                 sutra: Optional[str] = None):
+        self.number = number
+        self.text = text
+        self.adhyaya = _intern(adhyaya)
+        self.pada = _intern(pada)
+        self.sutra = _intern(sutra)
+
+
+def _value_key(value: Any) -> Hashable:
+    """Dedup key for a value; keeps 1, 1.0 and True (equal as dict keys) distinct."""
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return (type(value), value) if isinstance(value, (int, float)) else value
+
+
+class ValueTable:
+    """
+    Interned table of distinct values, addressed by integer ID.
+
+    Hashable values are deduplicated directly; lists and dicts are
+    deduplicated by their ``repr`` and must be treated as read-only.
+    """
+
+    __slots__ = ("_values", "_ids")
+
+    def __init__(self):
+        self._values: List[Any] = []
+        self._ids: Optional[Dict[Hashable, int]] = {}
+
+    def intern(self, value: Any) -> int:
+        """Return the ID of ``value``, adding it to the table if new."""
+        if self._ids is None:
+            self._ids = {_value_key(v): i for i, v in enumerate(self._values)}
+        key = _value_key(value)
+        value_id = self._ids.get(key)
+        if value_id is None:
+            value_id = len(self._values)
+            self._values.append(value)
+            self._ids[key] = value_id
+        return value_id
+
+    def release_index(self):
+        """
+        Drop the value-to-ID lookup dict once loading is done.
+
+        For high-cardinality fields (e.g. unique word forms) the lookup dict
+        costs more than the values themselves; it is rebuilt on the next
+        ``intern`` call.
+        """
+        self._ids = None
+
+    def __getitem__(self, value_id: int) -> Any:
+        return self._values[value_id]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class RowView(Mapping):
+    """Zero-copy, read-only view of one row of a ``ColumnarStore``."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "ColumnarStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store.value(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._store
+        return (field for field, column in zip(store.fields, store._columns)
+                if column[self._index] != _MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+
+class ColumnarStore:
+    """
+    Column-oriented record store with interned values.
+
+    Each field is an ``array('I')`` of value IDs (4 bytes per row), and every
+    distinct value is stored once in a shared ``ValueTable``. Fields first
+    seen mid-stream are added as new columns backfilled with "missing".
+
+    Example:
+        >>> store = ColumnarStore.from_records([{"word": "rama", "linga": "pum"}])
+        >>> store[0]["linga"]
+        'pum'
+    """
+
+    def __init__(self, fields: Sequence[str] = ()):
+        """
+        Initialize an empty store.
+
+        Args:
+            fields: Optional initial column names
+        """
+        self.fields: List[str] = []
+        self._columns: List[array] = []
+        self._field_index: Dict[str, int] = {}
+        self._values = ValueTable()
+        self._length = 0
+        for field in fields:
+            self._add_column(field)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping], fields: Sequence[str] = ()) -> "ColumnarStore":
+        """
+        Build a store from an iterable of records (consumed lazily).
+
+        Args:
+            records: Dict-like records, e.g. from ``iter_json_records``
+            fields: Optional initial column names
+
+        Returns:
+            Populated ColumnarStore
+        """
+        store = cls(fields)
+        store.extend(records)
+        store.compact()
+        return store
+
+    def _add_column(self, field: str) -> int:
+        column_index = len(self._columns)
+        self.fields.append(field)
+        self._columns.append(array('I', [_MISSING]) * self._length)
+        self._field_index[field] = column_index
+        return column_index
+
+    def append(self, record: Mapping):
+        """Append one record."""
+        field_index = self._field_index
+        intern = self._values.intern
+        seen = []
+        for field, value in record.items():
+            column_index = field_index.get(field)
+            if column_index is None:
+                column_index = self._add_column(field)
+            self._columns[column_index].append(intern(value))
+            seen.append(column_index)
+        if len(seen) != len(self._columns):
+            present = set(seen)
+            for column_index, column in enumerate(self._columns):
+                if column_index not in present:
+                    column.append(_MISSING)
+        self._length += 1
+
+    def extend(self, records: Iterable[Mapping]):
+        """Append every record from an iterable."""
+        for record in records:
+            self.append(record)
+
+    def compact(self):
+        """Release load-time bookkeeping; further appends remain possible."""
+        self._values.release_index()
+
+    def value(self, index: int, field: str, default: Any = KeyError) -> Any:
+        """
+        Read one cell without building a row.
+
+        Args:
+            index: Row index
+            field: Field name
+            default: Value returned for a missing cell (raises KeyError if omitted)
+
+        Returns:
+            The stored value
+        """
+        column_index = self._field_index.get(field)
+        value_id = _MISSING if column_index is None else self._columns[column_index][index]
+        if value_id == _MISSING:
+            if default is KeyError:
+                raise KeyError(field)
+            return default
+        return self._values[value_id]
+
+    def column(self, field: str) -> Iterator[Any]:
+        """Iterate the values of one field (None where missing)."""
+        column_index = self._field_index.get(field)
+        if column_index is None:
+            return iter([None] * self._length)
+        values = self._values
+        return (None if value_id == _MISSING else values[value_id]
+                for value_id in self._columns[column_index])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarStore index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, index) for index in range(self._length))
+
+    def nbytes(self) -> int:
+        """Approximate size of the column arrays in bytes (excluding values)."""
+        return sum(column.itemsize * len(column) for column in self._columns)
@@ -0,0 +1,156 @@
+"""
+Dataset Splitting Module
+
+Assigns rows to train/val/test by a stable hash of a grouping key, so every
+form of a root (``gacchati``, ``gacchanti``, ...) lands in the same split.
+
+Group keys:
+
+- Stage 1 (``dhatupatha``): the verb root, or the pratipadika for nouns
+- Sandhi: the ordered input word pair
+- Stage 2 (``karaka``): the karaka signature, i.e. the kriya root plus the
+  roles present
+
+Assignment depends only on the key, the split ratios and an optional salt,
+so it is identical across reruns, machines and shards, and splitting a file
+needs one pass and constant memory.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from dataset.json_stream import iter_json_records
+
+
+DEFAULT_RATIOS = {"train": 0.9, "val": 0.05, "test": 0.05}
+
+# Canonical role order for karaka signatures (matches generator.karaka_generator.ROLES)
+_KARAKA_ROLES = ("karta", "karma", "karana", "sampradana", "apadana", "adhikarana")
+_SANDHI_SEPARATOR = " + "
+
+
+def _sandhi_pair(row: Mapping[str, Any]) -> Optional[str]:
+    if "word1" in row and "word2" in row:
+        return f"{row['word1']}{_SANDHI_SEPARATOR}{row['word2']}"
+    if "messages" in row:
+        content = row["messages"][0].get("content", "")
+        return content.split(": ", 1)[-1] if _SANDHI_SEPARATOR in content else None
+    if "sandhi" in str(row.get("instruction", "")).lower():
+        return row.get("input")
+    return None
+
+
+def group_key(row: Mapping[str, Any]) -> str:
+    """
+    Grouping key that keeps related rows in the same split.
+
+    Args:
+        row: Dataset row from any generator
+
+    Returns:
+        Key string prefixed with its kind (``root:``, ``pratipadika:``,
+        ``sandhi:``, ``karaka:``); rows of unknown shape fall back to their
+        ``input`` (or the whole row)
+    """
+    karaka = row.get("karaka")
+    if isinstance(karaka, Mapping):
+        root = karaka.get("kriya", {}).get("root", "")
+        roles = "+".join(role for role in _KARAKA_ROLES if role in karaka)
+        return f"karaka:{root}|{roles}"
+    if row.get("root"):
+        return f"root:{row['root']}"
+    if row.get("pratipadika"):
+        return f"pratipadika:{row['pratipadika']}"
+    pair = _sandhi_pair(row)
+    if pair is not None:
+        return f"sandhi:{pair}"
+    if "input" in row:
+        return f"input:{row['input']}"
+    return "row:" + json.dumps(row, sort_keys=True, ensure_ascii=False)
+
+
+class HashSplitter:
+    """
+    Deterministic split assignment by hashed group key.
+
+    Example:
+        >>> splitter = HashSplitter({"train": 0.8, "val": 0.1, "test": 0.1})
+        >>> splitter({"root": "√gam", "output": "gacchati"}) == \\
+        ...     splitter({"root": "√gam", "output": "gacchanti"})
+        True
+    """
+
+    def __init__(self, ratios: Mapping[str, float] = DEFAULT_RATIOS, salt: str = "",
+                 key_func: Callable[[Mapping[str, Any]], str] = group_key):
+        """
+        Configure the splitter.
+
+        Args:
+            ratios: Split name to fraction; normalized to sum to 1
+            salt: Changes every assignment (use a new salt for a new split)
+            key_func: Row to group key
+
+        Raises:
+            ValueError: If ratios are empty, negative or all zero
+        """
+        if not ratios or any(r < 0 for r in ratios.values()) or sum(ratios.values()) <= 0:
+            raise ValueError("Split ratios must be non-negative and sum to more than zero")
+        total = sum(ratios.values())
+        self.ratios = {name: ratio / total for name, ratio in ratios.items()}
+        self.salt = salt.encode('utf-8') + b"\0" if salt else b""
+        self.key_func = key_func
+
+        # Upper bounds of each split in 64-bit hash space
+        self._bounds = []
+        cumulative = 0.0
+        for name, ratio in self.ratios.items():
+            cumulative += ratio
+            self._bounds.append((min(int(cumulative * 2 ** 64), 2 ** 64), name))
+        self._bounds[-1] = (2 ** 64, self._bounds[-1][1])
+
+    def split_of_key(self, key: str) -> str:
+        """Split name for a group key."""
+        digest = hashlib.blake2b(self.salt + key.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'big')
+        for bound, name in self._bounds:
+            if value < bound:
+                return name
+        return self._bounds[-1][1]
+
+    def __call__(self, row: Mapping[str, Any]) -> str:
+        """Split name for a row."""
+        return self.split_of_key(self.key_func(row))
+
+
+def split_jsonl(jsonl_path: Union[str, Path], output_dir: Optional[Union[str, Path]] = None,
+                splitter: Optional[HashSplitter] = None) -> Dict[str, int]:
+    """
+    Stream a JSON/JSONL dataset into one ``<stem>.<split>.jsonl`` file per split.
+
+    Args:
+        jsonl_path: Source dataset
+        output_dir: Directory for the split files (defaults to the source's)
+        splitter: Splitter to use (defaults to ``HashSplitter()``)
+
+    Returns:
+        Row count per split
+    """
+    jsonl_path = Path(jsonl_path)
+    output_dir = Path(output_dir) if output_dir else jsonl_path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    splitter = splitter or HashSplitter()
+
+    counts = {name: 0 for name in splitter.ratios}
+    outputs = {name: open(output_dir / f"{jsonl_path.stem}.{name}.jsonl", 'w', encoding='utf-8')
+               for name in splitter.ratios}
+    try:
+        for row in iter_json_records(jsonl_path):
+            name = splitter(row)
+            outputs[name].write(json.dumps(row, ensure_ascii=False) + '\n')
+            counts[name] += 1
+    finally:
+        for f in outputs.values():
+            f.close()
+    return counts
@@ -0,0 +1,61 @@
+"""
+Line Parsers Module
+
+Streaming parsers for the plain-text dhatu and sutra listings in the
+ashtadhyayi-com/data repository.
+
+Both parsers consume any iterable of lines (an open file object works), use
+module-level precompiled patterns, and yield compact records lazily, so a
+file is never read into memory or split as a whole.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+from dataset.records import DhatuRecord, SutraRecord
+
+
+# "1.1.1 text" or "1.1.1: text"; adhyaya, pada and sutra are captured
+# directly so the number never has to be split
+SUTRA_LINE_PATTERN = re.compile(r'((\d+)\.(\d+)\.(\d+))(?:[:\.]\s*|\s+)(.+)')
+
+
+def parse_dhatu_lines(lines: Iterable[str]) -> Iterator[DhatuRecord]:
+    """
+    Parse dhatu entries of the form "root gana meaning...".
+
+    Example line: "गम् 1 गतौ" (gam, gana 1, meaning: to go)
+
+    Args:
+        lines: Iterable of text lines, e.g. an open file object
+
+    Returns:
+        Iterator over DhatuRecord
+    """
+    for line in lines:
+        parts = line.split()
+        # Blank lines, comments and single-token lines carry no dhatu
+        if len(parts) < 2 or parts[0][0] == '#':
+            continue
+        yield DhatuRecord(parts[0], parts[1], " ".join(parts[2:]))
+
+
+def parse_sutra_lines(lines: Iterable[str]) -> Iterator[SutraRecord]:
+    """
+    Parse sutra entries of the form "adhyaya.pada.sutra[:.] text".
+
+    Args:
+        lines: Iterable of text lines, e.g. an open file object
+
+    Returns:
+        Iterator over SutraRecord
+    """
+    match_line = SUTRA_LINE_PATTERN.match
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        match = match_line(line)
+        if match:
+            number, adhyaya, pada, sutra, text = match.groups()
+            yield SutraRecord(number, text, adhyaya, pada, sutra)
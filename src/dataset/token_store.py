@@ -0,0 +1,277 @@
+"""
+Packed Token Dataset Module
+
+Tokenizes JSONL datasets once into a flat binary layout that training
+loaders can ``numpy.memmap`` without copying or re-tokenizing each epoch.
+
+For an output prefix ``P`` the writer produces:
+
+- ``P.tokens``: every token of every row back to back (``uint16`` when the
+  vocabulary fits, ``uint32`` otherwise)
+- ``P.offsets``: ``uint64`` segment boundaries; with ``F`` fields, field
+  ``j`` of row ``i`` spans ``offsets[i*F + j]:offsets[i*F + j + 1]``
+- ``P.json``: metadata (dtype, fields, row and token counts, vocab size)
+
+Any tokenizer with ``encode(text) -> List[int]`` and a ``vocab_size`` works
+(Hugging Face tokenizers should be wrapped so ``encode`` does not add
+special tokens per field). ``ByteTokenizer`` is a dependency-free local
+tokenizer for tests and quick experiments.
+"""
+
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from dataset.json_stream import iter_json_records
+
+
+DEFAULT_FIELDS = ("instruction", "input", "output")
+
+_FLUSH_TOKENS = 1 << 20
+
+
+class ByteTokenizer:
+    """
+    UTF-8 byte-level tokenizer: ids 0-255 are bytes, then ``pad`` and ``eos``.
+
+    Needs no vocabulary files, so the whole pipeline runs offline.
+
+    Example:
+        >>> tokenizer = ByteTokenizer()
+        >>> tokenizer.decode(tokenizer.encode("गच्छति"))
+        'गच्छति'
+    """
+
+    pad_token_id = 256
+    eos_token_id = 257
+    vocab_size = 258
+
+    def encode(self, text: str) -> List[int]:
+        """Encode text as its UTF-8 bytes."""
+        return list(text.encode('utf-8'))
+
+    def decode(self, ids: Iterable[int]) -> str:
+        """Decode ids back to text, dropping special tokens."""
+        return bytes(int(i) for i in ids if i < 256).decode('utf-8', errors='replace')
+
+
+def token_path(prefix: Union[str, Path], suffix: str) -> Path:
+    """File of a packed dataset: ``prefix`` plus ``suffix`` (e.g. ``.tokens``)."""
+    prefix = Path(prefix)
+    return prefix.with_name(prefix.name + suffix)
+
+
+def _vocab_size(tokenizer: Any) -> int:
+    """Full vocabulary size, including tokens added on top of the base vocab."""
+    try:
+        return max(len(tokenizer), tokenizer.vocab_size)
+    except TypeError:
+        return tokenizer.vocab_size
+
+
+def token_dtype(vocab_size: int) -> np.dtype:
+    """Smallest unsigned dtype that holds every token id."""
+    return np.dtype(np.uint16) if vocab_size <= (1 << 16) else np.dtype(np.uint32)
+
+
+class TokenDatasetWriter:
+    """
+    Streams tokenized rows to the packed ``.tokens``/``.offsets`` files.
+
+    Example:
+        >>> with TokenDatasetWriter("datasets/stage1", ByteTokenizer()) as writer:
+        ...     writer.add({"instruction": "...", "input": "...", "output": "gacchati"})
+    """
+
+    def __init__(self, output_prefix: Union[str, Path], tokenizer: Any,
+                 fields: Sequence[str] = DEFAULT_FIELDS, append_eos: bool = True):
+        """
+        Open the output files.
+
+        Args:
+            output_prefix: Path prefix for the ``.tokens``, ``.offsets`` and ``.json`` files
+            tokenizer: Object with ``encode(text)`` and ``vocab_size``
+            fields: Row fields to tokenize, in order
+            append_eos: Append the tokenizer's ``eos_token_id`` to the last field
+        """
+        self.prefix = Path(output_prefix)
+        self.prefix.parent.mkdir(parents=True, exist_ok=True)
+        self.tokenizer = tokenizer
+        self.fields = tuple(fields)
+        self.vocab_size = _vocab_size(tokenizer)
+        self.dtype = token_dtype(self.vocab_size)
+        self.eos_token_id = getattr(tokenizer, "eos_token_id", None) if append_eos else None
+
+        self.rows = 0
+        self.num_tokens = 0
+        self._tokens = array('H' if self.dtype == np.uint16 else 'I')
+        self._offsets = array('Q', [0])
+        self._tokens_file = open(token_path(self.prefix, ".tokens"), 'wb')
+        self._offsets_file = open(token_path(self.prefix, ".offsets"), 'wb')
+
+    def add(self, row: Mapping[str, Any]):
+        """
+        Tokenize one row; missing fields become empty segments.
+
+        Raises:
+            ValueError: If the tokenizer returns an id outside its vocabulary
+        """
+        for position, field in enumerate(self.fields):
+            value = row.get(field)
+            ids = self.tokenizer.encode(value if isinstance(value, str) else
+                                        ("" if value is None else json.dumps(value, ensure_ascii=False)))
+            if position == len(self.fields) - 1 and self.eos_token_id is not None:
+                ids = list(ids) + [self.eos_token_id]
+            if ids and not 0 <= min(ids) <= max(ids) < self.vocab_size:
+                raise ValueError(f"Token id outside vocabulary of size {self.vocab_size} in field '{field}'")
+            self._tokens.extend(ids)
+            self.num_tokens += len(ids)
+            self._offsets.append(self.num_tokens)
+        self.rows += 1
+        if len(self._tokens) >= _FLUSH_TOKENS:
+            self._flush()
+
+    def add_all(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Tokenize every row; returns the number of rows added."""
+        before = self.rows
+        for row in rows:
+            self.add(row)
+        return self.rows - before
+
+    def _flush(self):
+        self._tokens.tofile(self._tokens_file)
+        self._offsets.tofile(self._offsets_file)
+        del self._tokens[:]
+        del self._offsets[:]
+
+    def close(self):
+        """Flush buffers and write the metadata file."""
+        if self._tokens_file.closed:
+            return
+        self._flush()
+        self._tokens_file.close()
+        self._offsets_file.close()
+        meta = {
+            "dtype": self.dtype.name,
+            "fields": list(self.fields),
+            "rows": self.rows,
+            "tokens": self.num_tokens,
+            "vocab_size": self.vocab_size,
+            "eos_token_id": self.eos_token_id,
+        }
+        with open(token_path(self.prefix, ".json"), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    def abort(self):
+        """Close the files and delete the partial dataset (no metadata is written)."""
+        if self._tokens_file.closed:
+            return
+        self._tokens_file.close()
+        self._offsets_file.close()
+        for suffix in (".tokens", ".offsets", ".json"):
+            token_path(self.prefix, suffix).unlink(missing_ok=True)
+
+    def __enter__(self) -> "TokenDatasetWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        # Metadata marks a complete dataset, so it is only written on success
+        if exc_info[0] is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def tokenize_jsonl(jsonl_path: Union[str, Path], output_prefix: Union[str, Path],
+                   tokenizer: Optional[Any] = None, fields: Sequence[str] = DEFAULT_FIELDS) -> int:
+    """
+    Tokenize a JSON/JSONL dataset into the packed token format in one pass.
+
+    Args:
+        jsonl_path: Source dataset (e.g. ``datasets/stage1_dhatupatha.jsonl``)
+        output_prefix: Path prefix for the packed files
+        tokenizer: Tokenizer to use (defaults to ``ByteTokenizer``)
+        fields: Row fields to tokenize, in order
+
+    Returns:
+        Number of rows written
+    """
+    with TokenDatasetWriter(output_prefix, tokenizer or ByteTokenizer(), fields) as writer:
+        return writer.add_all(iter_json_records(jsonl_path, fields=fields))
+
+
+class TokenDataset:
+    """
+    Zero-copy reader over a packed token dataset.
+
+    Rows and segments are ``numpy`` views into the memory-mapped token file.
+
+    Example:
+        >>> data = TokenDataset("datasets/stage1")
+        >>> data[0]                  # all tokens of row 0
+        >>> data.segment(0, "output")
+    """
+
+    def __init__(self, prefix: Union[str, Path]):
+        """
+        Memory-map a packed token dataset.
+
+        Args:
+            prefix: Path prefix given to the writer
+        """
+        self.prefix = Path(prefix)
+        with open(token_path(self.prefix, ".json"), 'r', encoding='utf-8') as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        self.fields: List[str] = self.meta["fields"]
+        self.dtype = np.dtype(self.meta["dtype"])
+        self._width = len(self.fields)
+
+        if self.meta["tokens"]:
+            self.tokens = np.memmap(token_path(self.prefix, ".tokens"), dtype=self.dtype, mode='r',
+                                    shape=(self.meta["tokens"],))
+        else:
+            self.tokens = np.empty(0, dtype=self.dtype)
+        self.offsets = np.memmap(token_path(self.prefix, ".offsets"), dtype=np.uint64, mode='r',
+                                 shape=(self.meta["rows"] * self._width + 1,))
+
+    def __len__(self) -> int:
+        return self.meta["rows"]
+
+    @property
+    def num_tokens(self) -> int:
+        """Total number of tokens across all rows."""
+        return self.meta["tokens"]
+
+    @property
+    def row_offsets(self) -> np.ndarray:
+        """``uint64`` row boundaries: row ``i`` spans ``row_offsets[i]:row_offsets[i + 1]``."""
+        return self.offsets[::self._width]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Token count of every row."""
+        return np.diff(self.row_offsets)
+
+    def _row_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TokenDataset row out of range")
+        return index
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """All tokens of row ``index`` as a view."""
+        base = self._row_index(index) * self._width
+        return self.tokens[int(self.offsets[base]):int(self.offsets[base + self._width])]
+
+    def segment(self, index: int, field: str) -> np.ndarray:
+        """Tokens of one field of row ``index`` as a view."""
+        position = self._row_index(index) * self._width + self.fields.index(field)
+        return self.tokens[int(self.offsets[position]):int(self.offsets[position + 1])]
+
+    def segments(self, index: int) -> Dict[str, np.ndarray]:
+        """Every field of row ``index`` as views, in field order."""
+        return {field: self.segment(index, field) for field in self.fields}
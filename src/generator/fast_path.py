@@ -0,0 +1,268 @@
+"""
+Symbolic Fast Path Module
+
+Rule-based shortcut for Path A (Constructor) on template-shaped English input.
+
+Most Constructor requests are simple sentences with exactly the shape of the
+Stage 2 templates ("The boy reads the book in the library"). For those the
+karaka structure can be read off the English directly:
+
+- the text is lowercased and split into words, and articles are dropped
+- the first word the lexicon knows as a verb is the kriya; the phrase before
+  it is the karta and a bare phrase after it is the karma
+- prepositional phrases map to roles: "with" -> karana, "to" -> sampradana,
+  "from" -> apadana, "in"/"on"/"at" -> adhikarana
+
+A match is accepted only if every phrase is in the lexicon for its role, the
+kriya licenses the resulting frame and the verb agrees with the karta in
+number. The Sanskrit row is then assembled symbolically with
+``assemble_example``. Anything else goes to the fallback (the model), and the
+fast path reports its hit rate and the model time it saved.
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from generator.karaka_generator import DEFAULT_LEXICON, ROLES, assemble_example
+
+
+ARTICLES = frozenset({"the", "a", "an"})
+
+# Preposition -> karaka role of the phrase it introduces
+PREPOSITIONS = {
+    "with": "karana",
+    "to": "sampradana",
+    "from": "apadana",
+    "in": "adhikarana",
+    "on": "adhikarana",
+    "at": "adhikarana",
+}
+
+_WORD = re.compile(r"[a-z]+")
+
+# (chosen entries by role, kriya entry, karta number)
+Match = Tuple[Dict[str, Dict], Dict, str]
+
+
+def _frame(roles: Iterable[str]) -> Tuple[str, ...]:
+    """Non-karta roles in canonical order."""
+    present = set(roles)
+    return tuple(role for role in ROLES if role in present and role != "karta")
+
+
+class SymbolicFastPath:
+    """
+    English-to-Sanskrit fast path with a model fallback.
+
+    Example:
+        >>> fast_path = SymbolicFastPath(fallback=model.translate)
+        >>> fast_path("The boy reads the book")["output"]
+        'Baalah pustakam pathati'
+        >>> fast_path.report()["hit_rate"]
+        1.0
+    """
+
+    def __init__(self, lexicon: Optional[Mapping[str, List[Dict]]] = None,
+                 fallback: Optional[Callable[[str], Any]] = None,
+                 model_latency_ms: Optional[float] = None):
+        """
+        Compile the lexicon.
+
+        Args:
+            lexicon: Slot lexicons in the ``DEFAULT_LEXICON`` format
+                     (defaults to DEFAULT_LEXICON)
+            fallback: Called with the text when the fast path misses
+                      (e.g. the model's translate function)
+            model_latency_ms: Model latency assumed when reporting savings
+                              before any fallback call has been timed
+
+        Raises:
+            ValueError: If the lexicon has unknown slots
+        """
+        lexicon = DEFAULT_LEXICON if lexicon is None else lexicon
+        unknown = set(lexicon) - set(ROLES) - {"kriya"}
+        if unknown:
+            raise ValueError(f"Unknown lexicon slots: {sorted(unknown)}")
+
+        # (role, english head) -> noun entry; English verb -> (kriya, number)
+        self.nouns: Dict[Tuple[str, str], Dict] = {}
+        self.verbs: Dict[str, Tuple[Dict, str]] = {}
+        for role in ROLES:
+            for entry in lexicon.get(role, []):
+                self.add_noun(role, entry)
+        for kriya in lexicon.get("kriya", []):
+            self.add_kriya(kriya)
+
+        self.fallback = fallback
+        self.model_latency_ms = model_latency_ms
+        self.stats = {"requests": 0, "hits": 0, "fast_s": 0.0, "fallbacks": 0, "fallback_s": 0.0}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]],
+                  lexicon: Optional[Mapping[str, List[Dict]]] = None,
+                  **kwargs) -> "SymbolicFastPath":
+        """
+        Fast path whose lexicon is extended with Stage 2 rows.
+
+        Each row's karaka words, Sanskrit forms and frame are learned; its
+        kriya form is the last word of the output.
+
+        Args:
+            rows: Rows with ``karaka`` and ``output`` (e.g. the toy dataset)
+            lexicon: Base lexicon (defaults to DEFAULT_LEXICON)
+            **kwargs: Passed to the constructor
+
+        Returns:
+            SymbolicFastPath
+        """
+        fast_path = cls(lexicon, **kwargs)
+        for row in rows:
+            fast_path.learn(row)
+        return fast_path
+
+    def add_noun(self, role: str, entry: Mapping[str, Any]):
+        """Register a noun entry (``word``, ``sanskrit``) for a role; first entry wins."""
+        self.nouns.setdefault((role, entry["word"].lower()), dict(entry))
+
+    def add_kriya(self, kriya: Mapping[str, Any]):
+        """Register every English form of a kriya entry; first entry wins."""
+        kriya = dict(kriya)
+        kriya["frames"] = {tuple(_frame(frame)) for frame in kriya.get("frames", [()])}
+        for number, verb in kriya["word"].items():
+            if number in kriya["forms"]:
+                self.verbs.setdefault(verb.lower(), (kriya, number))
+
+    def learn(self, row: Mapping[str, Any]):
+        """
+        Learn the words, forms and frame of one Stage 2 row.
+
+        Rows without a kriya or karta are skipped.
+        """
+        karaka = row.get("karaka")
+        output = str(row.get("output", "")).split()
+        if not isinstance(karaka, Mapping) or not output or "karta" not in karaka:
+            return
+        kriya = karaka.get("kriya")
+        if not isinstance(kriya, Mapping) or not kriya.get("word"):
+            return
+        number = kriya.get("number", "singular")
+        karta = karaka["karta"]
+        if karta.get("number", number) != number:
+            return
+
+        for role in ROLES:
+            slot = karaka.get(role)
+            if isinstance(slot, Mapping) and slot.get("word") and slot.get("sanskrit"):
+                entry = {"word": slot["word"], "sanskrit": slot["sanskrit"]}
+                if role == "karta":
+                    entry["number"] = number
+                self.add_noun(role, entry)
+
+        verb = kriya["word"].lower()
+        frame = _frame(role for role in karaka if role != "kriya")
+        known = self.verbs.get(verb)
+        if known is None:
+            self.add_kriya({"root": kriya.get("root", ""), "word": {number: kriya["word"]},
+                            "forms": {number: output[-1]}, "frames": [frame]})
+        elif known[1] == number and known[0]["forms"][number] == output[-1]:
+            known[0]["frames"].add(frame)
+
+    def _match(self, text: str) -> Optional[Match]:
+        words = [word for word in _WORD.findall(text.lower()) if word not in ARTICLES]
+        verb_at = next((i for i, word in enumerate(words) if i and word in self.verbs), None)
+        if verb_at is None:
+            return None
+        kriya, number = self.verbs[words[verb_at]]
+
+        phrases: List[Tuple[str, List[str]]] = [("karta", words[:verb_at])]
+        for word in words[verb_at + 1:]:
+            if word in PREPOSITIONS:
+                phrases.append((PREPOSITIONS[word], []))
+            elif len(phrases) == 1:
+                phrases.append(("karma", [word]))
+            else:
+                phrases[-1][1].append(word)
+
+        chosen: Dict[str, Dict] = {}
+        for role, phrase in phrases:
+            entry = self.nouns.get((role, " ".join(phrase)))
+            if entry is None or role in chosen:
+                return None
+            chosen[role] = entry
+        if chosen["karta"].get("number", "singular") != number:
+            return None
+        if _frame(chosen) not in kriya["frames"]:
+            return None
+        return chosen, kriya, number
+
+    def translate(self, text: str) -> Optional[Dict]:
+        """
+        Translate template-shaped English symbolically.
+
+        Args:
+            text: English sentence
+
+        Returns:
+            Row in the toy dataset schema (with the karaka structure), or
+            None if the sentence does not match
+        """
+        match = self._match(text)
+        if match is None:
+            return None
+        chosen, kriya, number = match
+        return assemble_example(chosen, kriya, number, english=text.strip())
+
+    def __call__(self, text: str) -> Any:
+        """
+        Translate with the fast path, or the fallback on a miss.
+
+        Returns:
+            The fast-path row, the fallback's result, or None on a miss
+            without a fallback
+        """
+        stats = self.stats
+        stats["requests"] += 1
+        start = time.perf_counter()
+        row = self.translate(text)
+        stats["fast_s"] += time.perf_counter() - start
+        if row is not None:
+            stats["hits"] += 1
+            return row
+        if self.fallback is None:
+            return None
+        start = time.perf_counter()
+        result = self.fallback(text)
+        stats["fallbacks"] += 1
+        stats["fallback_s"] += time.perf_counter() - start
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Hit rate and latency savings so far.
+
+        Returns:
+            ``requests``, ``hits``, ``hit_rate``, mean ``fast_ms`` (per
+            request, hit or miss), mean ``fallback_ms`` (timed, else
+            ``model_latency_ms``) and ``saved_ms``: model time avoided by the
+            hits minus the matching time spent on every request (None if no
+            model latency is known)
+        """
+        stats = self.stats
+        requests = stats["requests"]
+        fast_ms = stats["fast_s"] * 1000 / requests if requests else 0.0
+        if stats["fallbacks"]:
+            fallback_ms = stats["fallback_s"] * 1000 / stats["fallbacks"]
+        else:
+            fallback_ms = self.model_latency_ms
+        saved_ms = None
+        if fallback_ms is not None:
+            saved_ms = stats["hits"] * fallback_ms - stats["fast_s"] * 1000
+        return {
+            "requests": requests,
+            "hits": stats["hits"],
+            "hit_rate": stats["hits"] / requests if requests else 0.0,
+            "fast_ms": fast_ms,
+            "fallback_ms": fallback_ms,
+            "saved_ms": saved_ms,
+        }
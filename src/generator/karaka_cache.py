@@ -0,0 +1,242 @@
+"""
+Karaka Cache Module
+
+Caches assembled Sanskrit outputs of Path A (Constructor) by karaka structure.
+
+Production traffic repeats the same semantic structures (the same karta,
+karma and kriya with the same features), so the output for a structure is
+computed once, by the model or by symbolic assembly, and then served from:
+
+1. an in-memory LRU of recent structures
+2. an on-disk SQLite store shared across processes and restarts
+
+Keys come from a canonical form of the ``karaka`` dict used in
+``toy_dataset.jsonl``: roles sorted, feature names and values normalized
+(strings stripped and casefolded, person as an int, a missing number read as
+singular), and output-side fields (the ``sanskrit`` forms and the English
+verb ``word``) dropped. The canonical JSON is hashed with BLAKE2b, so keys
+are stable across processes, unlike ``hash()``.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from generator.transliteration import to_devanagari
+
+
+# Fields that are produced by translation, not part of the structure
+OUTPUT_FIELDS = {"sanskrit"}
+KRIYA_OUTPUT_FIELDS = {"sanskrit", "word"}
+
+Entry = Tuple[str, str]  # (output, output_devanagari)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip().casefold()
+    if isinstance(value, Mapping):
+        return {str(key).strip().casefold(): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def canonicalize(karaka: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Canonical form of a karaka dict.
+
+    Args:
+        karaka: Role to slot dict (``word``, ``case``, ``vibhakti``, ...)
+                plus ``kriya`` (``root``, ``tense``, ``person``, ``number``)
+
+    Returns:
+        Dict with roles in sorted order and normalized features
+
+    Raises:
+        ValueError: If karaka is not a dict of dicts
+    """
+    if not isinstance(karaka, Mapping):
+        raise ValueError("karaka must be a dict")
+    canonical = {}
+    for role in sorted(karaka, key=lambda role: str(role).strip().casefold()):
+        slot = karaka[role]
+        name = str(role).strip().casefold()
+        if not isinstance(slot, Mapping):
+            raise ValueError(f"karaka role {role!r} is not a dict")
+        dropped = KRIYA_OUTPUT_FIELDS if name == "kriya" else OUTPUT_FIELDS
+        features = {key: value for key, value in _normalize(slot).items() if key not in dropped}
+        if name == "kriya" or name == "karta":
+            features.setdefault("number", "singular")
+        if "person" in features:
+            try:
+                features["person"] = int(features["person"])
+            except (TypeError, ValueError):
+                pass
+        canonical[name] = dict(sorted(features.items()))
+    return canonical
+
+
+def structure_key(karaka: Mapping[str, Any]) -> str:
+    """Stable hex key of a karaka structure (BLAKE2b of its canonical JSON)."""
+    canonical = json.dumps(canonicalize(karaka), sort_keys=True, ensure_ascii=False,
+                           separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class KarakaCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of outputs by karaka structure.
+
+    Example:
+        >>> with KarakaCache("datasets/karaka_cache.sqlite") as cache:
+        ...     row = cache.get_or_compute(karaka, model.translate)
+        ...     cache.report()["hit_rate"]
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, capacity: int = 10000):
+        """
+        Open the cache.
+
+        Args:
+            path: SQLite file (created if missing); None keeps only the memory tier
+            capacity: Maximum structures in the memory tier
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._memory: "OrderedDict[str, Entry]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path))
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS outputs ("
+                "key TEXT PRIMARY KEY, structure TEXT NOT NULL, "
+                "output TEXT NOT NULL, output_devanagari TEXT NOT NULL)"
+            )
+            self._db.commit()
+        self.stats = {"requests": 0, "memory_hits": 0, "disk_hits": 0}
+
+    def _remember(self, key: str, entry: Entry):
+        memory = self._memory
+        memory[key] = entry
+        memory.move_to_end(key)
+        if len(memory) > self.capacity:
+            memory.popitem(last=False)
+
+    def get(self, karaka: Mapping[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Cached output of a structure.
+
+        Returns:
+            ``output`` and ``output_devanagari``, or None on a miss
+        """
+        key = structure_key(karaka)
+        stats = self.stats
+        stats["requests"] += 1
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            stats["memory_hits"] += 1
+        elif self._db is not None:
+            found = self._db.execute(
+                "SELECT output, output_devanagari FROM outputs WHERE key = ?", (key,)
+            ).fetchone()
+            if found is not None:
+                entry = (found[0], found[1])
+                self._remember(key, entry)
+                stats["disk_hits"] += 1
+        if entry is None:
+            return None
+        return {"output": entry[0], "output_devanagari": entry[1]}
+
+    def put(self, karaka: Mapping[str, Any], output: str,
+            output_devanagari: Optional[str] = None) -> Dict[str, str]:
+        """
+        Store the output of a structure in both tiers.
+
+        Args:
+            karaka: The structure
+            output: Assembled Sanskrit (IAST/ASCII)
+            output_devanagari: Devanagari rendering (transliterated if omitted)
+
+        Returns:
+            The stored ``output`` and ``output_devanagari``
+        """
+        key = structure_key(karaka)
+        if output_devanagari is None:
+            output_devanagari = to_devanagari(output)
+        self._remember(key, (output, output_devanagari))
+        if self._db is not None:
+            structure = json.dumps(canonicalize(karaka), sort_keys=True, ensure_ascii=False)
+            self._db.execute("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?)",
+                             (key, structure, output, output_devanagari))
+            self._db.commit()
+        return {"output": output, "output_devanagari": output_devanagari}
+
+    def get_or_compute(self, karaka: Mapping[str, Any],
+                       compute: Callable[[Mapping[str, Any]], Any]) -> Dict[str, str]:
+        """
+        Cached output, or compute and store it.
+
+        Args:
+            karaka: The structure
+            compute: Called with the structure on a miss; returns the
+                     Sanskrit output, or a row with ``output`` (and
+                     optionally ``output_devanagari``)
+
+        Returns:
+            ``output`` and ``output_devanagari``
+        """
+        cached = self.get(karaka)
+        if cached is not None:
+            return cached
+        result = compute(karaka)
+        if isinstance(result, Mapping):
+            output, devanagari = result["output"], result.get("output_devanagari")
+        else:
+            output, devanagari = result, None
+        return self.put(karaka, output, devanagari)
+
+    def __len__(self) -> int:
+        """Structures stored (on disk, or in memory without a store)."""
+        if self._db is not None:
+            return self._db.execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+        return len(self._memory)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Hit rate so far.
+
+        Returns:
+            ``requests``, ``memory_hits``, ``disk_hits``, ``misses`` and
+            ``hit_rate`` (both tiers)
+        """
+        stats = self.stats
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        return {
+            **stats,
+            "misses": stats["requests"] - hits,
+            "hit_rate": hits / stats["requests"] if stats["requests"] else 0.0,
+        }
+
+    def close(self):
+        """Close the SQLite store."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> "KarakaCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,406 @@
+"""
+Karaka Sentence Generator Module
+
+Combinatorial generator for Stage 2 (Karaka - Syntax & Translation) data.
+
+Instead of hand-writing sentence templates, the generator takes slot lexicons
+(karta, karma, karana, sampradana, apadana, adhikarana nouns and kriya roots
+with their inflected forms) and enumerates every well-formed sentence:
+
+- each kriya lists the karaka frames it licenses (e.g. "gives" takes karma
+  and sampradana), so no "The boy goes the book"
+- the kriya form is chosen by the karta's number, and kriyas without a form
+  for that number are never paired with such a karta (number agreement)
+
+The sentence space is a union of mixed-radix blocks, so example ``i`` can be
+decoded directly from its index. Enumeration, random access and seeded
+shuffling therefore never build the product in memory, and rows are streamed
+in the same schema as ``ToyDatasetGenerator.generate_dataset``.
+"""
+
+import json
+import random
+from bisect import bisect_right
+from math import gcd
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from generator.transliteration import to_devanagari
+
+
+INSTRUCTION = "Translate this English sentence to Sanskrit using correct case endings (Vibhakti) according to Panini's rules."
+
+# Karaka roles other than kriya, in the order they appear in the karaka dict
+ROLES = ("karta", "karma", "karana", "sampradana", "apadana", "adhikarana")
+
+# Word order of the generated sentences
+SANSKRIT_ORDER = ("karta", "karana", "sampradana", "karma", "apadana", "adhikarana")
+ENGLISH_ORDER = ("karma", "sampradana", "karana", "apadana", "adhikarana")
+
+# Case and vibhakti carried by each role
+ROLE_CASES = {
+    "karta": ("nominative", "prathama"),
+    "karma": ("accusative", "dvitiya"),
+    "karana": ("instrumental", "tritiya"),
+    "sampradana": ("dative", "chaturthi"),
+    "apadana": ("ablative", "panchami"),
+    "adhikarana": ("locative", "saptami"),
+}
+
+# Labels used in grammar notes
+ROLE_LABELS = {
+    "karta": "Karta (Agent)",
+    "karma": "Karma (Object)",
+    "karana": "Karana (Instrument)",
+    "sampradana": "Sampradana (Recipient)",
+    "apadana": "Apadana (Source)",
+    "adhikarana": "Adhikarana (Location)",
+}
+
+
+# A small lexicon drawn from the toy dataset vocabulary.
+# Noun entries: "word" (English head), "english" (phrase as it appears in the
+# sentence), "sanskrit" (inflected form); karta entries also carry "number".
+# Kriya entries: English and Sanskrit forms per number, plus licensed frames.
+DEFAULT_LEXICON: Dict[str, List[Dict]] = {
+    "karta": [
+        {"word": "boy", "english": "the boy", "sanskrit": "Baalah", "number": "singular"},
+        {"word": "girl", "english": "the girl", "sanskrit": "Baalaa", "number": "singular"},
+        {"word": "student", "english": "the student", "sanskrit": "Chhaatrah", "number": "singular"},
+        {"word": "teacher", "english": "the teacher", "sanskrit": "Acharyah", "number": "singular"},
+        {"word": "boys", "english": "the boys", "sanskrit": "Baalaah", "number": "plural"},
+        {"word": "students", "english": "the students", "sanskrit": "Chhaatraah", "number": "plural"},
+    ],
+    "karma": [
+        {"word": "book", "english": "the book", "sanskrit": "pustakam"},
+        {"word": "letter", "english": "a letter", "sanskrit": "patram"},
+        {"word": "Sanskrit", "english": "Sanskrit", "sanskrit": "samskritam"},
+        {"word": "food", "english": "food", "sanskrit": "annam"},
+    ],
+    "karana": [
+        {"word": "ball", "english": "with a ball", "sanskrit": "kandukena"},
+        {"word": "hand", "english": "with the hand", "sanskrit": "hastena"},
+    ],
+    "sampradana": [
+        {"word": "teacher", "english": "to the teacher", "sanskrit": "acharyaya"},
+        {"word": "child", "english": "to the child", "sanskrit": "baalaaya"},
+        {"word": "students", "english": "to the students", "sanskrit": "chhaatrebhyah"},
+    ],
+    "apadana": [
+        {"word": "school", "english": "from the school", "sanskrit": "vidyalayat"},
+        {"word": "house", "english": "from the house", "sanskrit": "grihat"},
+    ],
+    "adhikarana": [
+        {"word": "house", "english": "in the house", "sanskrit": "grihe"},
+        {"word": "library", "english": "in the library", "sanskrit": "pustakalaye"},
+        {"word": "garden", "english": "in the garden", "sanskrit": "udyane"},
+    ],
+    "kriya": [
+        {"root": "√path", "word": {"singular": "reads", "plural": "read"},
+         "forms": {"singular": "pathati", "plural": "pathanti"},
+         "frames": [(), ("karma",), ("karma", "adhikarana")]},
+        {"root": "√likh", "word": {"singular": "writes", "plural": "write"},
+         "forms": {"singular": "likhati", "plural": "likhanti"},
+         "frames": [(), ("karma",), ("karma", "karana"), ("karma", "adhikarana")]},
+        {"root": "√gam", "word": {"singular": "comes", "plural": "come"},
+         "forms": {"singular": "gacchati", "plural": "gacchanti"},
+         "frames": [("apadana",)]},
+        {"root": "√krid", "word": {"singular": "plays", "plural": "play"},
+         "forms": {"singular": "kridati", "plural": "kridanti"},
+         "frames": [(), ("karana",), ("adhikarana",), ("karana", "adhikarana")]},
+        {"root": "√shiksh", "word": {"singular": "teaches", "plural": "teach"},
+         "forms": {"singular": "shikshayati", "plural": "shikshayanti"},
+         "frames": [("karma",), ("karma", "sampradana")]},
+        # Only the singular is listed, so plural kartas never pair with it
+        {"root": "√da", "word": {"singular": "gives"},
+         "forms": {"singular": "dadati"},
+         "frames": [("karma", "sampradana")]},
+    ],
+}
+
+
+class _Block:
+    """One mixed-radix block: a fixed kriya, frame and karta number."""
+
+    __slots__ = ("kriya", "frame", "number", "kartas", "radices", "size")
+
+    def __init__(self, kriya: int, frame: Tuple[str, ...], number: str,
+                 kartas: List[int], radices: Tuple[int, ...]):
+        self.kriya = kriya
+        self.frame = frame
+        self.number = number
+        self.kartas = kartas
+        self.radices = radices
+        size = len(kartas)
+        for radix in radices:
+            size *= radix
+        self.size = size
+
+
+# Karaka signature (tuple of keys) -> (compiled notes formatter, complexity)
+_SIGNATURE_CACHE: Dict[Tuple[str, ...], Tuple[Callable[[Dict], str], str]] = {}
+
+
+def _compile_signature(signature: Tuple[str, ...]) -> Tuple[Callable[[Dict], str], str]:
+    """
+    Compile the notes formatter and complexity for one set of karaka roles.
+
+    A ``str.format`` template is precomputed for each role present, so
+    rendering an example is one cache lookup plus one template fill per
+    role, with no per-role membership checks.
+    """
+    templates = [(role, f"{ROLE_LABELS[role]}: '{{word}}' → {{sanskrit}} ({{case}} case, {{vibhakti}})")
+                 for role in ROLES if role in signature]
+    if "kriya" in signature:
+        templates.append(("kriya", "Kriya (Verb): '{word}' → {root} → {tense}, {person}rd person, {number}"))
+
+    def format_notes(karaka: Dict) -> str:
+        return "; ".join(template.format_map(karaka[role]) for role, template in templates)
+
+    karaka_count = len(signature) - ("kriya" in signature)
+    if karaka_count == 1:
+        complexity = "simple"
+    elif karaka_count == 2:
+        complexity = "medium"
+    else:
+        complexity = "complex"
+
+    compiled = (format_notes, complexity)
+    _SIGNATURE_CACHE[signature] = compiled
+    return compiled
+
+
+def grammar_notes(karaka: Dict) -> str:
+    """Render the grammar notes for a karaka dict (ToyDatasetGenerator format)."""
+    signature = tuple(karaka)
+    compiled = _SIGNATURE_CACHE.get(signature) or _compile_signature(signature)
+    return compiled[0](karaka)
+
+
+def assess_complexity(karaka: Dict) -> str:
+    """Classify a karaka dict by the number of non-kriya roles."""
+    signature = tuple(karaka)
+    compiled = _SIGNATURE_CACHE.get(signature) or _compile_signature(signature)
+    return compiled[1]
+
+
+def assemble_example(chosen: Dict[str, Dict], kriya: Dict, number: str,
+                     english: Optional[str] = None) -> Dict:
+    """
+    Assemble one row in the toy dataset schema from lexicon entries.
+
+    Args:
+        chosen: Role to noun entry (``word``, ``sanskrit``, ``english``)
+        kriya: Kriya entry with ``root`` and per-number ``word`` and ``forms``
+        number: Karta number, which selects the kriya form
+        english: Input sentence (built from the entries' ``english`` if omitted)
+
+    Returns:
+        Row with input, output, Devanagari, karaka dict, notes and complexity
+    """
+    karaka = {}
+    for role in ROLES:
+        if role in chosen:
+            entry = chosen[role]
+            case, vibhakti = ROLE_CASES[role]
+            karaka[role] = {"word": entry["word"], "sanskrit": entry["sanskrit"],
+                            "case": case, "vibhakti": vibhakti}
+    if number != "singular":
+        karaka["karta"]["number"] = number
+    verb = kriya["word"][number]
+    karaka["kriya"] = {"word": verb, "root": kriya["root"], "tense": "present",
+                       "person": 3, "number": number}
+
+    if english is None:
+        english_words = [chosen["karta"]["english"], verb]
+        english_words.extend(chosen[role]["english"] for role in ENGLISH_ORDER if role in chosen)
+        english = " ".join(english_words)
+        english = english[:1].upper() + english[1:]
+
+    sanskrit_words = [chosen[role]["sanskrit"] for role in SANSKRIT_ORDER if role in chosen]
+    sanskrit_words.append(kriya["forms"][number])
+    sanskrit = " ".join(sanskrit_words)
+
+    return {
+        "instruction": INSTRUCTION,
+        "input": english,
+        "output": sanskrit,
+        "output_devanagari": to_devanagari(sanskrit),
+        "karaka": karaka,
+        "grammar_notes": grammar_notes(karaka),
+        "stage": "karaka",
+        "complexity": assess_complexity(karaka),
+    }
+
+
+class KarakaSentenceGenerator:
+    """
+    Lazily enumerates or samples Karaka sentences from slot lexicons.
+
+    Example:
+        >>> generator = KarakaSentenceGenerator()
+        >>> generator[0]["output"]
+        'Baalah pathati'
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, List[Dict]]] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            lexicon: Slot lexicons keyed by role plus "kriya"; defaults to
+                     DEFAULT_LEXICON
+
+        Raises:
+            ValueError: If the lexicon has unknown roles or a kriya frame
+                        references an unknown role
+        """
+        self.lexicon = DEFAULT_LEXICON if lexicon is None else lexicon
+
+        unknown = set(self.lexicon) - set(ROLES) - {"kriya"}
+        if unknown:
+            raise ValueError(f"Unknown lexicon slots: {sorted(unknown)}")
+
+        kartas_by_number: Dict[str, List[int]] = {}
+        for index, karta in enumerate(self.lexicon.get("karta", [])):
+            kartas_by_number.setdefault(karta.get("number", "singular"), []).append(index)
+
+        self._blocks: List[_Block] = []
+        self._offsets: List[int] = []
+        total = 0
+        for kriya_index, kriya in enumerate(self.lexicon.get("kriya", [])):
+            for frame in kriya.get("frames", [()]):
+                frame = tuple(frame)
+                for role in frame:
+                    if role not in ROLES or role == "karta":
+                        raise ValueError(f"Kriya {kriya['root']} has invalid frame role {role!r}")
+                radices = tuple(len(self.lexicon.get(role, [])) for role in frame)
+                # Agreement: only karta numbers the kriya has a form for
+                for number, kartas in kartas_by_number.items():
+                    if number not in kriya["forms"]:
+                        continue
+                    block = _Block(kriya_index, frame, number, kartas, radices)
+                    if block.size:
+                        self._offsets.append(total)
+                        self._blocks.append(block)
+                        total += block.size
+        self._total = total
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index: int) -> Dict:
+        """Decode example ``index`` (0-based) without enumerating others."""
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("KarakaSentenceGenerator index out of range")
+        block_index = bisect_right(self._offsets, index) - 1
+        block = self._blocks[block_index]
+        local = index - self._offsets[block_index]
+
+        picks = []
+        for radix in reversed(block.radices):
+            local, pick = divmod(local, radix)
+            picks.append(pick)
+        picks.reverse()
+        karta = block.kartas[local]
+        return self._build_example(block, karta, picks)
+
+    def _build_example(self, block: _Block, karta_index: int, picks: Sequence[int]) -> Dict:
+        """Assemble one row in the toy dataset schema."""
+        lexicon = self.lexicon
+        chosen = {"karta": lexicon["karta"][karta_index]}
+        for role, pick in zip(block.frame, picks):
+            chosen[role] = lexicon[role][pick]
+        return assemble_example(chosen, lexicon["kriya"][block.kriya], block.number)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_examples()
+
+    def iter_examples(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Enumerate examples in index order.
+
+        Args:
+            start: First index
+            stop: End index (exclusive); defaults to len(self)
+
+        Returns:
+            Iterator over example rows
+        """
+        stop = self._total if stop is None else min(stop, self._total)
+        for index in range(start, stop):
+            yield self[index]
+
+    def iter_shuffled(self, seed: int = 0) -> Iterator[Dict]:
+        """
+        Enumerate every example once in a seeded pseudo-random order.
+
+        The order is the affine permutation ``i -> (a*i + b) mod N`` with
+        ``a`` coprime to ``N``, which needs O(1) memory.
+
+        Args:
+            seed: Random seed
+
+        Returns:
+            Iterator over example rows
+        """
+        total = self._total
+        if not total:
+            return
+        rng = random.Random(seed)
+        multiplier = rng.randrange(1, total) if total > 1 else 1
+        while gcd(multiplier, total) != 1:
+            multiplier = rng.randrange(1, total)
+        offset = rng.randrange(total)
+        for index in range(total):
+            yield self[(multiplier * index + offset) % total]
+
+    def sample(self, num_examples: int, seed: int = 0) -> Iterator[Dict]:
+        """
+        Lazily sample distinct examples.
+
+        Args:
+            num_examples: Number of examples (capped at len(self))
+            seed: Random seed
+
+        Returns:
+            Iterator over example rows
+        """
+        shuffled = self.iter_shuffled(seed)
+        for _ in range(min(num_examples, self._total)):
+            yield next(shuffled)
+
+    def generate_dataset(self, output_file: str = "datasets/stage2_karaka.jsonl",
+                         max_examples: Optional[int] = None,
+                         shuffle: bool = False, seed: int = 0) -> int:
+        """
+        Stream examples to a JSONL file.
+
+        Args:
+            output_file: Path to output JSONL file
+            max_examples: Maximum number of examples (None for all)
+            shuffle: Write a seeded random sample instead of index order
+            seed: Random seed used when shuffling
+
+        Returns:
+            Number of examples written
+        """
+        limit = self._total if max_examples is None else min(max_examples, self._total)
+        examples = self.sample(limit, seed) if shuffle else self.iter_examples(0, limit)
+
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        count = 0
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for count, example in enumerate(examples, 1):
+                row = {"id": count}
+                row.update(example)
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+        print(f"✓ Generated {count} examples")
+        print(f"✓ Saved to: {output_path}")
+        return count
+
@@ -0,0 +1,230 @@
+"""
+Root Mapper Module
+
+Maps English verbs ("reads", "gave", "studying") to candidate dhatu for
+Path A (Constructor), through an inverted index over dhatu meanings.
+
+- Each dhatu meaning ("to go, to move") is split into glosses, and each gloss
+  into normalized tokens with function words ("to", "the", ...) removed.
+- Every token posts the dhatu it occurs in with a score that favours short,
+  early glosses, so "to go" ranks √gam above a root glossed "to go round".
+- Posting lists are ranked once at build time and persisted as JSON, so a
+  lookup is a handful of dict probes for the query's lemma candidates
+  (irregular forms, -s/-es/-ies, -ed, -ing with e-restoration and undoubling)
+  instead of a scan over the dhatu list.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+
+FORMAT = "panini-meaning-index/1"
+
+# Fallback dhatu with English meanings (used when no extracted corpus is available)
+COMMON_DHATU = [
+    {"root": "√gam", "meaning": "to go", "gana": "1"},
+    {"root": "√path", "meaning": "to read", "gana": "1"},
+    {"root": "√likh", "meaning": "to write", "gana": "1"},
+    {"root": "√da", "meaning": "to give", "gana": "3"},
+    {"root": "√kri", "meaning": "to do", "gana": "8"},
+    {"root": "√bhu", "meaning": "to be", "gana": "1"},
+    {"root": "√as", "meaning": "to be", "gana": "2"},
+    {"root": "√dris", "meaning": "to see", "gana": "1"},
+    {"root": "√shru", "meaning": "to hear", "gana": "1"},
+    {"root": "√vac", "meaning": "to speak", "gana": "2"},
+]
+
+STOPWORDS = frozenset({
+    "to", "the", "a", "an", "of", "and", "or", "in", "on", "at", "into", "with",
+    "for", "by", "from", "as", "one", "one's", "oneself", "something", "someone",
+})
+
+# Inflected English form -> base form
+IRREGULAR = {
+    "is": "be", "am": "be", "are": "be", "was": "be", "were": "be", "been": "be", "being": "be",
+    "has": "have", "had": "have", "does": "do", "did": "do", "done": "do",
+    "goes": "go", "went": "go", "gone": "go", "gave": "give", "given": "give",
+    "saw": "see", "seen": "see", "heard": "hear", "spoke": "speak", "spoken": "speak",
+    "said": "say", "wrote": "write", "written": "write", "taught": "teach",
+    "came": "come", "ate": "eat", "eaten": "eat", "ran": "run", "sat": "sit",
+    "stood": "stand", "knew": "know", "known": "know", "took": "take", "taken": "take",
+    "made": "make", "thought": "think", "brought": "bring", "bought": "buy",
+    "fell": "fall", "fallen": "fall", "flew": "fly", "flown": "fly", "grew": "grow",
+    "grown": "grow", "slept": "sleep", "sang": "sing", "sung": "sing", "left": "leave",
+    "led": "lead", "held": "hold", "kept": "keep", "lay": "lie", "lain": "lie",
+    "rose": "rise", "risen": "rise", "shone": "shine", "struck": "strike", "won": "win",
+    "got": "get", "found": "find", "told": "tell", "felt": "feel", "met": "meet",
+    "sent": "send", "spent": "spend", "dwelt": "dwell", "fought": "fight",
+    "sought": "seek", "burnt": "burn", "drank": "drink", "drunk": "drink",
+}
+
+# Characters that separate glosses within a meaning, and tokens within a gloss
+_GLOSS_SPLIT = re.compile(r"[,;/|]+")
+_TOKEN = re.compile(r"[^\s,;:/|()\[\]{}.!?\"]+")
+
+Candidate = Dict[str, Any]
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """Casefolded content tokens of a text (function words and numbers removed)."""
+    tokens = []
+    for token in _TOKEN.findall(text.casefold()):
+        token = token.strip("'-")
+        if token and token not in STOPWORDS and not token.isdigit():
+            tokens.append(token)
+    return tokens
+
+
+def lemma_candidates(word: str) -> Iterator[str]:
+    """
+    Possible base forms of an English word form, most likely first.
+
+    The index keeps the first candidate it has a posting list for, so
+    over-generation ("writing" -> "writ", "write") is harmless.
+    """
+    word = word.casefold()
+    if word in IRREGULAR:
+        yield IRREGULAR[word]
+    yield word
+    if word.endswith("ies") and len(word) > 4:
+        yield word[:-3] + "y"
+    if word.endswith("es") and len(word) > 3:
+        yield word[:-2]
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 2:
+        yield word[:-1]
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) > len(suffix) + 1:
+            stem = word[:-len(suffix)]
+            yield stem
+            yield stem + "e"
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                yield stem[:-1]
+            if suffix == "ed" and stem.endswith("i"):
+                yield stem[:-1] + "y"
+
+
+def _root(dhatu: Mapping) -> Optional[str]:
+    return dhatu.get("root", dhatu.get("dhatu"))
+
+
+class MeaningIndex:
+    """
+    Inverted index from English meaning tokens to ranked dhatu.
+
+    Example:
+        >>> index = MeaningIndex.build(COMMON_DHATU)
+        >>> [c["root"] for c in index.lookup("reads")]
+        ['√path']
+        >>> index.save("datasets/meaning_index.json")
+    """
+
+    def __init__(self, dhatu: List[Tuple[str, str, str]], postings: Dict[str, List[Tuple[int, float]]]):
+        """
+        Wrap a built index (use ``build`` or ``load``).
+
+        Args:
+            dhatu: ``(root, gana, meaning)`` per dhatu ID
+            postings: Token to ``(dhatu ID, score)`` pairs, best first
+        """
+        self.dhatu = dhatu
+        self.postings = postings
+
+    @classmethod
+    def build(cls, dhatu_list: Iterable[Mapping]) -> "MeaningIndex":
+        """
+        Index a dhatu corpus.
+
+        Args:
+            dhatu_list: Dicts or ``DhatuRecord`` with ``root`` (or ``dhatu``),
+                        ``gana`` and ``meaning``; entries without a root or
+                        meaning are skipped
+
+        Returns:
+            MeaningIndex
+        """
+        dhatu: List[Tuple[str, str, str]] = []
+        scores: Dict[str, Dict[int, float]] = {}
+        for entry in dhatu_list:
+            root, meaning = _root(entry), entry.get("meaning")
+            if not root or not meaning:
+                continue
+            dhatu_id = len(dhatu)
+            dhatu.append((root, str(entry.get("gana") or ""), meaning))
+            glosses = [normalize_tokens(gloss) for gloss in _GLOSS_SPLIT.split(meaning)]
+            for position, tokens in enumerate(gloss for gloss in glosses if gloss):
+                score = round(1.0 / (len(tokens) * (1 + position)), 4)
+                for token in tokens:
+                    posted = scores.setdefault(token, {})
+                    posted[dhatu_id] = max(posted.get(dhatu_id, 0.0), score)
+
+        postings = {
+            token: sorted(posted.items(), key=lambda item: (-item[1], item[0]))
+            for token, posted in scores.items()
+        }
+        return cls(dhatu, postings)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MeaningIndex":
+        """
+        Load an index written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a meaning index
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format") != FORMAT:
+            raise ValueError(f"{path} is not a meaning index")
+        dhatu = [tuple(entry) for entry in data["dhatu"]]
+        postings = {token: [(dhatu_id, score) for dhatu_id, score in posted]
+                    for token, posted in data["postings"].items()}
+        return cls(dhatu, postings)
+
+    def save(self, path: Union[str, Path]):
+        """Write the index as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"format": FORMAT, "dhatu": self.dhatu, "postings": self.postings},
+                      f, ensure_ascii=False)
+
+    def __len__(self) -> int:
+        return len(self.dhatu)
+
+    def _candidate(self, dhatu_id: int, score: float) -> Candidate:
+        root, gana, meaning = self.dhatu[dhatu_id]
+        return {"id": dhatu_id, "root": root, "gana": gana, "meaning": meaning, "score": score}
+
+    def _posting(self, word: str) -> List[Tuple[int, float]]:
+        for lemma in lemma_candidates(word):
+            posted = self.postings.get(lemma)
+            if posted:
+                return posted
+        return []
+
+    def lookup(self, query: str, k: int = 5) -> List[Candidate]:
+        """
+        Ranked dhatu candidates for an English verb or phrase.
+
+        A single word is answered from its precomputed posting list; the
+        scores of a multi-word phrase ("give up") are summed per dhatu.
+
+        Args:
+            query: English verb form or phrase
+            k: Maximum number of candidates
+
+        Returns:
+            Dicts with ``id``, ``root``, ``gana``, ``meaning`` and ``score``,
+            best first
+        """
+        words = [word for word in _TOKEN.findall(query.casefold()) if word not in STOPWORDS]
+        if len(words) == 1:
+            return [self._candidate(dhatu_id, score) for dhatu_id, score in self._posting(words[0])[:k]]
+        totals: Dict[int, float] = {}
+        for word in words:
+            for dhatu_id, score in self._posting(word):
+                totals[dhatu_id] = totals.get(dhatu_id, 0.0) + score
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [self._candidate(dhatu_id, round(score, 4)) for dhatu_id, score in ranked]
@@ -216,6 +216,41 @@ class SandhiGenerator:
         result = self.apply_sandhi(word1, word2)
         return result == expected
 
+    def split_sandhi(self, combined: str) -> List[Tuple[str, str]]:
+        """
+        Find word pairs whose Sandhi combination yields a combined word.
+
+        Inverts the known combinations and the rule table: each occurrence of
+        a rule's result is tried as the junction, and a candidate split is
+        kept only if apply_sandhi reproduces the combined word. Splits with a
+        one-letter word, or a consonant final (visarga, m) not preceded by a
+        vowel, are not plausible words and are skipped.
+
+        Args:
+            combined: Combined Sanskrit word (e.g., "Rameti")
+
+        Returns:
+            List of (word1, word2) tuples, known combinations first
+
+        Example:
+            >>> generator = SandhiGenerator()
+            >>> generator.split_sandhi("Rameti")
+            [('Rama', 'iti')]
+        """
+        splits = [pair for pair, result in self.known_combinations.items() if result == combined]
+        for (final, initial), replacement in self.sandhi_rules.items():
+            start = combined.find(replacement, 1)
+            while start != -1:
+                word1 = combined[:start] + final
+                word2 = initial + combined[start + len(replacement):]
+                if len(word1) < 2 or len(word2) < 2 or (final in 'ḥm' and word1[-2].lower() not in 'aāiīuūṛṝeo'):
+                    start = combined.find(replacement, start + 1)
+                    continue
+                if (word1, word2) not in splits and self.apply_sandhi(word1, word2) == combined:
+                    splits.append((word1, word2))
+                start = combined.find(replacement, start + 1)
+        return splits
+
 
 def main():
     """Example usage of the SandhiGenerator."""
@@ -0,0 +1,452 @@
+"""
+Transliteration Module
+
+Converts romanized Sanskrit (IAST plus the loose ASCII spellings used across
+the generated datasets, e.g. "Baalah", "shikshayati") to Devanagari, and
+Devanagari back to romanization for the Auditor (Path B).
+
+The input scheme is compiled once, at import time, into a longest-match trie.
+Each word is tokenized against the trie and then assembled with proper
+virama/matra handling: consonants carry an inherent "a", other vowels attach
+as matras, and consonant clusters are joined with a virama. Word results are
+memoized, so transliterating millions of dataset rows (which reuse a small
+vocabulary) costs little more than a dictionary lookup per word.
+
+Loose ASCII is ambiguous and the contextual rules only guess. "ri" after a
+consonant is read as vocalic ṛ ("griham" -> गृहम्), so a real "ri" before
+a consonant comes out wrong ("kridati" would give कृदति for क्रीडति). "sh"
+is ś unless a rule makes it ṣ ("prashnam" -> प्रश्नम्). The dataset words
+the rules get wrong are listed in ``_ASCII_WORDS`` and looked up whole.
+
+The reverse direction needs no tokenizer: a precomputed codepoint table
+maps every consonant to itself plus its inherent "a", and every matra or
+virama to a marker that deletes that "a". One ``str.translate`` plus a few
+``str.replace`` calls (the markers, then conjuncts such as च्छ whose ASCII
+spelling is "cch") then handle a whole string in C, and large corpora
+are split into chunks converted in worker processes.
+"""
+
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+VIRAMA = '्'
+
+# Token kinds produced by the trie
+_VOWEL = 0
+_CONSONANT = 1
+_MARK = 2
+_SYMBOL = 3
+
+# Vowels: input spellings -> (independent form, matra form)
+_VOWELS = {
+    ('a',): ('अ', ''),
+    ('aa', 'ā'): ('आ', 'ा'),
+    ('i',): ('इ', 'ि'),
+    ('ii', 'ī'): ('ई', 'ी'),
+    ('u',): ('उ', 'ु'),
+    ('uu', 'ū'): ('ऊ', 'ू'),
+    ('ṛ', 'r̥'): ('ऋ', 'ृ'),
+    ('ṝ', 'r̥̄'): ('ॠ', 'ॄ'),
+    ('ḷ', 'l̥'): ('ऌ', 'ॢ'),
+    ('e',): ('ए', 'े'),
+    ('ai',): ('ऐ', 'ै'),
+    ('o',): ('ओ', 'ो'),
+    ('au',): ('औ', 'ौ'),
+}
+
+# Consonants: input spellings -> Devanagari (clusters include their virama)
+_CONSONANTS = {
+    ('k',): 'क', ('kh',): 'ख', ('g',): 'ग', ('gh',): 'घ', ('ṅ',): 'ङ',
+    ('c', 'ch'): 'च', ('chh',): 'छ', ('j',): 'ज', ('jh',): 'झ', ('ñ',): 'ञ',
+    ('ṭ',): 'ट', ('ṭh',): 'ठ', ('ḍ',): 'ड', ('ḍh',): 'ढ', ('ṇ',): 'ण',
+    ('t',): 'त', ('th',): 'थ', ('d',): 'द', ('dh',): 'ध', ('n',): 'न',
+    ('p',): 'प', ('ph',): 'फ', ('b',): 'ब', ('bh',): 'भ', ('m',): 'म',
+    ('y',): 'य', ('r',): 'र', ('l',): 'ल', ('v', 'w'): 'व',
+    ('ś', 'sh'): 'श', ('ṣ',): 'ष', ('s',): 'स', ('h',): 'ह',
+    ('ksh', 'kṣ'): 'क' + VIRAMA + 'ष', ('cch',): 'च' + VIRAMA + 'छ',
+}
+
+# Marks that follow a syllable
+_MARKS = {
+    ('ṃ', 'ṁ'): 'ं',
+    ('ḥ',): 'ः',
+    ('m̐',): 'ँ',
+}
+
+# Other symbols; these also end a word for virama/visarga purposes
+_SYMBOLS = {
+    ("'",): 'ऽ',
+    ('|',): '।',
+    ('||',): '॥',
+    ('0',): '०', ('1',): '१', ('2',): '२', ('3',): '३', ('4',): '४',
+    ('5',): '५', ('6',): '६', ('7',): '७', ('8',): '८', ('9',): '९',
+}
+
+_CHAR_R = 'र'
+_CHAR_H = 'ह'
+_CHAR_Y = 'य'
+_SHORT_I = ('इ', 'ि')
+_VOCALIC_R = ('ऋ', 'ृ')
+_VISARGA = 'ः'
+
+# ś becomes retroflex ṣ before these consonants ("tishthati" -> तिष्ठति,
+# "pushpam" -> पुष्पम्), and a following dental becomes retroflex
+_SH, _SSH = 'श', 'ष'
+_RETROFLEX_AFTER_SH = {'त': 'ट', 'थ': 'ठ', 'ट': 'ट', 'ठ': 'ठ', 'प': 'प', 'फ': 'फ', 'क': 'क'}
+# After r or ṛ "sh" is ṣ, and a following n is ṇ ("krishna" -> कृष्ण)
+_CHAR_N, _RETROFLEX_N = 'न', 'ण'
+
+# Dataset spellings the contextual rules misread (long ī and ḍ dropped)
+_ASCII_WORDS = {
+    "kridati": "क्रीडति",
+    "kridanti": "क्रीडन्ति",
+}
+
+Token = Tuple[int, object]
+_TrieNode = Dict[str, Tuple[Optional[Token], dict]]
+
+
+def _compile_trie() -> _TrieNode:
+    """Build the longest-match trie over every input spelling."""
+    root: _TrieNode = {}
+    tables = ((_VOWELS, _VOWEL), (_CONSONANTS, _CONSONANT), (_MARKS, _MARK), (_SYMBOLS, _SYMBOL))
+    for table, kind in tables:
+        for spellings, output in table.items():
+            for spelling in spellings:
+                node = root
+                for position, char in enumerate(spelling):
+                    token, children = node.get(char, (None, {}))
+                    if position == len(spelling) - 1:
+                        token = (kind, output)
+                    node[char] = (token, children)
+                    node = children
+    return root
+
+
+_TRIE = _compile_trie()
+
+
+def _tokenize(word: str) -> List[Token]:
+    """Split a lowercased word into trie tokens (longest match wins)."""
+    tokens = []
+    position, length = 0, len(word)
+    while position < length:
+        node, scan = _TRIE, position
+        match, end = None, position
+        while scan < length:
+            entry = node.get(word[scan])
+            if entry is None:
+                break
+            scan += 1
+            if entry[0] is not None:
+                match, end = entry[0], scan
+            node = entry[1]
+        if match is None:
+            tokens.append((_SYMBOL, word[position]))
+            position += 1
+        else:
+            tokens.append(match)
+            position = end
+    return tokens
+
+
+def _is_letter(token: Optional[Token]) -> bool:
+    return token is not None and token[0] in (_VOWEL, _CONSONANT, _MARK)
+
+
+def _contextual(tokens: List[Token]) -> List[Token]:
+    """
+    Resolve the ambiguous ASCII spellings that depend on neighbours.
+
+    - "r" between a consonant and a consonant or word end is vocalic ṛ
+      ("vrkshah" -> वृक्षः), and so is "ri" between a consonant and a
+      consonant other than "y" ("griham" -> गृहम्, but "priya" -> प्रिय)
+    - "sh" before t, th, p, ph or k is retroflex ṣ, and t/th after it are
+      ṭ/ṭh ("tishthati" -> तिष्ठति); after r or ṛ "sh" is ṣ and a following
+      n is ṇ ("krishna" -> कृष्ण, but "prashnam" -> प्रश्नम्)
+    - "h" after a vowel at the end of a word is visarga ("Baalah" -> बालः)
+    """
+    resolved = []
+    count = len(tokens)
+    index = 0
+    while index < count:
+        token = tokens[index]
+        index += 1
+        if token[0] != _CONSONANT:
+            resolved.append(token)
+            continue
+        previous = resolved[-1] if resolved else None
+        following = tokens[index] if index < count else None
+        if token[1] == _CHAR_R and previous is not None and previous[0] == _CONSONANT:
+            if following is None or following[0] in (_CONSONANT, _SYMBOL):
+                token = (_VOWEL, _VOCALIC_R)
+            elif (following == (_VOWEL, _SHORT_I) and index + 1 < count
+                  and tokens[index + 1][0] == _CONSONANT and tokens[index + 1][1] != _CHAR_Y):
+                token = (_VOWEL, _VOCALIC_R)
+                index += 1
+        elif token[1] == _SH and following is not None and following[1] in _RETROFLEX_AFTER_SH:
+            resolved.append((_CONSONANT, _SSH))
+            token = (_CONSONANT, _RETROFLEX_AFTER_SH[following[1]])
+            index += 1
+        elif token[1] == _SH and previous in ((_VOWEL, _VOCALIC_R), (_CONSONANT, _CHAR_R)):
+            token = (_CONSONANT, _SSH)
+            if following == (_CONSONANT, _CHAR_N):
+                resolved.append(token)
+                token = (_CONSONANT, _RETROFLEX_N)
+                index += 1
+        elif (token[1] == _CHAR_H and previous is not None and previous[0] == _VOWEL
+              and not _is_letter(following)):
+            token = (_MARK, _VISARGA)
+        resolved.append(token)
+    return resolved
+
+
+@lru_cache(maxsize=1 << 16)
+def _transliterate_word(word: str) -> str:
+    """Transliterate one space-free chunk of text."""
+    exception = _ASCII_WORDS.get(word)
+    if exception is not None:
+        return exception
+    tokens = _contextual(_tokenize(word))
+    output = []
+    pending_consonant = False
+    for kind, value in tokens:
+        if kind == _CONSONANT:
+            if pending_consonant:
+                output.append(VIRAMA)
+            output.append(value)
+            pending_consonant = True
+        elif kind == _VOWEL:
+            output.append(value[1] if pending_consonant else value[0])
+            pending_consonant = False
+        else:
+            if pending_consonant and kind == _SYMBOL:
+                output.append(VIRAMA)
+            output.append(value)
+            pending_consonant = False
+    if pending_consonant:
+        output.append(VIRAMA)
+    return "".join(output)
+
+
+def to_devanagari(text: str) -> str:
+    """
+    Transliterate romanized Sanskrit to Devanagari.
+
+    Input is case-insensitive; IAST and loose ASCII spellings may be mixed.
+    Characters outside the scheme (e.g. "√", punctuation) pass through.
+
+    Args:
+        text: Romanized Sanskrit (e.g. "Baalah pustakam pathati")
+
+    Returns:
+        Devanagari text (e.g. "बालः पुस्तकम् पथति")
+
+    Example:
+        >>> to_devanagari("Rama gacchati")
+        'रम गच्छति'
+    """
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    return " ".join([_transliterate_word(word) for word in text.lower().split(" ")])
+
+
+def to_devanagari_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Transliterate many strings, sharing the per-word cache.
+
+    Args:
+        texts: Romanized Sanskrit strings
+
+    Returns:
+        List of Devanagari strings in input order
+    """
+    return [to_devanagari(text) for text in texts]
+
+
+# Devanagari -> romanization tables, one column per scheme: (iast, ascii).
+# ASCII follows the dataset spellings, which the forward engine reads back.
+_DEVANAGARI_CONSONANTS = {
+    'क': ('k', 'k'), 'ख': ('kh', 'kh'), 'ग': ('g', 'g'), 'घ': ('gh', 'gh'), 'ङ': ('ṅ', 'n'),
+    'च': ('c', 'ch'), 'छ': ('ch', 'chh'), 'ज': ('j', 'j'), 'झ': ('jh', 'jh'), 'ञ': ('ñ', 'n'),
+    'ट': ('ṭ', 't'), 'ठ': ('ṭh', 'th'), 'ड': ('ḍ', 'd'), 'ढ': ('ḍh', 'dh'), 'ण': ('ṇ', 'n'),
+    'त': ('t', 't'), 'थ': ('th', 'th'), 'द': ('d', 'd'), 'ध': ('dh', 'dh'), 'न': ('n', 'n'),
+    'प': ('p', 'p'), 'फ': ('ph', 'ph'), 'ब': ('b', 'b'), 'भ': ('bh', 'bh'), 'म': ('m', 'm'),
+    'य': ('y', 'y'), 'र': ('r', 'r'), 'ल': ('l', 'l'), 'ळ': ('ḷ', 'l'), 'व': ('v', 'v'),
+    'श': ('ś', 'sh'), 'ष': ('ṣ', 'sh'), 'स': ('s', 's'), 'ह': ('h', 'h'),
+}
+
+_DEVANAGARI_VOWELS = {
+    # independent, matra: (iast, ascii)
+    ('अ', None): ('a', 'a'),
+    ('आ', 'ा'): ('ā', 'aa'),
+    ('इ', 'ि'): ('i', 'i'),
+    ('ई', 'ी'): ('ī', 'ii'),
+    ('उ', 'ु'): ('u', 'u'),
+    ('ऊ', 'ू'): ('ū', 'uu'),
+    ('ऋ', 'ृ'): ('ṛ', 'r'),
+    ('ॠ', 'ॄ'): ('ṝ', 'r'),
+    ('ऌ', 'ॢ'): ('ḷ', 'l'),
+    ('ॡ', 'ॣ'): ('ḹ', 'l'),
+    ('ए', 'े'): ('e', 'e'),
+    ('ऐ', 'ै'): ('ai', 'ai'),
+    ('ओ', 'ो'): ('o', 'o'),
+    ('औ', 'ौ'): ('au', 'au'),
+}
+
+_DEVANAGARI_OTHER = {
+    'ं': ('ṃ', 'm'), 'ः': ('ḥ', 'h'), 'ँ': ('m̐', 'm'), 'ऽ': ("'", "'"),
+    '।': ('|', '|'), '॥': ('||', '||'), 'ॐ': ('oṃ', 'om'),
+    '़': ('', ''), '\u200c': ('', ''), '\u200d': ('', ''),
+}
+
+# Deletes the inherent "a" emitted just before it (see module docstring)
+_KILL_A = '\x01'
+_KILLED_A = 'a' + _KILL_A
+_CHUNK_SEPARATOR = '\x00'
+
+SCHEMES = ('iast', 'ascii')
+
+# Conjuncts whose romanization is not the concatenation of their letters,
+# rewritten after the table pass: (translated, dataset spelling) per scheme
+_REVERSE_CONJUNCTS = {
+    'iast': (),
+    'ascii': (('chchh', 'cch'),),  # च्छ: "gacchati", not "gachchhati"
+}
+
+
+def _compile_reverse_table(column: int) -> Dict[int, str]:
+    """Build the ``str.translate`` table for one output scheme."""
+    table = {}
+    for char, romans in _DEVANAGARI_CONSONANTS.items():
+        table[ord(char)] = romans[column] + 'a'
+    for (independent, matra), romans in _DEVANAGARI_VOWELS.items():
+        table[ord(independent)] = romans[column]
+        if matra is not None:
+            table[ord(matra)] = _KILL_A + romans[column]
+    for char, romans in _DEVANAGARI_OTHER.items():
+        table[ord(char)] = romans[column]
+    table[ord(VIRAMA)] = _KILL_A
+    for digit in range(10):
+        table[0x0966 + digit] = str(digit)
+    return table
+
+
+_REVERSE_TABLES = {scheme: _compile_reverse_table(column) for column, scheme in enumerate(SCHEMES)}
+
+
+def _translate(text: str, scheme: str) -> str:
+    """Apply one scheme's table, the inherent-"a" markers and its conjuncts."""
+    text = text.translate(_REVERSE_TABLES[scheme]).replace(_KILLED_A, '').replace(_KILL_A, '')
+    for translated, spelling in _REVERSE_CONJUNCTS[scheme]:
+        text = text.replace(translated, spelling)
+    return text
+
+
+def _reverse_table(scheme: str) -> Dict[int, str]:
+    try:
+        return _REVERSE_TABLES[scheme]
+    except KeyError:
+        raise ValueError(f"Unknown scheme {scheme!r}; expected one of {SCHEMES}") from None
+
+
+def from_devanagari(text: str, scheme: str = 'iast') -> str:
+    """
+    Transliterate Devanagari to romanized Sanskrit.
+
+    Args:
+        text: Devanagari text (e.g. "रामः गृहं गच्छति")
+        scheme: "iast" (default) or "ascii" for the loose dataset spelling
+
+    Returns:
+        Romanized text; characters outside Devanagari pass through
+
+    Example:
+        >>> from_devanagari("रामः गृहं गच्छति")
+        'rāmaḥ gṛhaṃ gacchati'
+    """
+    _reverse_table(scheme)
+    return _translate(text, scheme)
+
+
+def _from_devanagari_chunk(args: Tuple[List[str], str]) -> List[str]:
+    """
+    Worker entry point: convert one chunk of lines.
+
+    The chunk is joined into a single string so translate/replace run once
+    per chunk instead of once per line.
+    """
+    lines, scheme = args
+    joined = _CHUNK_SEPARATOR.join(lines)
+    if joined.count(_CHUNK_SEPARATOR) != len(lines) - 1:
+        return [_translate(line, scheme) for line in lines]
+    return _translate(joined, scheme).split(_CHUNK_SEPARATOR)
+
+
+def _chunks(texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_from_devanagari(texts: Iterable[str], scheme: str = 'iast',
+                         workers: Optional[int] = None,
+                         chunk_size: int = 50000) -> Iterator[str]:
+    """
+    Lazily transliterate a large corpus of Devanagari lines, in order.
+
+    Lines are grouped into chunks; with ``workers`` > 1 the chunks are
+    converted in a process pool with a bounded number in flight, so memory
+    stays proportional to ``workers * chunk_size`` lines.
+
+    Args:
+        texts: Iterable of Devanagari strings (e.g. an open file)
+        scheme: "iast" or "ascii"
+        workers: Worker processes; None or 1 converts in-process
+        chunk_size: Lines per chunk
+
+    Returns:
+        Iterator over romanized strings in input order
+    """
+    _reverse_table(scheme)
+    chunks = ((chunk, scheme) for chunk in _chunks(texts, chunk_size))
+
+    if not workers or workers <= 1:
+        for chunk in chunks:
+            yield from _from_devanagari_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_from_devanagari_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def from_devanagari_batch(texts: Iterable[str], scheme: str = 'iast',
+                          workers: Optional[int] = None,
+                          chunk_size: int = 50000) -> List[str]:
+    """
+    Transliterate many Devanagari strings.
+
+    Args:
+        texts: Devanagari strings
+        scheme: "iast" or "ascii"
+        workers: Worker processes for parallel chunks (None converts in-process)
+        chunk_size: Lines per chunk
+
+    Returns:
+        List of romanized strings in input order
+    """
+    return list(iter_from_devanagari(texts, scheme, workers, chunk_size))
@@ -0,0 +1,393 @@
+"""
+Sandhi Service Module
+
+Local asyncio JSON service around the Sandhi engine, so downstream tools
+share one warm process instead of each calling it in-process item by item.
+
+Endpoints (``POST`` with a JSON object, or a list of objects for a bulk call):
+
+- ``/sandhi``: ``{"word1", "word2"}`` -> ``{"result"}``
+- ``/split``: ``{"word"}`` -> ``{"splits": [[word1, word2], ...]}``
+- ``/validate``: ``{"word1", "word2", "expected"}`` -> ``{"valid", "result"}``
+- ``GET /health``: request, batch and cache counters
+
+Single requests arriving within ``max_delay`` seconds of each other are
+micro-batched into one bulk engine call, and every call goes through one
+shared LRU cache of rule results. The server speaks minimal HTTP/1.1 with
+keep-alive over TCP or a Unix socket; ``SandhiClient`` is the matching
+keep-alive client used by the load generator and tests.
+"""
+
+import asyncio
+import json
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from generator.sandhi_generator import SandhiGenerator
+
+
+MAX_BODY = 1 << 20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large"}
+
+
+class SandhiEngine:
+    """
+    Bulk Sandhi operations behind a shared LRU cache.
+
+    Example:
+        >>> engine = SandhiEngine()
+        >>> engine.run("sandhi", [{"word1": "Rama", "word2": "iti"}])
+        [{'result': 'Rameti'}]
+    """
+
+    def __init__(self, generator: Optional[SandhiGenerator] = None, cache_size: int = 65536):
+        """
+        Wrap a generator.
+
+        Args:
+            generator: Rule source (defaults to ``SandhiGenerator()``)
+            cache_size: Cached results per operation
+        """
+        self.generator = generator or SandhiGenerator()
+        self._apply = lru_cache(maxsize=cache_size)(self.generator.apply_sandhi)
+        self._split = lru_cache(maxsize=cache_size)(
+            lambda word: [list(pair) for pair in self.generator.split_sandhi(word)])
+        self.operations: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "sandhi": self._sandhi,
+            "split": self._split_word,
+            "validate": self._validate,
+        }
+
+    def _sandhi(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": self._apply(item["word1"], item["word2"])}
+
+    def _split_word(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {"splits": self._split(item["word"])}
+
+    def _validate(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        result = self._apply(item["word1"], item["word2"])
+        return {"valid": result == item["expected"], "result": result}
+
+    def run(self, operation: str, items: Sequence[Any]) -> List[Dict[str, Any]]:
+        """
+        Run one operation over many items.
+
+        A bad item yields ``{"error": ...}`` in its slot instead of failing
+        the batch.
+        """
+        handler = self.operations[operation]
+        results = []
+        for item in items:
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError("item must be a JSON object")
+                results.append(handler(item))
+            except KeyError as e:
+                results.append({"error": f"missing field {e.args[0]!r}"})
+            except (TypeError, ValueError) as e:
+                results.append({"error": str(e)})
+        return results
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Hits, misses and size of each cache."""
+        return {name: {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+                for name, info in (("sandhi", self._apply.cache_info()), ("split", self._split.cache_info()))}
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single requests into bulk calls.
+
+    The first request of a batch waits at most ``max_delay`` seconds for
+    company; a batch is flushed early once it reaches ``max_batch`` items.
+    """
+
+    def __init__(self, handler: Callable[[List[Any]], List[Any]], max_batch: int = 64,
+                 max_delay: float = 0.002):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.items = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the batching task on the running loop."""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the batching task."""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            self.items += len(batch)
+            try:
+                results = self.handler([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class SandhiService:
+    """
+    HTTP/1.1 keep-alive JSON server over TCP or a Unix socket.
+
+    Example:
+        >>> service = SandhiService()
+        >>> server = await service.start(port=8765)
+        >>> async with SandhiClient(port=8765) as client:
+        ...     await client.post("/sandhi", {"word1": "Rama", "word2": "iti"})
+        (200, {'result': 'Rameti'})
+    """
+
+    def __init__(self, engine: Optional[SandhiEngine] = None, max_batch: int = 64,
+                 max_delay: float = 0.002):
+        """
+        Configure the service.
+
+        Args:
+            engine: Shared engine (defaults to ``SandhiEngine()``)
+            max_batch: Largest micro-batch
+            max_delay: Seconds a request may wait for a batch to fill
+        """
+        self.engine = engine or SandhiEngine()
+        self.batchers = {
+            operation: MicroBatcher(lambda items, operation=operation: self.engine.run(operation, items),
+                                    max_batch, max_delay)
+            for operation in self.engine.operations
+        }
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+        """Start listening (on ``unix_path`` if given, else TCP)."""
+        for batcher in self.batchers.values():
+            batcher.start()
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._serve, path=unix_path)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server
+
+    async def stop(self):
+        """Close the listener and stop batching."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for batcher in self.batchers.values():
+            await batcher.stop()
+
+    def health(self) -> Dict[str, Any]:
+        """Service counters."""
+        batches = sum(b.batches for b in self.batchers.values())
+        items = sum(b.items for b in self.batchers.values())
+        return {
+            "status": "ok",
+            "requests": self.requests,
+            "batches": batches,
+            "mean_batch": items / batches if batches else 0.0,
+            "cache": self.engine.cache_info(),
+        }
+
+    async def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        """Route one request; returns ``(status, JSON body)``."""
+        if path == "/health":
+            return 200, self.health()
+        operation = path.strip("/")
+        if operation not in self.batchers:
+            return 404, {"error": f"unknown endpoint {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        try:
+            payload = json.loads(body or b"null")
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+        self.requests += 1
+        if isinstance(payload, list):
+            return 200, self.engine.run(operation, payload)
+        result = await self.batchers[operation].submit(payload)
+        return (400 if "error" in result else 200), result
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await _write_response(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY:
+                    await _write_response(writer, 413, {"error": "request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, response = await self.handle(method.upper(), target.split("?", 1)[0], body)
+                await _write_response(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionResetError, BrokenPipeError):
+                pass
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+class SandhiClient:
+    """
+    Minimal keep-alive JSON client for ``SandhiService``.
+
+    One client is one connection; requests on it are sequential.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self):
+        """Open the connection."""
+        if self.unix_path:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        """Send one request; returns ``(status, decoded JSON body)``."""
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self._writer.write(head.encode('latin-1') + body)
+        await self._writer.drain()
+
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self._reader.readexactly(length))
+
+    async def post(self, path: str, payload: Any) -> Tuple[int, Any]:
+        """POST a JSON payload."""
+        return await self.request("POST", path, payload)
+
+    async def close(self):
+        """Close the connection."""
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionResetError, BrokenPipeError):
+                pass
+
+    async def __aenter__(self) -> "SandhiClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+async def run_load(client_factory: Callable[[], SandhiClient], payloads: Sequence[Tuple[str, Any]],
+                   concurrency: int = 32) -> Dict[str, float]:
+    """
+    Replay ``(path, payload)`` requests over ``concurrency`` keep-alive connections.
+
+    Returns:
+        ``requests``, ``seconds``, ``rps``, ``p50_ms``, ``p99_ms`` and ``errors``
+    """
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker(share: Sequence[Tuple[str, Any]]):
+        nonlocal errors
+        async with client_factory() as client:
+            for path, payload in share:
+                start = time.perf_counter()
+                status, _ = await client.post(path, payload)
+                latencies.append(time.perf_counter() - start)
+                errors += status != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(payloads[i::concurrency]) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        return latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "errors": errors,
+    }
@@ -0,0 +1,211 @@
+"""
+Token Mask Module
+
+Allowed-token sets for grammar-constrained decoding (the "Panini Shim" of
+``docs/NEURO_SYMBOLIC_ARCHITECTURE.md``): at each step the model may only
+emit tokens that keep the output a sequence of valid Sanskrit forms.
+
+- The valid-form lexicon (Stage 1 paradigm forms plus ``SandhiGenerator``
+  junction forms) is compiled into a byte trie; the output language is
+  ``form (separator form)*``, optionally ending in EOS after a whole form.
+- The tokenizer vocabulary is compiled into a second trie over the tokens'
+  UTF-8 bytes. Walking both tries together from a decoding state visits only
+  token prefixes the lexicon accepts, so an allowed set costs time
+  proportional to its size rather than to the vocabulary, and is cached per
+  state along with each allowed token's successor state.
+
+A decoding state is a plain ``int``, so every beam keeps its own state and
+forking a beam is free. Working on bytes means byte-level tokenizers
+(``ByteTokenizer``, byte-level BPE) are supported as well as string vocabularies.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from auditor.form_index import iter_analyses
+from dataset.token_store import ByteTokenizer
+from generator.sandhi_generator import SandhiGenerator
+
+
+# Decoding state after EOS
+DONE = -1
+
+Token = Optional[Union[bytes, str]]
+
+
+def compile_forms(rows: Iterable[Mapping[str, Any]] = (),
+                  sandhi_pairs: Iterable[Tuple[str, str]] = (),
+                  sandhi: Optional[SandhiGenerator] = None) -> List[str]:
+    """
+    Valid-form lexicon from generator output.
+
+    Args:
+        rows: Stage 1 paradigm rows (their verb and noun ``output`` forms)
+        sandhi_pairs: Word pairs whose members and sandhi-joined form are valid
+        sandhi: Generator applying the junction rules (defaults to ``SandhiGenerator()``)
+
+    Returns:
+        Sorted distinct forms
+    """
+    forms = {form for form, _ in iter_analyses(rows)}
+    sandhi_pairs = list(sandhi_pairs)
+    if sandhi_pairs:
+        sandhi = sandhi or SandhiGenerator()
+        for word1, word2 in sandhi_pairs:
+            forms.update((word1, word2, sandhi.apply_sandhi(word1, word2)))
+    return sorted(form for form in forms if form)
+
+
+def token_bytes(tokenizer: Any) -> List[Optional[bytes]]:
+    """
+    UTF-8 bytes of every token ID (``None`` for special tokens).
+
+    ``ByteTokenizer`` ids map to single bytes; other tokenizers must decode
+    each ID on its own (true for plain string vocabularies) and may list
+    special IDs in ``all_special_ids``.
+    """
+    if isinstance(tokenizer, ByteTokenizer):
+        return [bytes([i]) for i in range(256)] + [None] * (tokenizer.vocab_size - 256)
+    special = set(getattr(tokenizer, "all_special_ids", ()))
+    for name in ("pad_token_id", "eos_token_id", "bos_token_id"):
+        if getattr(tokenizer, name, None) is not None:
+            special.add(getattr(tokenizer, name))
+    return [None if i in special else tokenizer.decode([i]).encode('utf-8')
+            for i in range(tokenizer.vocab_size)]
+
+
+class _ByteTrie:
+    """Trie over byte strings with per-node payload lists."""
+
+    def __init__(self):
+        self.children: List[Dict[int, int]] = [{}]
+        self.payload: List[List[int]] = [[]]
+
+    def insert(self, data: bytes, value: int):
+        node = 0
+        for byte in data:
+            child = self.children[node].get(byte)
+            if child is None:
+                child = len(self.children)
+                self.children[node][byte] = child
+                self.children.append({})
+                self.payload.append([])
+            node = child
+        self.payload[node].append(value)
+
+
+class TokenMaskGenerator:
+    """
+    Per-step allowed token IDs for decoding valid Sanskrit forms.
+
+    Example:
+        >>> masks = TokenMaskGenerator(["gacchati", "gacchanti", "Baalah"], tokenizer)
+        >>> state = masks.start()
+        >>> allowed = masks.allowed(state)            # token IDs
+        >>> state = masks.advance(state, allowed[0])  # per beam
+        >>> masks.is_complete(state)
+    """
+
+    def __init__(self, forms: Iterable[str], vocab: Union[Sequence[Token], Any],
+                 eos_token_id: Optional[int] = None, separator: str = " "):
+        """
+        Compile the lexicon and vocabulary tries.
+
+        Args:
+            forms: Valid forms (e.g. from ``compile_forms``)
+            vocab: Token ID to its text or bytes (``None`` for special
+                   tokens), or a tokenizer accepted by ``token_bytes``
+            eos_token_id: Allowed after a complete form; defaults to the
+                          tokenizer's ``eos_token_id`` when one is given
+            separator: Text between forms
+
+        Raises:
+            ValueError: If a form contains the separator or no forms are given
+        """
+        if not isinstance(vocab, Sequence):
+            if eos_token_id is None:
+                eos_token_id = getattr(vocab, "eos_token_id", None)
+            vocab = token_bytes(vocab)
+        self.eos_token_id = eos_token_id
+        self.separator = separator.encode('utf-8')
+        if len(self.separator) != 1:
+            raise ValueError("separator must encode to a single byte")
+
+        self._lexicon = _ByteTrie()
+        for form in forms:
+            if separator in form:
+                raise ValueError(f"Form {form!r} contains the separator")
+            self._lexicon.insert(form.encode('utf-8'), 1)
+        if not self._lexicon.children[0]:
+            raise ValueError("No valid forms given")
+        self._final = [bool(values) for values in self._lexicon.payload]
+
+        self.vocab_size = len(vocab)
+        self._tokens = _ByteTrie()
+        for token_id, token in enumerate(vocab):
+            if token_id == eos_token_id or token is None:
+                continue
+            data = token.encode('utf-8') if isinstance(token, str) else bytes(token)
+            if data:
+                self._tokens.insert(data, token_id)
+        self._cache: Dict[int, Tuple[Tuple[int, ...], Dict[int, int]]] = {}
+
+    def start(self) -> int:
+        """State before the first token."""
+        return 0
+
+    def _step(self, state: int, byte: int) -> int:
+        """Lexicon automaton transition on one byte (``DONE`` if invalid)."""
+        if byte == self.separator[0]:
+            return 0 if self._final[state] else DONE
+        return self._lexicon.children[state].get(byte, DONE)
+
+    def _compute(self, state: int) -> Tuple[Tuple[int, ...], Dict[int, int]]:
+        successors: Dict[int, int] = {}
+        if state != DONE:
+            token_children, token_ids = self._tokens.children, self._tokens.payload
+            stack = [(child, self._step(state, byte)) for byte, child in token_children[0].items()]
+            while stack:
+                node, current = stack.pop()
+                if current == DONE:
+                    continue
+                for token_id in token_ids[node]:
+                    successors[token_id] = current
+                stack.extend((child, self._step(current, byte)) for byte, child in token_children[node].items())
+            if self.eos_token_id is not None and self._final[state]:
+                successors[self.eos_token_id] = DONE
+        return tuple(sorted(successors)), successors
+
+    def allowed(self, state: int) -> Tuple[int, ...]:
+        """Sorted token IDs allowed in ``state``."""
+        entry = self._cache.get(state)
+        if entry is None:
+            entry = self._cache[state] = self._compute(state)
+        return entry[0]
+
+    def allowed_batch(self, states: Sequence[int]) -> List[Tuple[int, ...]]:
+        """Allowed token IDs for every beam."""
+        return [self.allowed(state) for state in states]
+
+    def advance(self, state: int, token_id: int) -> int:
+        """
+        State after emitting ``token_id``.
+
+        Raises:
+            ValueError: If the token is not allowed in ``state``
+        """
+        self.allowed(state)
+        successor = self._cache[state][1].get(token_id)
+        if successor is None:
+            raise ValueError(f"Token {token_id} is not allowed in state {state}")
+        return successor
+
+    def is_complete(self, state: int) -> bool:
+        """True if the text so far ends with a whole valid form (or EOS)."""
+        return state == DONE or self._final[state]
+
+    def mask(self, state: int) -> List[bool]:
+        """Boolean mask over the vocabulary (``True`` = allowed)."""
+        mask = [False] * self.vocab_size
+        for token_id in self.allowed(state):
+            mask[token_id] = True
+        return mask
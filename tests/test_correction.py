@@ -0,0 +1,110 @@
+"""
+Test cases for Correction Candidates Module
+
+Tests bounded edit distance and SymSpell-style candidate lookup.
+"""
+
+import random
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.correction import CorrectionIndex, levenshtein
+
+
+ROWS = [
+    {"output": "Ramah", "pratipadika": "Rama", "case": "Nominative", "number": "Singular",
+     "gender": "masculine", "rules_applied": ["2.3.46"]},
+    {"output": "Ramam", "pratipadika": "Rama", "case": "Accusative", "number": "Singular",
+     "gender": "masculine", "rules_applied": ["2.3.2"]},
+    {"output": "Ramaena", "pratipadika": "Rama", "case": "Instrumental", "number": "Singular",
+     "gender": "masculine", "rules_applied": ["2.3.18"]},
+    {"output": "gacchati", "root": "√gam", "tense": "Present", "person": 3, "number": "Singular",
+     "rules_applied": ["3.1.68"]},
+    {"output": "gacchanti", "root": "√gam", "tense": "Present", "person": 3, "number": "Plural",
+     "rules_applied": ["3.1.68"]},
+]
+
+
+@pytest.fixture
+def index():
+    """Index over ROWS."""
+    return CorrectionIndex().fit(ROWS)
+
+
+class TestLevenshtein:
+    """Test suite for the bounded edit distance."""
+
+    def test_distances(self):
+        """Test insertions, deletions and substitutions."""
+        assert levenshtein("kitten", "sitting") == 3
+        assert levenshtein("", "abc") == 3
+        assert levenshtein("same", "same") == 0
+
+    def test_bound(self):
+        """Test that exceeding the bound returns bound + 1."""
+        assert levenshtein("kitten", "sitting", max_distance=1) == 2
+        assert levenshtein("a", "abcdef", max_distance=2) == 3
+
+
+class TestCorrectionIndex:
+    """Test suite for correction candidates."""
+
+    def test_exact_form_first(self, index):
+        """Test that a valid form is its own best candidate."""
+        best = index.suggest("gacchati")[0]
+        assert best["form"] == "gacchati"
+        assert best["distance"] == 0
+
+    def test_misspelled_form(self, index):
+        """Test the nearest form for a misspelling."""
+        suggestions = index.suggest("gacchanto", k=2)
+        assert suggestions[0]["form"] == "gacchanti"
+        assert suggestions[0]["distance"] == 1
+
+    def test_feature_filters(self, index):
+        """Test restricting candidates by case and lemma."""
+        nominative = index.suggest("Ramena", case="nominative")
+        assert [s["form"] for s in nominative] == ["Ramah"]
+        assert nominative[0]["analyses"][0]["features"]["case"] == "Nominative"
+        assert index.suggest("Ramena", lemma="√gam") == []
+
+    def test_devanagari_query(self, index):
+        """Test that Devanagari queries hit romanized forms."""
+        assert index.suggest("रामम्", k=1)[0]["form"] == "Ramam"
+
+    def test_matches_brute_force(self):
+        """Test that lookups equal a linear scan on random perturbations."""
+        rng = random.Random(3)
+        alphabet = "aiukgtpnmrsv"
+        rows = [{"output": "".join(rng.choice(alphabet) for _ in range(rng.randint(3, 12))),
+                 "pratipadika": f"base{i}", "case": "Nominative"} for i in range(400)]
+        index = CorrectionIndex(max_distance=2, prefix_length=5).fit(rows)
+        for row in rows[:30]:
+            word = list(row["output"])
+            for _ in range(rng.randint(0, 2)):
+                position = rng.randrange(len(word))
+                if rng.random() < 0.5:
+                    word[position] = rng.choice(alphabet)
+                else:
+                    del word[position]
+            query = "".join(word) or "a"
+            for k in (1, 3, 50):
+                fast = [(s["distance"], s["key"]) for s in index.suggest(query, k=k)]
+                slow = [(s["distance"], s["key"]) for s in index.brute_force(query, k=k)]
+                assert fast == slow
+
+    def test_invalid_configuration(self, index):
+        """Test configuration and lookup bounds."""
+        with pytest.raises(ValueError):
+            CorrectionIndex(max_distance=3, prefix_length=3)
+        with pytest.raises(ValueError, match="limited to 2"):
+            index.suggest("Ramah", max_distance=3)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
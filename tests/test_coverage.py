@@ -0,0 +1,120 @@
+"""
+Test cases for Coverage Selection Module
+
+Tests feature extraction and greedy bitset set cover.
+"""
+
+import json
+from itertools import combinations
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.coverage import CoverageSelector, row_features, select_jsonl
+from generator.karaka_generator import KarakaSentenceGenerator
+from generator.sandhi_generator import SandhiGenerator
+
+
+TOY_DATASET = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+
+
+class TestRowFeatures:
+    """Test suite for row_features."""
+
+    def test_verb_row(self):
+        """Test sutra and paradigm-cell features of a Stage 1 verb row."""
+        row = {"root": "√gam", "tense": "Present", "person": 3, "number": "Singular",
+               "rules_applied": ["3.4.78", "3.1.68"]}
+        assert row_features(row) == ["sutra:3.4.78", "sutra:3.1.68", "verb:√gam|Present|3|Singular"]
+
+    def test_noun_and_sandhi_rows(self):
+        """Test noun cells and sandhi junction classes."""
+        noun = {"pratipadika": "deva", "case": "Nominative", "number": "Singular", "gender": "Masculine"}
+        assert row_features(noun) == ["noun:deva|Nominative|Singular|Masculine"]
+        sandhi = {"instruction": "Apply Sandhi rules to combine these Sanskrit words.",
+                  "input": "Deva + Alaya", "output": "Devalaya"}
+        assert row_features(sandhi) == ["sandhi:a+a"]
+        assert row_features({"word1": "Rama", "word2": "Mandira"}) == ["sandhi:a+C"]
+
+    def test_sandhi_dict_row_rule_string(self):
+        """Test that a rules_applied string is a single rule, not its characters."""
+        row = SandhiGenerator().generate_training_pairs([("Deva", "Alaya")], "dict")[0]
+        assert row["rules_applied"] == "sandhi"
+        assert row_features(row) == ["sutra:sandhi", "sandhi:a+a"]
+
+    def test_karaka_row(self):
+        """Test karaka role/case features."""
+        row = KarakaSentenceGenerator()[0]
+        assert row_features(row) == ["karaka:karta|nominative"]
+
+
+class TestCoverageSelector:
+    """Test suite for CoverageSelector."""
+
+    def test_full_cover_of_toy_dataset(self):
+        """Test that the selection covers every feature with fewer rows."""
+        with open(TOY_DATASET, 'r', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        selector = CoverageSelector(k=1).fit(rows)
+        selected = selector.select()
+        report = selector.report(selected)
+        assert report["coverage"] == 1.0
+        assert len(selected) < len(rows)
+        covered = {feature for index in selected for feature in row_features(rows[index])}
+        assert covered == {feature for row in rows for feature in row_features(row)}
+
+    def test_k_examples_per_feature(self):
+        """Test that each feature gets k examples when enough exist."""
+        rows = [{"rules_applied": ["1.1.1"]}] * 5 + [{"rules_applied": ["1.1.2"]}]
+        selector = CoverageSelector(k=3).fit(rows)
+        selected = selector.select()
+        assert selected == [0, 1, 2, 5]
+        assert selector.report(selected)["kinds"]["sutra"] == {"features": 2, "satisfied": 2}
+
+    def test_greedy_prefers_wide_rows(self):
+        """Test that a row covering many features beats several narrow ones."""
+        rows = [{"rules_applied": [rule]} for rule in "abcd"]
+        rows.append({"rules_applied": list("abcd")})
+        assert CoverageSelector().fit(rows).select() == [4]
+
+    def test_near_optimal_on_small_instance(self):
+        """Test that greedy stays close to the brute-force optimum."""
+        rows = [{"rules_applied": list(rules)} for rules in
+                ["abc", "cde", "efg", "ghi", "adg", "beh", "cfi", "ab", "hi"]]
+        selector = CoverageSelector().fit(rows)
+        greedy = selector.select()
+        optimum = next(size for size in range(1, len(rows) + 1)
+                       if any(selector.report(list(c))["coverage"] == 1.0
+                              for c in combinations(range(len(rows)), size)))
+        assert selector.report(greedy)["coverage"] == 1.0
+        assert len(greedy) <= optimum + 1
+
+    def test_partial_target_and_weights(self):
+        """Test that a partial target stops early, favouring heavy features."""
+        rows = [{"rules_applied": ["x"]}, {"rules_applied": ["y"]}, {"rules_applied": ["z"]}]
+        selector = CoverageSelector(target=0.5, weights={"sutra:z": 4.0}).fit(rows)
+        assert selector.select() == [2]
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            CoverageSelector(k=0)
+        with pytest.raises(ValueError):
+            CoverageSelector(target=1.5)
+
+    def test_select_jsonl(self, tmp_path):
+        """Test that the selected subset is written in source order."""
+        output = tmp_path / "selected.jsonl"
+        report = select_jsonl(TOY_DATASET, output)
+        with open(output, 'r', encoding='utf-8') as f:
+            ids = [json.loads(line)["id"] for line in f]
+        assert len(ids) == report["selected"]
+        assert ids == sorted(ids)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,132 @@
+"""
+Test cases for DAWG Lexicon Module
+
+Tests minimal automaton construction, perfect hashing and mmap queries.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.dawg import DawgBuilder, DawgLexicon, compile_lexicon
+from auditor.form_index import form_key
+
+
+ROWS = [
+    {"output": "gacchati", "root": "√gam", "tense": "Present", "person": 3, "number": "Singular",
+     "rules_applied": ["3.1.68", "3.1.77"], "type": "verb_conjugation"},
+    {"output": "gacchanti", "root": "√gam", "tense": "Present", "person": 3, "number": "Plural",
+     "rules_applied": ["3.1.68"], "type": "verb_conjugation"},
+    {"output": "pathati", "root": "√path", "tense": "Present", "person": 3, "number": "Singular",
+     "rules_applied": ["3.1.68", "3.1.77"], "type": "verb_conjugation"},
+    {"output": "Griham", "pratipadika": "Griha", "case": "Nominative", "number": "Singular",
+     "gender": "neuter", "rules_applied": ["2.3.46"], "type": "noun_declension"},
+    {"output": "Griham", "pratipadika": "Griha", "case": "Accusative", "number": "Singular",
+     "gender": "neuter", "rules_applied": ["2.3.2"], "type": "noun_declension"},
+    {"input": "The boy reads", "output": "Baalah pathati", "stage": "karaka"},
+]
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    """Compile and open a lexicon over ROWS."""
+    path = tmp_path / "lexicon.dawg"
+    stats = compile_lexicon(ROWS, path, chunk_size=2)
+    assert stats["words"] == 4
+    with DawgLexicon(path) as opened:
+        yield opened
+
+
+class TestDawgBuilder:
+    """Test suite for incremental minimization."""
+
+    def test_shared_suffixes_are_merged(self):
+        """Test that words differing only in their first letter share a tail."""
+        builder = DawgBuilder()
+        for i, word in enumerate(["bati", "cati", "dati"]):
+            builder.add(word, [(i, 0)])
+        arrays = builder.finish()
+        # root, then a single shared "ati" chain: 5 states, 3 + 3 arcs
+        assert len(arrays["final"]) == 5
+        assert len(arrays["labels"]) == 6
+        assert arrays["value_offsets"].tolist() == [0, 1, 2, 3]
+        assert arrays["value_ids"].tolist() == [0, 0, 1, 0, 2, 0]
+        assert builder.words == 3
+
+    def test_requires_sorted_unique_words(self):
+        """Test that out-of-order and duplicate words are rejected."""
+        builder = DawgBuilder()
+        builder.add("b", [(0, 0)])
+        with pytest.raises(ValueError, match="sorted order"):
+            builder.add("a", [(0, 0)])
+        with pytest.raises(ValueError, match="sorted order"):
+            builder.add("b", [(0, 0)])
+        with pytest.raises(ValueError, match="empty"):
+            builder.add("", [(0, 0)])
+
+
+class TestDawgLexicon:
+    """Test suite for mmap lexicon queries."""
+
+    def test_membership(self, lexicon):
+        """Test romanized and Devanagari membership."""
+        assert len(lexicon) == 4
+        assert "gacchati" in lexicon
+        assert "गच्छति" in lexicon
+        assert "gacchat" not in lexicon
+        assert "Ramena" not in lexicon
+
+    def test_analyses(self, lexicon):
+        """Test that lemma and tag tables decode to full analyses."""
+        assert lexicon.analyses("gacchati") == [{
+            "lemma": "√gam",
+            "features": {"pos": "verb", "tense": "Present", "person": 3, "number": "Singular"},
+            "sutras": ["3.1.68", "3.1.77"],
+        }]
+        assert sorted(a["features"]["case"] for a in lexicon.analyses("griham")) == ["Accusative", "Nominative"]
+        assert lexicon.analyses("Ramena") == []
+
+    def test_shared_tags(self, lexicon):
+        """Test that identical feature bundles share one tag ID."""
+        (_, gam_tag), = lexicon.analysis_ids("gacchati")
+        (_, path_tag), = lexicon.analysis_ids("pathati")
+        assert gam_tag == path_tag
+        assert len(lexicon.lemmas) == 3
+
+    def test_index_is_sorted_rank(self, lexicon):
+        """Test that ranks form a perfect hash in key order."""
+        keys = sorted(form_key(form) for form in ["gacchati", "gacchanti", "pathati", "griham"])
+        assert [lexicon.index(key) for key in keys] == [0, 1, 2, 3]
+        assert lexicon.index("ga") == -1
+
+    def test_complete_prefix(self, lexicon):
+        """Test prefix completion from a romanized prefix."""
+        assert list(lexicon.complete("gacch")) == sorted([form_key("gacchati"), form_key("gacchanti")])
+        assert list(lexicon.complete("gacch", limit=1)) == [sorted([form_key("gacchati"), form_key("gacchanti")])[0]]
+        assert list(lexicon.complete("x")) == []
+        assert len(list(lexicon.complete(""))) == 4
+
+    def test_many_forms(self, tmp_path):
+        """Test perfect hashing and lookups over a larger generated set."""
+        rows = [{"output": f"rama{i}", "pratipadika": f"base{i % 7}", "case": "Nominative"}
+                for i in range(500)]
+        path = tmp_path / "many.dawg"
+        compile_lexicon(rows, path, chunk_size=64)
+        with DawgLexicon(path) as many:
+            assert len(many) == 500
+            assert sorted(many.index(f"rama{i}") for i in range(500)) == list(range(500))
+            assert all(many.analyses(f"rama{i}")[0]["lemma"] == f"base{i % 7}" for i in range(0, 500, 13))
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a non-lexicon file raises ValueError."""
+        path = tmp_path / "bogus.dawg"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="not a DAWG lexicon"):
+            DawgLexicon(path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
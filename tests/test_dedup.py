@@ -0,0 +1,162 @@
+"""
+Test cases for Deduplication Module
+
+Tests exact and MinHash/LSH near-duplicate removal over JSONL shards.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.dedup import Deduplicator, MinHasher, content_hash
+from generator.sandhi_generator import SandhiGenerator
+
+
+def write_jsonl(path, rows):
+    """Write rows as JSONL."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    return path
+
+
+def read_jsonl(path):
+    """Read JSONL rows."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+class TestHashing:
+    """Test suite for content hashes and MinHash."""
+
+    def test_content_hash_normalizes(self):
+        """Test that case and whitespace differences hash identically."""
+        a = {"instruction": "Translate", "input": "The boy  reads", "output": "Baalah pathati"}
+        b = {"instruction": "translate", "input": "the boy reads ", "output": "BAALAH pathati"}
+        assert content_hash(a) == content_hash(b)
+        assert content_hash(a) != content_hash({**a, "output": "Baalah likhati"})
+
+    def test_minhash_estimates_jaccard(self):
+        """Test that signatures of similar strings mostly agree."""
+        hasher = MinHasher(num_perm=128)
+        base = hasher.signature("baalah pustakam pathati gruhe")
+        assert MinHasher.similarity(base, hasher.signature("baalah pustakam pathati gruhe")) == 1.0
+        assert MinHasher.similarity(base, hasher.signature("baalaah pustakam pathati gruhe")) > 0.6
+        assert MinHasher.similarity(base, hasher.signature("ramah vanam gacchati")) < 0.2
+        # Shared suffixes must not dominate every permutation's minimum
+        assert MinHasher.similarity(hasher.signature("marjarah shayati"), hasher.signature("stri gayati")) < 0.3
+
+    def test_invalid_bands(self):
+        """Test that bands must divide the signature length."""
+        with pytest.raises(ValueError):
+            Deduplicator(num_perm=64, bands=10)
+        with pytest.raises(ValueError, match="window"):
+            Deduplicator(window=0)
+
+
+class TestNearDuplicateClustering:
+    """Test suite for LSH bucket comparisons and clustering."""
+
+    def test_pairs_not_involving_the_bucket_head(self):
+        """Test that two similar bucket members are merged even if the head differs."""
+        shared = np.arange(4, dtype=np.uint32)
+        signatures = np.array([
+            np.r_[shared, np.arange(100, 112)],
+            np.r_[shared, np.arange(200, 212)],
+            np.r_[shared, np.arange(200, 211), 999],
+        ], dtype=np.uint32)
+        deduplicator = Deduplicator(threshold=0.8, num_perm=16, bands=4)
+        near = deduplicator._near_duplicates(signatures, np.arange(3))
+        assert near.tolist() == [2]
+
+    def test_transitive_clusters_keep_first_row(self):
+        """Test that chained similar rows form one cluster kept by its earliest row."""
+        rng = np.random.default_rng(0)
+        base = rng.integers(0, 1 << 30, size=64).astype(np.uint32)
+        signatures = np.tile(base, (40, 1))
+        signatures[::2, -4:] = rng.integers(0, 1 << 30, size=(20, 4))
+        signatures[5] = rng.integers(0, 1 << 30, size=64)
+        deduplicator = Deduplicator(window=2)
+        near = deduplicator._near_duplicates(signatures, np.arange(40))
+        assert near.tolist() == [i for i in range(1, 40) if i != 5]
+
+
+class TestDeduplicator:
+    """Test suite for Deduplicator."""
+
+    def test_sandhi_cycling_duplicates(self, tmp_path):
+        """Test that cycled Sandhi pairs collapse to unique rows."""
+        source = tmp_path / "sandhi.jsonl"
+        SandhiGenerator().generate_dataset(200, str(source))
+        report = Deduplicator().deduplicate([source], tmp_path / "out")
+
+        rows = read_jsonl(tmp_path / "out" / "sandhi.dedup.jsonl")
+        assert len({row["input"] for row in rows}) == len(rows) == report["kept"]
+        assert report["rows"] == 200
+        sandhi = report["stages"]["sandhi"]
+        assert sandhi["exact"] > 100
+        assert sandhi["exact"] + sandhi["near"] == report["removed"] == 200 - len(rows)
+
+    def test_near_duplicates_across_shards(self, tmp_path):
+        """Test near duplicates are removed, keeping the earliest shard's row."""
+        first = write_jsonl(tmp_path / "a.jsonl", [
+            {"input": "The boy reads the book in the house", "output": "Baalah gruhe pustakam pathati",
+             "stage": "karaka"},
+            {"input": "The king rules", "output": "Raajaa shaasati", "stage": "karaka"},
+        ])
+        second = write_jsonl(tmp_path / "b.jsonl", [
+            {"input": "A boy reads a book at home", "output": "Baalah gruhe pustakam pathati.",
+             "stage": "karaka"},
+            {"input": "Root: √gam", "output": "gacchati", "stage": "dhatupatha"},
+            {"input": "Root: √gam", "output": "gacchati", "stage": "dhatupatha"},
+            {"input": "Root: √gam plural", "output": "gacchanti", "stage": "dhatupatha"},
+        ])
+        report = Deduplicator(threshold=0.7).deduplicate([first, second], tmp_path / "out")
+
+        assert len(read_jsonl(tmp_path / "out" / "a.dedup.jsonl")) == 2
+        assert [r["output"] for r in read_jsonl(tmp_path / "out" / "b.dedup.jsonl")] == \
+            ["gacchati", "gacchanti"]
+        assert report["stages"]["karaka"] == {"rows": 3, "exact": 0, "near": 1}
+        assert report["stages"]["dhatupatha"] == {"rows": 3, "exact": 1, "near": 0}
+        assert report["removed"] == 2
+
+    def test_same_stem_shards_do_not_overwrite(self, tmp_path):
+        """Test that shards with one stem in different directories keep separate outputs."""
+        (tmp_path / "stage1").mkdir()
+        (tmp_path / "stage2").mkdir()
+        first = write_jsonl(tmp_path / "stage1" / "part.jsonl", [
+            {"input": "Root: √gam", "output": "gacchati"},
+            {"input": "Root: √path", "output": "pathati"},
+        ])
+        second = write_jsonl(tmp_path / "stage2" / "part.jsonl", [
+            {"input": "Root: √gam", "output": "gacchati"},
+            {"input": "Root: √likh", "output": "likhati"},
+        ])
+        unique = write_jsonl(tmp_path / "other.jsonl", [{"input": "Root: √vad", "output": "vadati"}])
+        report = Deduplicator().deduplicate([first, second, unique], tmp_path / "out")
+
+        out = tmp_path / "out"
+        assert report["outputs"] == [str(out / "part.0.dedup.jsonl"), str(out / "part.1.dedup.jsonl"),
+                                     str(out / "other.dedup.jsonl")]
+        written = [read_jsonl(Path(output)) for output in report["outputs"]]
+        assert [[row["output"] for row in rows] for rows in written] == \
+            [["gacchati", "pathati"], ["likhati"], ["vadati"]]
+        assert sum(len(rows) for rows in written) == report["kept"] == 4
+
+    def test_status_is_deterministic(self, tmp_path):
+        """Test that repeated runs classify rows identically."""
+        source = tmp_path / "sandhi.jsonl"
+        SandhiGenerator().generate_dataset(100, str(source))
+        first, _, _ = Deduplicator().find_duplicates([source])
+        second, _, _ = Deduplicator().find_duplicates([source])
+        assert np.array_equal(first, second)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
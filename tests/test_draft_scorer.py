@@ -0,0 +1,86 @@
+"""
+Test cases for Draft Scorer Module
+
+Tests batched rule-compliance scoring and work deduplication across drafts.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.draft_scorer import DraftScorer
+from auditor.form_index import FormIndex, build_form_index
+
+
+ROWS = [
+    {"output": "gacchati", "root": "√gam", "tense": "Present", "person": 3, "number": "Singular"},
+    {"output": "gacchanti", "root": "√gam", "tense": "Present", "person": 3, "number": "Plural"},
+    {"output": "Baalah", "pratipadika": "Baala", "case": "Nominative", "number": "Singular"},
+    {"output": "Rama", "pratipadika": "Rama", "case": "Vocative", "number": "Singular"},
+    {"output": "iti", "pratipadika": "iti", "case": "Indeclinable"},
+    {"output": "Rameti", "pratipadika": "Rama", "case": "Vocative", "number": "Singular"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Form index over ROWS."""
+    path = tmp_path / "forms.bin"
+    build_form_index(ROWS, path)
+    with FormIndex(path) as opened:
+        yield opened
+
+
+class CountingAnalyzer:
+    """Wraps an analyzer and records every token it is asked about."""
+
+    def __init__(self, analyze):
+        self.analyze = analyze
+        self.calls = []
+
+    def __call__(self, token):
+        self.calls.append(token)
+        return self.analyze(token)
+
+
+class TestDraftScorer:
+    """Test suite for the multi-draft scorer."""
+
+    def test_best_draft_and_agreement(self, index):
+        """Test that the agreeing draft wins and the other is explained."""
+        result = DraftScorer(index.lookup).score(["Baalah gacchanti", "Baalah gacchati"])
+        assert result["best"] == 1
+        good, bad = result["scores"][1], result["scores"][0]
+        assert good["score"] == 1.0 and good["violations"] == {}
+        assert bad["violations"] == {"agreement": ["gacchanti (plural) has no plural karta"]}
+        assert bad["score"] == pytest.approx(1 - 1 / 4)
+
+    def test_unknown_forms_and_sandhi(self, index):
+        """Test unknown tokens and unjoined sandhi junctions."""
+        scores = DraftScorer(index.lookup).score(["Rama iti", "Rameti", "Ramena gacchati"])["scores"]
+        assert scores[0]["violations"] == {"sandhi": ["Rama + iti -> Rameti"]}
+        assert scores[1]["violations"] == {}
+        assert scores[2]["violations"] == {"unknown_form": ["Ramena"]}
+
+    def test_shared_work_is_deduplicated(self, index):
+        """Test that each unique token is analyzed once per batch."""
+        analyzer = CountingAnalyzer(index.lookup)
+        drafts = ["Baalah gacchati.", "Baalah gacchanti", "Baalah gacchati", "Baalah  gacchati |"]
+        result = DraftScorer(analyzer).score(drafts)
+        assert sorted(analyzer.calls) == ["Baalah", "gacchanti", "gacchati"]
+        assert result["tokens"] == {"total": 8, "unique": 3}
+        assert result["junctions"] == {"total": 4, "unique": 2}
+        assert [s["score"] for s in result["scores"]] == [1.0, 0.75, 1.0, 1.0]
+
+    def test_empty_inputs(self, index):
+        """Test no drafts and an empty draft."""
+        assert DraftScorer(index.lookup).score([])["best"] is None
+        empty = DraftScorer(index.lookup).score([""])["scores"][0]
+        assert empty["score"] == 0.0 and empty["checks"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
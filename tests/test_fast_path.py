@@ -0,0 +1,95 @@
+"""
+Test cases for Symbolic Fast Path Module
+
+Tests template parsing, symbolic assembly, the model fallback and reporting.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.fast_path import SymbolicFastPath
+from generator.karaka_generator import KarakaSentenceGenerator
+
+
+TOY_DATASET = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+
+
+class TestTranslate:
+    """Test suite for pattern matching and assembly."""
+
+    def test_reproduces_generator_rows(self):
+        """Test that every generated sentence is translated back to its own row."""
+        fast_path = SymbolicFastPath()
+        for row in KarakaSentenceGenerator():
+            assert fast_path.translate(row["input"]) == row
+
+    def test_toy_dataset(self):
+        """Test that a lexicon learned from the toy dataset covers all its inputs."""
+        rows = [json.loads(line) for line in TOY_DATASET.read_text(encoding='utf-8').splitlines()]
+        fast_path = SymbolicFastPath.from_rows(rows, lexicon={})
+        for row in rows:
+            result = fast_path.translate(row["input"])
+            assert result is not None, row["input"]
+            assert result["output"] == row["output"]
+
+    def test_prepositional_roles(self):
+        """Test that prepositions select roles regardless of their order."""
+        fast_path = SymbolicFastPath()
+        row = fast_path.translate("The boys play in the garden with a ball.")
+        assert row["output"] == "Baalaah kandukena udyane kridanti"
+        assert set(row["karaka"]) == {"karta", "karana", "adhikarana", "kriya"}
+        assert row["input"] == "The boys play in the garden with a ball."
+
+    @pytest.mark.parametrize("text", [
+        "The boy quickly reads the book",     # unknown karta phrase
+        "Who reads the book?",                # no karta entry
+        "The boys reads",                     # number disagreement
+        "The boy comes to the school",        # frame not licensed
+        "The boy reads the book the letter",  # two bare objects
+        "The boy",                            # no verb
+        "",
+    ])
+    def test_misses(self, text):
+        """Test that off-template sentences are left to the model."""
+        assert SymbolicFastPath().translate(text) is None
+
+    def test_unknown_slot(self):
+        """Test that unknown lexicon slots are rejected."""
+        with pytest.raises(ValueError, match="Unknown lexicon slots"):
+            SymbolicFastPath({"karta": [], "samasa": []})
+
+
+class TestFallback:
+    """Test suite for the model fallback and report."""
+
+    def test_fallback_and_report(self):
+        """Test that misses reach the fallback and are counted in the report."""
+        calls = []
+        fast_path = SymbolicFastPath(fallback=lambda text: calls.append(text) or "model")
+        assert fast_path("The boy reads the book")["output"] == "Baalah pustakam pathati"
+        assert fast_path("The king rules the kingdom") == "model"
+        assert calls == ["The king rules the kingdom"]
+
+        report = fast_path.report()
+        assert report["requests"] == 2
+        assert report["hits"] == 1
+        assert report["hit_rate"] == 0.5
+        assert report["fallback_ms"] is not None
+        assert report["saved_ms"] is not None
+
+    def test_report_without_fallback(self):
+        """Test that savings use the assumed model latency when nothing was timed."""
+        fast_path = SymbolicFastPath(model_latency_ms=100.0)
+        assert fast_path("The girl writes a letter") is not None
+        assert fast_path("The moon shines") is None
+        report = fast_path.report()
+        assert report["hit_rate"] == 0.5
+        assert report["fallback_ms"] == 100.0
+        assert 0 < report["saved_ms"] < 100.0
+        assert SymbolicFastPath().report()["saved_ms"] is None
@@ -0,0 +1,96 @@
+"""
+Test cases for Inverse Form Index Module
+
+Tests building, persisting and querying the surface form index.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.form_index import FormIndex, build_form_index, form_key, iter_analyses
+
+
+ROWS = [
+    {"output": "gacchati", "root": "√gam", "tense": "Present", "person": 3, "number": "Singular",
+     "rules_applied": ["3.1.68", "3.1.77"], "type": "verb_conjugation"},
+    {"output": "gacchanti", "root": "√gam", "tense": "Present", "person": 3, "number": "Plural",
+     "rules_applied": ["3.1.68"], "type": "verb_conjugation"},
+    {"output": "Ramah", "pratipadika": "Rama", "case": "Nominative", "number": "Singular",
+     "gender": "masculine", "rules_applied": ["2.3.46"], "type": "noun_declension"},
+    {"output": "Griham", "pratipadika": "Griha", "case": "Nominative", "number": "Singular",
+     "gender": "neuter", "rules_applied": ["2.3.46"], "type": "noun_declension"},
+    {"output": "Griham", "pratipadika": "Griha", "case": "Accusative", "number": "Singular",
+     "gender": "neuter", "rules_applied": ["2.3.2"], "type": "noun_declension"},
+    {"input": "The boy reads", "output": "Baalah pathati", "stage": "karaka"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Build and open an index over ROWS."""
+    path = tmp_path / "forms.bin"
+    assert build_form_index(ROWS, path) == 4
+    with FormIndex(path) as opened:
+        yield opened
+
+
+class TestFormIndex:
+    """Test suite for the inverse form index."""
+
+    def test_iter_analyses_skips_non_paradigm_rows(self):
+        """Test that only Stage 1 verb and noun rows are inverted."""
+        forms = [form for form, _ in iter_analyses(ROWS)]
+        assert forms == ["gacchati", "gacchanti", "Ramah", "Griham", "Griham"]
+
+    def test_lookup(self, index):
+        """Test a single analysis with lemma, features and sutras."""
+        assert index.lookup("gacchati") == [{
+            "lemma": "√gam",
+            "features": {"pos": "verb", "tense": "Present", "person": 3, "number": "Singular"},
+            "sutras": ["3.1.68", "3.1.77"],
+        }]
+
+    def test_ambiguous_form(self, index):
+        """Test that syncretic forms keep every analysis."""
+        cases = [a["features"]["case"] for a in index.lookup("griham")]
+        assert cases == ["Nominative", "Accusative"]
+
+    def test_script_and_case_insensitive(self, index):
+        """Test that romanized and Devanagari spellings share an entry."""
+        assert form_key("Gacchati") == form_key("गच्छति")
+        assert index.lookup("गच्छति") == index.lookup("GACCHATI")
+        assert "gacchanti" in index
+        assert "Ramena" not in index
+
+    def test_analyze_sentence(self, index):
+        """Test per-token analysis of a whole sentence."""
+        result = index.analyze("Ramena griham gacchati.")
+        assert [token for token, _ in result] == ["Ramena", "griham", "gacchati"]
+        assert result[0][1] == []
+        assert result[2][1][0]["lemma"] == "√gam"
+
+    def test_many_forms_probe_correctly(self, tmp_path):
+        """Test open addressing with many keys."""
+        rows = [{"output": f"form{i}", "pratipadika": f"base{i}", "case": "Nominative"}
+                for i in range(2000)]
+        path = tmp_path / "many.bin"
+        build_form_index(rows, path)
+        with FormIndex(path) as many:
+            assert len(many) == 2000
+            assert all(many.lookup(f"form{i}")[0]["lemma"] == f"base{i}" for i in range(0, 2000, 37))
+            assert many.lookup("form2000") == []
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a non-index file raises ValueError."""
+        path = tmp_path / "bogus.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="not a form index"):
+            FormIndex(path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
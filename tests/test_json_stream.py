@@ -0,0 +1,93 @@
+"""
+Test cases for Streaming JSON Reader Module
+
+Tests incremental decoding of JSON arrays and JSONL files with projection.
+"""
+
+import io
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.json_stream import iter_json_array, iter_jsonl, iter_json_records
+
+
+RECORDS = [
+    {"root": "gam", "gana": "1", "meaning": "gatau", "extra": {"forms": ["gacchati"] * 3}},
+    {"root": "path", "gana": "1", "meaning": "vyaktayam vaci", "extra": None},
+    {"root": "da", "gana": "3", "meaning": "dane", "count": 1234567},
+]
+
+
+class TestIterJsonArray:
+    """Test suite for iter_json_array."""
+
+    def test_yields_all_elements(self):
+        """Test that every array element is yielded in order."""
+        fp = io.StringIO(json.dumps(RECORDS, ensure_ascii=False))
+        assert list(iter_json_array(fp)) == RECORDS
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_records_split_across_chunks(self, chunk_size):
+        """Test decoding when records and numbers straddle chunk boundaries."""
+        text = json.dumps(RECORDS, indent=2) + "\n"
+        fp = io.StringIO(text)
+        assert list(iter_json_array(fp, chunk_size=chunk_size)) == RECORDS
+
+    def test_number_elements_across_chunks(self):
+        """Test that numbers are not truncated at a chunk edge."""
+        fp = io.StringIO("[12345, 678, 9]")
+        assert list(iter_json_array(fp, chunk_size=3)) == [12345, 678, 9]
+
+    def test_field_projection(self):
+        """Test that only requested keys are kept."""
+        fp = io.StringIO(json.dumps(RECORDS))
+        projected = list(iter_json_array(fp, fields=("root", "gana")))
+        assert projected == [{"root": r["root"], "gana": r["gana"]} for r in RECORDS]
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        assert list(iter_json_array(io.StringIO("  [ ] "))) == []
+
+    def test_top_level_object(self):
+        """Test that a single top-level object is yielded once."""
+        fp = io.StringIO(json.dumps(RECORDS[0]))
+        assert list(iter_json_array(fp)) == [RECORDS[0]]
+
+    def test_malformed_array_raises(self):
+        """Test that a missing separator is reported."""
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('[{"a": 1} {"b": 2}]')))
+
+    def test_truncated_record_raises(self):
+        """Test that a truncated file raises a decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO('[{"a": 1}, {"b": '), chunk_size=4))
+
+
+class TestIterJsonRecords:
+    """Test suite for file-based streaming."""
+
+    def test_jsonl_lines(self):
+        """Test JSONL decoding skips blank lines."""
+        fp = io.StringIO("\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+        assert list(iter_jsonl(fp, fields=("root",))) == [{"root": r["root"]} for r in RECORDS]
+
+    def test_dispatch_on_suffix(self, tmp_path):
+        """Test that .json and .jsonl files are both streamed."""
+        json_path = tmp_path / "shabda.json"
+        json_path.write_text(json.dumps(RECORDS), encoding="utf-8")
+        jsonl_path = tmp_path / "shabda.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in RECORDS), encoding="utf-8")
+
+        assert list(iter_json_records(json_path)) == RECORDS
+        assert list(iter_json_records(jsonl_path)) == RECORDS
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
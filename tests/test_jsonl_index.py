@@ -0,0 +1,98 @@
+"""
+Test cases for JSONL Offset Index Module
+
+Tests sidecar index building, random access and key filtering.
+"""
+
+import json
+import os
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.jsonl_index import JsonlIndex, build_jsonl_index, default_index_path
+
+
+ROWS = [
+    {"id": 1, "stage": "karaka", "complexity": "simple", "input": "The boy reads"},
+    {"id": 2, "stage": "karaka", "complexity": "complex", "input": "राम गच्छति"},
+    {"id": 3, "stage": "dhatupatha", "input": "no complexity"},
+    {"id": 4, "stage": "karaka", "complexity": "complex", "input": "last"},
+]
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    """Write a small JSONL file with a blank line in the middle."""
+    path = tmp_path / "rows.jsonl"
+    lines = [json.dumps(row, ensure_ascii=False) for row in ROWS]
+    lines.insert(2, "")
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return path
+
+
+class TestJsonlIndex:
+    """Test suite for build_jsonl_index and JsonlIndex."""
+
+    def test_random_access(self, jsonl_file):
+        """Test that row i decodes to the i-th non-blank line."""
+        build_jsonl_index(jsonl_file)
+        with JsonlIndex(jsonl_file) as index:
+            assert len(index) == len(ROWS)
+            assert [index[i] for i in range(len(index))] == ROWS
+            assert index[-1] == ROWS[-1]
+            with pytest.raises(IndexError):
+                index[len(ROWS)]
+
+    def test_strided_rows(self, jsonl_file):
+        """Test that strided iteration returns only the requested rows."""
+        with JsonlIndex.open(jsonl_file) as index:
+            assert list(index.iter_rows(1, None, 2)) == ROWS[1::2]
+
+    def test_key_columns(self, jsonl_file):
+        """Test integer and categorical key columns, including missing keys."""
+        with JsonlIndex.open(jsonl_file) as index:
+            assert index.key_fields == ["id", "stage", "complexity"]
+            assert [index.key(i, "id") for i in range(4)] == [1, 2, 3, 4]
+            assert index.key(2, "complexity") is None
+
+    def test_find_and_select(self, jsonl_file):
+        """Test that filtering by keys only returns matching rows."""
+        with JsonlIndex.open(jsonl_file) as index:
+            assert list(index.find(complexity="complex")) == [1, 3]
+            assert list(index.find(stage="karaka", id=4)) == [3]
+            assert list(index.find(stage="sandhi")) == []
+            assert [row["id"] for row in index.select(stage="dhatupatha")] == [3]
+            with pytest.raises(KeyError):
+                list(index.find(input="last"))
+
+    def test_mixed_key_falls_back_to_category(self, tmp_path):
+        """Test that a key with non-integer values becomes categorical."""
+        path = tmp_path / "mixed.jsonl"
+        path.write_text('{"id": 1}\n{"id": "a-2"}\n{"id": 1}\n', encoding='utf-8')
+        with JsonlIndex.open(path, key_fields=("id",)) as index:
+            assert list(index.find(id=1)) == [0, 2]
+            assert list(index.find(id="a-2")) == [1]
+
+    def test_stale_index_rebuilt(self, jsonl_file):
+        """Test that a modified JSONL file invalidates its index."""
+        JsonlIndex.open(jsonl_file).close()
+        with open(jsonl_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"id": 5, "stage": "sandhi"}) + "\n")
+        stat = jsonl_file.stat()
+        os.utime(jsonl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        with pytest.raises(ValueError, match="stale"):
+            JsonlIndex(jsonl_file)
+        with JsonlIndex.open(jsonl_file) as index:
+            assert len(index) == 5
+            assert list(index.find(stage="sandhi")) == [4]
+        assert default_index_path(jsonl_file).exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
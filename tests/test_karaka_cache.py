@@ -0,0 +1,118 @@
+"""
+Test cases for Karaka Cache Module
+
+Tests canonical structures, stable keys and the memory/SQLite cache tiers.
+"""
+
+import copy
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.karaka_cache import KarakaCache, canonicalize, structure_key
+from generator.karaka_generator import KarakaSentenceGenerator
+
+
+KARAKA = {
+    "karta": {"word": "boy", "sanskrit": "Baalah", "case": "nominative", "vibhakti": "prathama"},
+    "karma": {"word": "book", "sanskrit": "pustakam", "case": "accusative", "vibhakti": "dvitiya"},
+    "kriya": {"word": "reads", "root": "√path", "tense": "present", "person": 3, "number": "singular"},
+}
+
+
+class TestCanonicalize:
+    """Test suite for canonical structures and keys."""
+
+    def test_equivalent_structures_share_a_key(self):
+        """Test that role order, case, whitespace and defaults do not change the key."""
+        variant = {
+            "kriya": {"root": "√path", "tense": " Present", "person": "3", "word": "studies"},
+            "karma": {"vibhakti": "Dvitiya", "case": "Accusative", "word": "Book"},
+            "karta": {"case": "NOMINATIVE", "vibhakti": "prathama", "word": "boy", "number": "singular"},
+        }
+        assert canonicalize(variant) == canonicalize(KARAKA)
+        assert structure_key(variant) == structure_key(KARAKA)
+        assert list(canonicalize(KARAKA)) == ["karma", "karta", "kriya"]
+
+    def test_output_fields_are_ignored(self):
+        """Test that Sanskrit forms are not part of the structure."""
+        variant = copy.deepcopy(KARAKA)
+        variant["karta"]["sanskrit"] = "Balah"
+        assert structure_key(variant) == structure_key(KARAKA)
+
+    @pytest.mark.parametrize("role,field,value", [
+        ("karta", "word", "girl"), ("karma", "case", "instrumental"),
+        ("kriya", "number", "plural"), ("kriya", "root", "√likh"),
+    ])
+    def test_different_structures_differ(self, role, field, value):
+        """Test that a changed word or feature changes the key."""
+        variant = copy.deepcopy(KARAKA)
+        variant[role][field] = value
+        assert structure_key(variant) != structure_key(KARAKA)
+
+    def test_key_is_stable(self):
+        """Test that keys do not depend on the process (fixed digest)."""
+        assert structure_key({"kriya": {"root": "√gam"}}) == structure_key({"kriya": {"root": "√gam"}})
+        assert len(structure_key(KARAKA)) == 32
+
+    def test_invalid_structures(self):
+        """Test that non-dict structures are rejected."""
+        with pytest.raises(ValueError):
+            canonicalize(["karta"])
+        with pytest.raises(ValueError, match="not a dict"):
+            canonicalize({"karta": "boy"})
+
+
+class TestKarakaCache:
+    """Test suite for the two cache tiers."""
+
+    def test_memory_tier(self):
+        """Test that a computed output is served from memory afterwards."""
+        calls = []
+        cache = KarakaCache()
+        compute = lambda karaka: calls.append(karaka) or "Baalah pustakam pathati"
+        first = cache.get_or_compute(KARAKA, compute)
+        second = cache.get_or_compute(copy.deepcopy(KARAKA), compute)
+        assert first == second
+        assert first["output_devanagari"]
+        assert len(calls) == 1
+        assert cache.report() == {"requests": 2, "memory_hits": 1, "disk_hits": 0,
+                                  "misses": 1, "hit_rate": 0.5}
+
+    def test_lru_eviction(self):
+        """Test that the least recently used structure is evicted from memory."""
+        cache = KarakaCache(capacity=2)
+        rows = list(KarakaSentenceGenerator().iter_examples(0, 3))
+        for row in rows:
+            cache.put(row["karaka"], row["output"], row["output_devanagari"])
+        assert cache.get(rows[0]["karaka"]) is None
+        assert cache.get(rows[2]["karaka"])["output"] == rows[2]["output"]
+        assert len(cache) == 2
+
+    def test_disk_tier(self, tmp_path):
+        """Test that outputs survive a restart through the SQLite store."""
+        path = tmp_path / "karaka_cache.sqlite"
+        rows = list(KarakaSentenceGenerator().iter_examples(0, 20))
+        with KarakaCache(path, capacity=5) as cache:
+            for row in rows:
+                cache.get_or_compute(row["karaka"], lambda karaka, row=row: row)
+            assert len(cache) == 20
+            assert cache.get(rows[0]["karaka"])["output"] == rows[0]["output"]
+            assert cache.report()["disk_hits"] == 1
+
+        with KarakaCache(path) as cache:
+            for row in rows:
+                cached = cache.get(row["karaka"])
+                assert cached == {"output": row["output"], "output_devanagari": row["output_devanagari"]}
+            cache.get(rows[0]["karaka"])
+            report = cache.report()
+            assert (report["disk_hits"], report["memory_hits"], report["misses"]) == (20, 1, 0)
+
+    def test_invalid_capacity(self):
+        """Test that the memory tier needs a positive capacity."""
+        with pytest.raises(ValueError, match="capacity"):
+            KarakaCache(capacity=0)
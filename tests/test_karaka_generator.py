@@ -0,0 +1,123 @@
+"""
+Test cases for Karaka Sentence Generator Module
+
+Tests lazy enumeration, agreement and streaming output of Karaka sentences.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.karaka_generator import (
+    DEFAULT_LEXICON,
+    KarakaSentenceGenerator,
+    assess_complexity,
+    grammar_notes,
+)
+
+
+TOY_DATASET = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+
+
+@pytest.fixture
+def generator():
+    """Create a KarakaSentenceGenerator with the default lexicon."""
+    return KarakaSentenceGenerator()
+
+
+class TestKarakaSentenceGenerator:
+    """Test suite for KarakaSentenceGenerator."""
+
+    def test_length_matches_enumeration(self, generator):
+        """Test that len() equals the number of enumerated examples."""
+        assert len(generator) == sum(1 for _ in generator)
+
+    def test_first_example(self, generator):
+        """Test the first example in index order."""
+        example = generator[0]
+        assert example["input"] == "The boy reads"
+        assert example["output"] == "Baalah pathati"
+        assert example["output_devanagari"] == "बालः पथति"
+
+    def test_number_agreement(self, generator):
+        """Test that karta and kriya always agree in number."""
+        for example in generator:
+            karaka = example["karaka"]
+            karta_number = karaka["karta"].get("number", "singular")
+            assert karaka["kriya"]["number"] == karta_number
+
+    def test_kriya_without_plural_never_gets_plural_karta(self, generator):
+        """Test that a kriya lacking a plural form is skipped for plural kartas."""
+        gives = [e for e in generator if e["karaka"]["kriya"]["root"] == "√da"]
+        assert gives
+        assert all(e["karaka"]["kriya"]["number"] == "singular" for e in gives)
+
+    def test_frames_are_respected(self, generator):
+        """Test that each example only uses roles licensed by its kriya."""
+        frames = {k["root"]: [set(f) for f in k["frames"]] for k in DEFAULT_LEXICON["kriya"]}
+        for example in generator:
+            karaka = example["karaka"]
+            roles = set(karaka) - {"karta", "kriya"}
+            assert roles in frames[karaka["kriya"]["root"]]
+
+    def test_random_access_matches_enumeration(self, generator):
+        """Test that indexing decodes the same row as iteration."""
+        rows = list(generator)
+        for index in (0, 7, len(rows) // 2, len(rows) - 1):
+            assert generator[index] == rows[index]
+        assert generator[-1] == rows[-1]
+        with pytest.raises(IndexError):
+            generator[len(rows)]
+
+    def test_shuffled_is_seeded_permutation(self, generator):
+        """Test that shuffling visits every example once, reproducibly."""
+        shuffled = [e["input"] + e["output"] for e in generator.iter_shuffled(seed=5)]
+        ordered = [e["input"] + e["output"] for e in generator]
+        assert sorted(shuffled) == sorted(ordered)
+        assert shuffled != ordered
+        assert [e["input"] for e in generator.sample(10, seed=5)] == \
+            [e["input"] for e in generator.iter_shuffled(seed=5)][:10]
+
+    def test_invalid_lexicon(self):
+        """Test that unknown slots and frame roles raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown lexicon slots"):
+            KarakaSentenceGenerator({"karta": [], "kriya": [], "hetu": []})
+        bad_kriya = {"root": "√gam", "word": {"singular": "goes"},
+                     "forms": {"singular": "gacchati"}, "frames": [("hetu",)]}
+        with pytest.raises(ValueError, match="invalid frame role"):
+            KarakaSentenceGenerator({"karta": [], "kriya": [bad_kriya]})
+
+    def test_generate_dataset_streams_schema(self, generator, tmp_path):
+        """Test that generated rows follow the toy dataset schema."""
+        output_file = tmp_path / "stage2.jsonl"
+        count = generator.generate_dataset(str(output_file), max_examples=25, shuffle=True, seed=1)
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        with open(TOY_DATASET, 'r', encoding='utf-8') as f:
+            toy_keys = list(json.loads(f.readline()).keys())
+
+        assert count == len(rows) == 25
+        assert [row["id"] for row in rows] == list(range(1, 26))
+        assert all(list(row.keys()) == toy_keys for row in rows)
+
+
+class TestGrammarHelpers:
+    """Test grammar notes and complexity against the toy dataset."""
+
+    def test_matches_toy_dataset(self):
+        """Test that notes and complexity reproduce the toy dataset text."""
+        with open(TOY_DATASET, 'r', encoding='utf-8') as f:
+            for line in f:
+                row = json.loads(line)
+                assert grammar_notes(row["karaka"]) == row["grammar_notes"]
+                assert assess_complexity(row["karaka"]) == row["complexity"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+"""
+Test cases for Karaka Validator Module
+
+Tests the compiled rule table, agreement checks and batched file validation.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from auditor.karaka_validator import KarakaValidator, iter_violations, validate_jsonl
+from generator.karaka_generator import KarakaSentenceGenerator
+
+
+def make_row(row_id, karta_word="boy", karta="Baalah", karta_number=None, verb_number="singular",
+             case="nominative", vibhakti="prathama", output=None):
+    """A Stage 2 row in the toy dataset schema."""
+    karaka = {"karta": {"word": karta_word, "sanskrit": karta, "case": case, "vibhakti": vibhakti},
+              "kriya": {"word": "reads", "root": "√path", "tense": "present", "person": 3,
+                        "number": verb_number}}
+    if karta_number:
+        karaka["karta"]["number"] = karta_number
+    verb = "pathati" if verb_number == "singular" else "pathanti"
+    return {"id": row_id, "output": output or f"{karta} {verb}", "karaka": karaka}
+
+
+def rules(violations):
+    """Rule names of a violation list."""
+    return sorted(v["rule"] for v in violations)
+
+
+class TestKarakaValidator:
+    """Test suite for single-structure checks."""
+
+    def test_valid_row(self):
+        """Test that a well-formed row has no violations."""
+        row = make_row(1)
+        assert KarakaValidator().check(row["karaka"], row["output"]) == []
+
+    def test_number_agreement(self):
+        """Test karta/kriya number agreement, with singular as the default."""
+        validator = KarakaValidator()
+        assert rules(validator.check(make_row(1, verb_number="plural")["karaka"])) == ["number_agreement"]
+        assert validator.check(make_row(1, karta_number="plural", verb_number="plural")["karaka"]) == []
+
+    def test_case_and_vibhakti(self):
+        """Test that each role must carry its own case and vibhakti."""
+        karaka = make_row(1, case="accusative", vibhakti="dvitiya")["karaka"]
+        assert rules(KarakaValidator().check(karaka)) == ["case", "vibhakti"]
+
+    def test_structure_and_unknown_roles(self):
+        """Test missing kriya/karta and unknown roles."""
+        validator = KarakaValidator()
+        assert rules(validator.check({"karta": {"case": "nominative", "vibhakti": "prathama"}})) == ["structure"]
+        assert rules(validator.check({"kriya": {}, "agent": {}})) == ["role", "structure"]
+        assert rules(validator.check(None)) == ["structure"]
+
+    def test_surface_form_in_output(self):
+        """Test that role words must appear in the output."""
+        row = make_row(1, output="Baalaa pathati")
+        assert rules(KarakaValidator().check(row["karaka"], row["output"])) == ["surface"]
+
+
+class TestValidateJsonl:
+    """Test suite for batched file validation."""
+
+    @pytest.fixture
+    def dataset(self, tmp_path):
+        """A file with one agreement error, one bad line and a form collision."""
+        rows = [make_row(10), make_row(11, verb_number="plural"),
+                make_row(14, karta_word="child", karta="Balah"),
+                make_row(12, karta_word="boys", karta="Balah", karta_number="plural", verb_number="plural"),
+                make_row(13, karta_word="girls", karta="Balah", karta_number="plural", verb_number="plural")]
+        path = tmp_path / "rows.jsonl"
+        lines = [json.dumps(row) for row in rows]
+        lines.insert(2, "{not json")
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return path
+
+    def test_violations_with_row_ids(self, dataset):
+        """Test row IDs, line numbers for undecodable rows and collisions last."""
+        violations = list(iter_violations(dataset, batch_size=2))
+        assert [(v["row"], v["rule"]) for v in violations] == [
+            (11, "number_agreement"), (3, "json"), (13, "form_collision")]
+        assert "'boys' (row 12)" in violations[-1]["message"]
+        assert "'child'" not in violations[-1]["message"]
+        assert violations[-1]["severity"] == "warning"
+
+    def test_report_and_output(self, dataset, tmp_path):
+        """Test the summary report and the violations file."""
+        output = tmp_path / "violations.jsonl"
+        report = validate_jsonl(dataset, output_path=output, batch_size=2)
+        assert report == {"rows": 6, "violations": 2, "rows_with_violations": 2, "warnings": 1,
+                          "by_rule": {"number_agreement": 1, "json": 1, "form_collision": 1}}
+        assert len(output.read_text(encoding='utf-8').splitlines()) == 3
+
+    def test_parallel_matches_serial(self, dataset):
+        """Test that worker processes give the same violations in order."""
+        assert list(iter_violations(dataset, workers=2, batch_size=1)) == list(iter_violations(dataset))
+
+
+class TestRepoData:
+    """Test suite for the repository's own Stage 2 data."""
+
+    def test_generator_output_passes(self, tmp_path):
+        """Test that KarakaSentenceGenerator output has no violations or warnings."""
+        path = tmp_path / "stage2_karaka.jsonl"
+        KarakaSentenceGenerator().generate_dataset(str(path))
+        report = validate_jsonl(path)
+        assert report["rows"] == len(KarakaSentenceGenerator())
+        assert (report["violations"], report["warnings"]) == (0, 0)
+
+    def test_toy_dataset_passes(self):
+        """Test that the toy dataset has no errors (homographs are only warnings)."""
+        report = validate_jsonl(Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl")
+        assert report["violations"] == 0
+        assert report["by_rule"] == {"form_collision": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+Test cases for Curriculum Mixer Module
+
+Tests weight schedules, streaming interleaving and checkpoint/resume.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.mixer import CurriculumMixer, WeightSchedule
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Write one JSONL file per stage."""
+    paths = {}
+    for stage, size in (("dhatupatha", 3000), ("karaka", 1000), ("kavya", 200)):
+        path = tmp_path / f"{stage}.jsonl"
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(size):
+                f.write(json.dumps({"id": i, "stage": stage}) + "\n")
+        paths[stage] = path
+    return paths
+
+
+class TestWeightSchedule:
+    """Test suite for WeightSchedule."""
+
+    def test_interpolation_and_clamping(self):
+        """Test linear interpolation between breakpoints and constant ends."""
+        schedule = WeightSchedule([(0, {"a": 70, "b": 30}), (100, {"a": 30, "b": 70})])
+        assert schedule(-5) == {"a": 0.7, "b": 0.3}
+        assert schedule(50) == pytest.approx({"a": 0.5, "b": 0.5})
+        assert schedule(1000) == {"a": 0.3, "b": 0.7}
+
+    def test_invalid(self):
+        """Test that empty, duplicate-step or negative schedules are rejected."""
+        with pytest.raises(ValueError):
+            WeightSchedule([])
+        with pytest.raises(ValueError):
+            WeightSchedule([(0, {"a": 1}), (0, {"a": 2})])
+        with pytest.raises(ValueError):
+            WeightSchedule({"a": -1})
+
+
+class TestCurriculumMixer:
+    """Test suite for CurriculumMixer."""
+
+    def test_proportions_follow_weights(self, sources):
+        """Test that emitted stages match the schedule proportions."""
+        weights = {"dhatupatha": 70, "karaka": 25, "kavya": 5}
+        with CurriculumMixer(sources, weights, seed=1, buffer_size=64) as mixer:
+            rows = [next(mixer) for _ in range(2000)]
+        share = {stage: sum(r["stage"] == stage for r in rows) / len(rows) for stage in weights}
+        assert share["dhatupatha"] == pytest.approx(0.70, abs=0.04)
+        assert share["karaka"] == pytest.approx(0.25, abs=0.04)
+        assert share["kavya"] == pytest.approx(0.05, abs=0.02)
+
+    def test_schedule_shifts_over_time(self, sources):
+        """Test that a time-varying schedule changes the mix."""
+        schedule = WeightSchedule([(0, {"dhatupatha": 1, "karaka": 0}),
+                                   (1000, {"dhatupatha": 0, "karaka": 1})])
+        with CurriculumMixer(sources, schedule, seed=0) as mixer:
+            rows = [next(mixer) for _ in range(1000)]
+        early = sum(r["stage"] == "karaka" for r in rows[:200])
+        late = sum(r["stage"] == "karaka" for r in rows[800:])
+        assert early < 50 < 150 < late
+
+    def test_exhausts_every_row_once(self, sources):
+        """Test that without cycling every row is emitted exactly once."""
+        with CurriculumMixer(sources, {"dhatupatha": 1, "karaka": 1, "kavya": 1}, seed=3,
+                             buffer_size=16) as mixer:
+            rows = list(mixer)
+        assert len(rows) == 4200
+        assert len({(r["stage"], r["id"]) for r in rows}) == 4200
+        assert mixer.counts == {"dhatupatha": 3000, "karaka": 1000, "kavya": 200}
+
+    def test_buffer_shuffles(self, sources):
+        """Test that rows within a source are shuffled but seed-reproducible."""
+        def karaka_ids(seed):
+            with CurriculumMixer({"karaka": sources["karaka"]}, {"karaka": 1}, seed=seed,
+                                 buffer_size=32) as mixer:
+                return [next(mixer)["id"] for _ in range(100)]
+        assert karaka_ids(7) == karaka_ids(7)
+        assert karaka_ids(7) != list(range(100))
+
+    def test_cycle(self, sources):
+        """Test that cycling restarts exhausted sources."""
+        with CurriculumMixer({"kavya": sources["kavya"]}, {"kavya": 1}, buffer_size=10, cycle=True) as mixer:
+            rows = [next(mixer) for _ in range(500)]
+            assert mixer.state_dict()["sources"]["kavya"]["epoch"] >= 2
+        assert {r["id"] for r in rows} == set(range(200))
+
+    def test_checkpoint_resume(self, sources, tmp_path):
+        """Test that a resumed mixer continues with exactly the same rows."""
+        weights = {"dhatupatha": 70, "karaka": 25, "kavya": 5}
+        with CurriculumMixer(sources, weights, seed=11, buffer_size=50) as mixer:
+            for _ in range(777):
+                next(mixer)
+            mixer.save_state(tmp_path / "mixer.json")
+            expected = [next(mixer) for _ in range(1500)]
+
+        with CurriculumMixer(sources, weights, seed=0, buffer_size=50) as resumed:
+            resumed.load_state(tmp_path / "mixer.json")
+            assert resumed.step == 777
+            assert [next(resumed) for _ in range(1500)] == expected
+
+    def test_unknown_schedule_source(self, sources):
+        """Test that weights must refer to known sources."""
+        with pytest.raises(ValueError, match="unknown sources"):
+            CurriculumMixer({"karaka": sources["karaka"]}, {"sandhi": 1})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+Test cases for Sequence Packing Module
+
+Tests first-fit-decreasing bin packing and the packed sequence format.
+"""
+
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.packing import PackedDataset, first_fit_decreasing, pack_token_dataset, packing_report
+from dataset.token_store import ByteTokenizer, TokenDataset, TokenDatasetWriter, tokenize_jsonl
+
+
+TOY_DATASET = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+
+
+def naive_first_fit_decreasing(lengths, max_length):
+    """Reference O(n * bins) implementation."""
+    bins, free = [], []
+    for item in sorted(range(len(lengths)), key=lambda i: -lengths[i]):
+        for slot, space in enumerate(free):
+            if space >= lengths[item]:
+                bins[slot].append(item)
+                free[slot] -= lengths[item]
+                break
+        else:
+            bins.append([item])
+            free.append(max_length - lengths[item])
+    return bins
+
+
+class TestFirstFitDecreasing:
+    """Test suite for the bin packer."""
+
+    def test_matches_reference(self):
+        """Test that the segment tree packer equals plain first-fit-decreasing."""
+        lengths = np.random.default_rng(0).integers(1, 60, size=500)
+        assert first_fit_decreasing(lengths, 64) == naive_first_fit_decreasing(lengths.tolist(), 64)
+
+    def test_report(self):
+        """Test efficiency numbers for a perfect packing."""
+        lengths = np.array([6, 4, 5, 5])
+        bins = first_fit_decreasing(lengths, 10)
+        report = packing_report(lengths, bins, 10)
+        assert sorted(map(sorted, bins)) == [[0, 1], [2, 3]]
+        assert report["efficiency"] == 1.0
+        assert report["padded_efficiency"] == 0.5
+        assert report["examples_per_sequence"] == 2.0
+
+    def test_oversized_item(self):
+        """Test that items longer than the sequence are rejected."""
+        with pytest.raises(ValueError, match="exceeds max_length"):
+            first_fit_decreasing([3, 11], 10)
+
+
+class TestPackedDataset:
+    """Test suite for packed sequence files."""
+
+    def test_toy_dataset_round_trip(self, tmp_path):
+        """Test that every document is stored intact with its boundaries."""
+        tokenize_jsonl(TOY_DATASET, tmp_path / "toy")
+        data = TokenDataset(tmp_path / "toy")
+        report = pack_token_dataset(data, tmp_path / "packed", 1024, ByteTokenizer.pad_token_id)
+        packed = PackedDataset(tmp_path / "packed")
+
+        assert len(packed) == report["sequences"] < len(data)
+        assert report["efficiency"] > 0.85
+        seen = []
+        for index in range(len(packed)):
+            sequence = packed[index]
+            ids = sequence["input_ids"]
+            for row, start, length, label_start in packed.documents(index):
+                assert np.array_equal(ids[start:start + length], data[row])
+                assert np.array_equal(ids[label_start:start + length], data.segment(row, "output"))
+                seen.append(int(row))
+            used = sequence["cu_seqlens"][-1]
+            assert (ids[used:] == ByteTokenizer.pad_token_id).all()
+            assert sequence["loss_mask"].sum() == sum(
+                len(data.segment(int(row), "output")) for row in packed.documents(index)[:, 0])
+        assert sorted(seen) == list(range(len(data)))
+
+    def test_position_ids_restart(self, tmp_path):
+        """Test per-document position ids and cumulative lengths."""
+        with TokenDatasetWriter(tmp_path / "small", ByteTokenizer(), fields=("input", "output")) as writer:
+            writer.add({"input": "gam", "output": "gacchati"})
+            writer.add({"input": "ab", "output": "c"})
+        data = TokenDataset(tmp_path / "small")
+        pack_token_dataset(data, tmp_path / "packed", 20)
+        sequence = PackedDataset(tmp_path / "packed")[0]
+        assert sequence["cu_seqlens"].tolist() == [0, 12, 16]
+        assert sequence["position_ids"][:16].tolist() == list(range(12)) + list(range(4))
+        assert sequence["loss_mask"].tolist() == [False] * 3 + [True] * 9 + [False] * 2 + [True] * 2 + [False] * 4
+
+    def test_drop_oversized(self, tmp_path):
+        """Test that oversized rows raise unless dropping is requested."""
+        with TokenDatasetWriter(tmp_path / "long", ByteTokenizer(), fields=("output",)) as writer:
+            writer.add({"output": "x" * 30})
+            writer.add({"output": "y"})
+        data = TokenDataset(tmp_path / "long")
+        with pytest.raises(ValueError, match="exceed max_length"):
+            pack_token_dataset(data, tmp_path / "packed", 16)
+        report = pack_token_dataset(data, tmp_path / "packed", 16, drop_oversized=True)
+        assert report["dropped"] == 1
+        assert PackedDataset(tmp_path / "packed").documents(0)[:, 0].tolist() == [1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""
+Test cases for Paradigm Coverage Module
+
+Tests filled/missing cell tracking, serialization and the heatmap summary.
+"""
+
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.paradigm_coverage import ParadigmCoverage
+
+
+AXES = [("tense", ["Present", "Past"]), ("person", [1, 2, 3]), ("number", ["Singular", "Plural"])]
+
+
+@pytest.fixture
+def coverage():
+    """Tracker with a few verb cells recorded."""
+    tracker = ParadigmCoverage("root", AXES, capacity=1)
+    tracker.record("√gam", ("Present", 3, "Singular"), True)
+    tracker.record("√gam", ("Present", 3, "Plural"), True)
+    tracker.record("√gam", ("Past", 3, "Singular"), False)
+    tracker.record("√path", ("Present", 3, "Singular"), False)
+    tracker.record("√likh", ("Present", 1, "Singular"), True)
+    return tracker
+
+
+class TestParadigmCoverage:
+    """Test suite for ParadigmCoverage."""
+
+    def test_counts_and_missing_cells(self, coverage):
+        """Test attempted, filled and missing bookkeeping."""
+        assert coverage.attempted.shape == (3, 2, 3, 2)
+        assert coverage.counts() == {"cells": 36, "attempted": 5, "filled": 3, "missing": 2,
+                                     "fill_rate": 0.6}
+        assert coverage.missing_cells() == [("√gam", "Past", 3, "Singular"),
+                                            ("√path", "Present", 3, "Singular")]
+
+    def test_unknown_label(self, coverage):
+        """Test that labels outside an axis are rejected."""
+        with pytest.raises(ValueError, match="Unknown paradigm cell label"):
+            coverage.record("√gam", ("Perfect", 3, "Singular"), True)
+
+    def test_save_load_round_trip(self, coverage, tmp_path):
+        """Test that bit-packed serialization restores tensors and labels."""
+        path = tmp_path / "verbs.npz"
+        coverage.save(path)
+        loaded = ParadigmCoverage.load(path)
+        assert loaded.labels == coverage.labels
+        assert np.array_equal(loaded.attempted, coverage.attempted)
+        assert np.array_equal(loaded.filled, coverage.filled)
+        assert path.stat().st_size < 1024
+
+    def test_heatmap(self, coverage):
+        """Test heatmap rows, shades and untried markers."""
+        lines = coverage.heatmap().splitlines()
+        assert lines[0].split() == ["root", "Pres", "Past", "fill"]
+        assert lines[1] == "√gam   ████ " + " " * 4 + "    67%"
+        assert lines[2].startswith("√path  ")
+        assert "····" in lines[2]
+        assert lines[-1].startswith("3/5 attempted cells filled (60%), 2 missing")
+
+    def test_heatmap_other_axis(self, coverage):
+        """Test choosing a different column axis."""
+        header = coverage.heatmap(column_axis=3).splitlines()[0]
+        assert header.split() == ["root", "Sing", "Plur", "fill"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
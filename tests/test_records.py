@@ -0,0 +1,108 @@
+"""
+Test cases for Compact Record Types Module
+
+Tests slotted dhatu/sutra records and the columnar shabda store.
+"""
+
+import tracemalloc
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.records import ColumnarStore, DhatuRecord, SutraRecord
+
+
+def _shabda_rows(count):
+    """Build shabda-like rows with fresh (non-shared) strings."""
+    lingas = ["pum", "stri", "napumsaka"]
+    for i in range(count):
+        yield {
+            "word": f"rama{i % 500}",
+            "linga": "".join(lingas[i % 3]),
+            "vibhakti": str(i % 8 + 1),
+            "vacana": str(i % 3 + 1),
+            "form": f"ramah{i}",
+        }
+
+
+class TestSlottedRecords:
+    """Test suite for DhatuRecord and SutraRecord."""
+
+    def test_dhatu_record_mapping_access(self):
+        """Test that generator-style dict access works on records."""
+        record = DhatuRecord("gam", "1", "gatau")
+        assert record["root"] == "gam"
+        assert record.get("gana", "9") == "1"
+        assert dict(record) == {"root": "gam", "gana": "1", "meaning": "gatau"}
+
+    def test_dhatu_record_from_dict_alias(self):
+        """Test that 'dhatu' is accepted as an alias of 'root'."""
+        record = DhatuRecord.from_dict({"dhatu": "path", "meaning": "to read"})
+        assert record.get("root", record.get("dhatu", "√gam")) == "path"
+        assert record.get("gana", "1") == "1"
+        assert "gana" not in record
+
+    def test_sutra_record_has_no_dict(self):
+        """Test that records carry no per-instance __dict__."""
+        record = SutraRecord("1.1.1", "vṛddhirādaic", "1", "1", "1")
+        assert not hasattr(record, "__dict__")
+        assert record["pada"] == "1"
+        with pytest.raises(KeyError):
+            record["meaning"]
+
+
+class TestColumnarStore:
+    """Test suite for ColumnarStore."""
+
+    def test_round_trip_rows(self):
+        """Test that rows read back equal the original records."""
+        rows = list(_shabda_rows(20))
+        store = ColumnarStore.from_records(iter(rows))
+        assert len(store) == 20
+        assert [dict(row) for row in store] == rows
+        assert store[-1] == rows[-1]
+
+    def test_missing_and_late_fields(self):
+        """Test that absent fields and fields first seen mid-stream are handled."""
+        store = ColumnarStore.from_records([{"word": "rama"}, {"word": "sita", "linga": "stri"}])
+        assert "linga" not in store[0]
+        assert store[0].get("linga") is None
+        assert store[1]["linga"] == "stri"
+        assert list(store.column("linga")) == [None, "stri"]
+
+    def test_values_keep_their_types(self):
+        """Test that equal-hashing values of different types stay distinct."""
+        store = ColumnarStore.from_records([{"v": 1}, {"v": True}, {"v": 1.0}, {"v": [1, 2]}])
+        assert [type(store.value(i, "v")) for i in range(4)] == [int, bool, float, list]
+
+    def test_index_out_of_range(self):
+        """Test that out-of-range indexing raises IndexError."""
+        store = ColumnarStore.from_records([{"word": "rama"}])
+        with pytest.raises(IndexError):
+            store[1]
+
+    def test_memory_smaller_than_dicts(self):
+        """Test that the store uses several-fold less memory than dicts."""
+        count = 20000
+
+        tracemalloc.start()
+        dict_rows = list(_shabda_rows(count))
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del dict_rows
+
+        tracemalloc.start()
+        store = ColumnarStore.from_records(_shabda_rows(count))
+        store_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert len(store) == count
+        assert dict_bytes > 3 * store_bytes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+Test cases for Root Mapper Module
+
+Tests meaning normalization, lemma candidates, ranking and persistence.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.records import DhatuRecord
+from dataset.text_parsers import parse_dhatu_lines
+from generator.root_mapper import COMMON_DHATU, MeaningIndex, lemma_candidates, normalize_tokens
+
+
+CORPUS = COMMON_DHATU + [
+    {"root": "√cal", "meaning": "to move, to go round", "gana": "1"},
+    {"root": "√pat", "meaning": "to fall, to fly", "gana": "1"},
+    {"root": "√as", "meaning": "", "gana": "2"},
+    {"meaning": "to go", "gana": "1"},
+]
+
+
+def roots(candidates):
+    """Roots of a candidate list."""
+    return [c["root"] for c in candidates]
+
+
+class TestNormalization:
+    """Test suite for meaning tokens and lemma candidates."""
+
+    def test_normalize_tokens(self):
+        """Test that function words and numbers are removed."""
+        assert normalize_tokens("To go (1), to the forest") == ["go", "forest"]
+
+    @pytest.mark.parametrize("word,lemma", [
+        ("reads", "read"), ("teaches", "teach"), ("studies", "study"), ("writing", "write"),
+        ("running", "run"), ("lived", "live"), ("carried", "carry"), ("went", "go"), ("Gave", "give"),
+    ])
+    def test_lemma_candidates(self, word, lemma):
+        """Test that the base form is among the candidates."""
+        assert lemma in list(lemma_candidates(word))
+
+
+class TestMeaningIndex:
+    """Test suite for building, ranking and persistence."""
+
+    def test_lookup_inflected_verbs(self):
+        """Test that inflected English verbs reach their dhatu with gana."""
+        index = MeaningIndex.build(CORPUS)
+        assert roots(index.lookup("reads")) == ["√path"]
+        assert roots(index.lookup("writing")) == ["√likh"]
+        assert roots(index.lookup("flies")) == ["√pat"]
+        candidate = index.lookup("gave")[0]
+        assert (candidate["root"], candidate["gana"], candidate["meaning"]) == ("√da", "3", "to give")
+
+    def test_ranking(self):
+        """Test that a dhatu glossed exactly by the word ranks first."""
+        index = MeaningIndex.build(CORPUS)
+        assert roots(index.lookup("goes")) == ["√gam", "√cal"]
+        assert roots(index.lookup("is")) == ["√bhu", "√as"]
+        assert roots(index.lookup("goes", k=1)) == ["√gam"]
+        assert roots(index.lookup("go round"))[:2] == ["√gam", "√cal"]
+
+    def test_skips_incomplete_entries(self):
+        """Test that entries without a root or meaning are not indexed."""
+        assert len(MeaningIndex.build(CORPUS)) == len(COMMON_DHATU) + 2
+
+    def test_unknown_word(self):
+        """Test that unknown and empty queries have no candidates."""
+        index = MeaningIndex.build(CORPUS)
+        assert index.lookup("swims") == []
+        assert index.lookup("") == []
+
+    def test_records_and_text_meanings(self):
+        """Test indexing records parsed from the plain-text dhatu listing."""
+        records = list(parse_dhatu_lines(["गम् 1 गतौ\n", "पठ् 1 व्यक्तायां वाचि\n"]))
+        records.append(DhatuRecord("√likh", "6", "to write"))
+        index = MeaningIndex.build(records)
+        assert roots(index.lookup("गतौ")) == ["गम्"]
+        assert index.lookup("writes")[0]["gana"] == "6"
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved index answers lookups identically."""
+        index = MeaningIndex.build(CORPUS)
+        path = tmp_path / "meaning_index.json"
+        index.save(path)
+        loaded = MeaningIndex.load(path)
+        for query in ("reads", "goes", "is", "fly"):
+            assert loaded.lookup(query) == index.lookup(query)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that a non-index JSON file is rejected."""
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"dhatu": []}), encoding='utf-8')
+        with pytest.raises(ValueError, match="not a meaning index"):
+            MeaningIndex.load(path)
@@ -143,6 +143,13 @@ class TestSandhiGenerator:
         """Test Sandhi validation with incorrect expected result."""
         assert generator.validate_sandhi("Deva", "Alaya", "WrongResult") is False
     
+    def test_split_sandhi(self, generator):
+        """Test reverse splitting of combined words."""
+        assert generator.split_sandhi("Rameti") == [("Rama", "iti")]
+        assert generator.split_sandhi("Devalaya")[0] == ("Deva", "Alaya")
+        assert all(generator.apply_sandhi(w1, w2) == "Devalaya" for w1, w2 in generator.split_sandhi("Devalaya"))
+        assert generator.split_sandhi("pathati") == []
+    
     def test_generate_word_pairs(self, generator):
         """Test word pair generation."""
         pairs = generator._generate_word_pairs(10)
@@ -0,0 +1,131 @@
+"""
+Test cases for Sandhi Service Module
+
+Tests the bulk engine, micro-batching and the localhost HTTP service.
+"""
+
+import asyncio
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from service.sandhi_service import MicroBatcher, SandhiClient, SandhiEngine, SandhiService, run_load
+
+
+def serve(test, **options):
+    """Run ``test(port)`` against a service on an ephemeral localhost port."""
+    async def main():
+        service = SandhiService(**options)
+        server = await service.start(port=0)
+        try:
+            return await test(service, server.sockets[0].getsockname()[1])
+        finally:
+            await service.stop()
+    return asyncio.run(main())
+
+
+class TestSandhiEngine:
+    """Test suite for bulk engine calls."""
+
+    def test_operations(self):
+        """Test apply, split and validate with per-item errors."""
+        engine = SandhiEngine()
+        assert engine.run("sandhi", [{"word1": "Rama", "word2": "iti"}, {"word1": "Deva"}]) == [
+            {"result": "Rameti"}, {"error": "missing field 'word2'"}]
+        assert engine.run("split", [{"word": "Rameti"}]) == [{"splits": [["Rama", "iti"]]}]
+        assert engine.run("validate", [{"word1": "Deva", "word2": "Alaya", "expected": "Devalaya"}]) == [
+            {"valid": True, "result": "Devalaya"}]
+        assert engine.run("sandhi", [{"word1": "", "word2": "x"}])[0]["error"]
+
+    def test_shared_cache(self):
+        """Test that repeated pairs hit the rule cache."""
+        engine = SandhiEngine()
+        engine.run("sandhi", [{"word1": "Rama", "word2": "iti"}] * 5)
+        assert engine.cache_info()["sandhi"] == {"hits": 4, "misses": 1, "size": 1}
+
+
+class TestMicroBatcher:
+    """Test suite for request batching."""
+
+    def test_concurrent_requests_share_batches(self):
+        """Test that concurrent submissions become a few bulk calls."""
+        calls = []
+
+        def handler(items):
+            calls.append(len(items))
+            return [item * 2 for item in items]
+
+        async def main():
+            batcher = MicroBatcher(handler, max_batch=8, max_delay=0.01)
+            batcher.start()
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(20)))
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(main()) == [i * 2 for i in range(20)]
+        assert calls == [8, 8, 4]
+
+
+class TestSandhiService:
+    """Test suite for the HTTP service on localhost."""
+
+    def test_endpoints_over_one_connection(self):
+        """Test every endpoint over a single keep-alive connection."""
+        async def test(service, port):
+            async with SandhiClient(port=port) as client:
+                results = [
+                    await client.post("/sandhi", {"word1": "Rama", "word2": "iti"}),
+                    await client.post("/split", {"word": "Devalaya"}),
+                    await client.post("/validate", {"word1": "Rama", "word2": "iti", "expected": "Ramaiti"}),
+                    await client.post("/sandhi", [{"word1": "Deva", "word2": "Alaya"}, {"word1": "x"}]),
+                    await client.post("/sandhi", {"word1": "Rama"}),
+                    await client.post("/nope", {}),
+                    await client.request("GET", "/health"),
+                ]
+            return results
+
+        (ok, split, validate, bulk, bad, missing, health) = serve(test)
+        assert ok == (200, {"result": "Rameti"})
+        assert split[1]["splits"][0] == ["Deva", "Alaya"]
+        assert validate == (200, {"valid": False, "result": "Rameti"})
+        assert bulk == (200, [{"result": "Devalaya"}, {"error": "missing field 'word2'"}])
+        assert bad[0] == 400 and missing[0] == 404
+        assert health[1]["status"] == "ok" and health[1]["requests"] == 5
+
+    def test_load_is_micro_batched(self):
+        """Test that concurrent clients are served in shared batches."""
+        payloads = [("/sandhi", {"word1": "Rama", "word2": word}) for word in ["iti", "api", "eva", "uvaca"]] * 50
+
+        async def test(service, port):
+            report = await run_load(lambda: SandhiClient(port=port), payloads, concurrency=16)
+            return report, service.health()
+
+        report, health = serve(test, max_delay=0.005)
+        assert report["requests"] == 200 and report["errors"] == 0
+        assert report["p50_ms"] <= report["p99_ms"]
+        assert health["mean_batch"] > 1
+        assert health["cache"]["sandhi"]["misses"] == 4
+
+    def test_unix_socket(self, tmp_path):
+        """Test serving on a Unix socket."""
+        path = str(tmp_path / "sandhi.sock")
+
+        async def main():
+            service = SandhiService()
+            await service.start(unix_path=path)
+            try:
+                async with SandhiClient(unix_path=path) as client:
+                    return await client.post("/sandhi", {"word1": "Rama", "word2": "iti"})
+            finally:
+                await service.stop()
+
+        assert asyncio.run(main()) == (200, {"result": "Rameti"})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
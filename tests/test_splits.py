@@ -0,0 +1,85 @@
+"""
+Test cases for Dataset Splitting Module
+
+Tests grouping keys and stable hash-based split assignment.
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.splits import HashSplitter, group_key, split_jsonl
+from generator.karaka_generator import KarakaSentenceGenerator
+from generator.sandhi_generator import SandhiGenerator
+
+
+class TestGroupKey:
+    """Test suite for group_key."""
+
+    def test_stage1_groups_by_root(self):
+        """Test that all forms of a root share a key."""
+        gacchati = {"root": "√gam", "output": "gacchati", "stage": "dhatupatha"}
+        gacchanti = {"root": "√gam", "output": "gacchanti", "stage": "dhatupatha"}
+        assert group_key(gacchati) == group_key(gacchanti) == "root:√gam"
+        assert group_key({"pratipadika": "deva", "case": "nominative"}) == "pratipadika:deva"
+
+    def test_sandhi_groups_by_input_pair(self):
+        """Test every Sandhi output format maps to the same pair key."""
+        generator = SandhiGenerator()
+        keys = {group_key(generator.generate_training_pairs([("deva", "alaya")], fmt)[0])
+                for fmt in ("jsonl", "chatml", "dict")}
+        assert keys == {"sandhi:deva + alaya"}
+
+    def test_karaka_signature(self):
+        """Test that karaka rows group by kriya root and roles."""
+        row = KarakaSentenceGenerator()[0]
+        assert group_key(row) == f"karaka:{row['karaka']['kriya']['root']}|karta"
+
+
+class TestHashSplitter:
+    """Test suite for HashSplitter."""
+
+    def test_stable_and_ratio(self):
+        """Test deterministic assignment and approximate proportions."""
+        splitter = HashSplitter({"train": 0.8, "val": 0.1, "test": 0.1})
+        keys = [f"root:√{i}" for i in range(20000)]
+        first = [splitter.split_of_key(k) for k in keys]
+        assert first == [HashSplitter({"train": 8, "val": 1, "test": 1}).split_of_key(k) for k in keys]
+        assert first.count("train") / len(keys) == pytest.approx(0.8, abs=0.01)
+        assert first.count("test") / len(keys) == pytest.approx(0.1, abs=0.01)
+
+    def test_salt_changes_assignment(self):
+        """Test that a different salt reshuffles groups."""
+        keys = [f"root:√{i}" for i in range(200)]
+        assert [HashSplitter(salt="a").split_of_key(k) for k in keys] != \
+            [HashSplitter(salt="b").split_of_key(k) for k in keys]
+
+    def test_invalid_ratios(self):
+        """Test that unusable ratios are rejected."""
+        with pytest.raises(ValueError):
+            HashSplitter({})
+        with pytest.raises(ValueError):
+            HashSplitter({"train": 1, "test": -1})
+
+    def test_split_jsonl_keeps_groups_together(self, tmp_path):
+        """Test that no karaka signature leaks across split files."""
+        source = tmp_path / "stage2.jsonl"
+        KarakaSentenceGenerator().generate_dataset(str(source))
+        counts = split_jsonl(source, tmp_path / "splits", HashSplitter({"train": 0.6, "test": 0.4}))
+
+        seen = {}
+        for name in ("train", "test"):
+            with open(tmp_path / "splits" / f"stage2.{name}.jsonl", 'r', encoding='utf-8') as f:
+                rows = [json.loads(line) for line in f]
+            assert len(rows) == counts[name] > 0
+            for row in rows:
+                assert seen.setdefault(group_key(row), name) == name
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Test cases for Line Parsers Module
+
+Tests streaming dhatu and sutra text parsing.
+"""
+
+import io
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.records import DhatuRecord, SutraRecord
+from dataset.text_parsers import parse_dhatu_lines, parse_sutra_lines
+
+
+class TestParseDhatuLines:
+    """Test suite for parse_dhatu_lines."""
+
+    def test_parses_root_gana_meaning(self):
+        """Test a typical dhatu line."""
+        records = list(parse_dhatu_lines(["गम् 1 गतौ\n"]))
+        assert len(records) == 1
+        assert isinstance(records[0], DhatuRecord)
+        assert dict(records[0]) == {"root": "गम्", "gana": "1", "meaning": "गतौ"}
+
+    def test_skips_comments_blanks_and_single_tokens(self):
+        """Test that non-entry lines are ignored."""
+        lines = ["# header\n", "\n", "   \n", "lonely\n", "  bhu 1  sattayam  bhave \n"]
+        records = list(parse_dhatu_lines(lines))
+        assert [dict(r) for r in records] == [
+            {"root": "bhu", "gana": "1", "meaning": "sattayam bhave"}
+        ]
+
+    def test_missing_meaning_is_empty(self):
+        """Test that a two-token line has an empty meaning."""
+        record = next(parse_dhatu_lines(["da 3"]))
+        assert record["meaning"] == ""
+
+
+class TestParseSutraLines:
+    """Test suite for parse_sutra_lines."""
+
+    def test_number_split_into_parts(self):
+        """Test that adhyaya, pada and sutra come from the number."""
+        record = next(parse_sutra_lines(["1.2.3: ikaḥ yaṇ aci\n"]))
+        assert isinstance(record, SutraRecord)
+        assert dict(record) == {
+            "number": "1.2.3", "text": "ikaḥ yaṇ aci",
+            "adhyaya": "1", "pada": "2", "sutra": "3",
+        }
+
+    def test_multi_digit_and_dot_separator(self):
+        """Test multi-digit components with a '.' separator."""
+        record = next(parse_sutra_lines(["8.4.68. a a iti"]))
+        assert (record["number"], record["sutra"], record["text"]) == ("8.4.68", "68", "a a iti")
+
+    def test_streams_file_object_lazily(self):
+        """Test that an open file object is consumed one line at a time."""
+        fp = io.StringIO("# sutras\n1.1.1 vṛddhirādaic\nnot a sutra\n1.1.2 adeṅ guṇaḥ\n")
+        parser = parse_sutra_lines(fp)
+        assert next(parser)["number"] == "1.1.1"
+        assert fp.tell() < len(fp.getvalue())
+        assert [r["number"] for r in parser] == ["1.1.2"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
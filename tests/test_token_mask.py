@@ -0,0 +1,132 @@
+"""
+Test cases for Token Mask Module
+
+Tests lexicon/vocabulary trie alignment and per-beam decoding state.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.token_store import ByteTokenizer
+from shim.token_mask import DONE, TokenMaskGenerator, compile_forms, token_bytes
+
+
+FORMS = ["Baalah", "Baalaah", "gacchati", "gacchanti", "pathati", "pathanti"]
+
+
+class ToyTokenizer:
+    """A tiny local subword tokenizer with greedy longest-match encoding."""
+
+    def __init__(self):
+        pieces = ["Baal", "ah", "aah", "gacch", "path", "ati", "anti", "an", "ti", "a", "h", " ", "x"]
+        chars = sorted({char for form in FORMS for char in form})
+        self.vocab = ["<eos>"] + pieces + [c for c in chars if c not in pieces]
+        self.eos_token_id = 0
+        self.vocab_size = len(self.vocab)
+
+    def encode(self, text):
+        ids = []
+        while text:
+            token_id = max((i for i, piece in enumerate(self.vocab[1:], 1) if text.startswith(piece)),
+                           key=lambda i: len(self.vocab[i]))
+            ids.append(token_id)
+            text = text[len(self.vocab[token_id]):]
+        return ids
+
+    def decode(self, ids):
+        return "".join(self.vocab[i] for i in ids if i != self.eos_token_id)
+
+
+@pytest.fixture
+def tokenizer():
+    """Toy tokenizer over FORMS."""
+    return ToyTokenizer()
+
+
+@pytest.fixture
+def masks(tokenizer):
+    """Mask generator for FORMS."""
+    return TokenMaskGenerator(FORMS, tokenizer)
+
+
+def brute_force_allowed(masks, tokenizer, text):
+    """Allowed tokens by checking every vocabulary entry against every form."""
+    allowed = set()
+    prefix = text.rsplit(" ", 1)[-1]
+    for token_id in range(1, tokenizer.vocab_size):
+        piece = tokenizer.vocab[token_id]
+        candidate = prefix + piece
+        words = candidate.split(" ")
+        if all(word in FORMS for word in words[:-1]) and any(form.startswith(words[-1]) for form in FORMS) \
+                and (words[-1] or len(words) > 1):
+            allowed.add(token_id)
+    if prefix in FORMS:
+        allowed.add(tokenizer.eos_token_id)
+    return allowed
+
+
+class TestTokenMaskGenerator:
+    """Test suite for allowed-token sets."""
+
+    def test_matches_brute_force(self, masks, tokenizer):
+        """Test allowed sets along a decoded sentence against a full vocabulary scan."""
+        text, state = "", masks.start()
+        for token_id in tokenizer.encode("Baalah gacchati"):
+            assert set(masks.allowed(state)) == brute_force_allowed(masks, tokenizer, text)
+            state = masks.advance(state, token_id)
+            text += tokenizer.vocab[token_id]
+        assert masks.is_complete(state)
+        assert masks.eos_token_id in masks.allowed(state)
+        assert masks.advance(state, masks.eos_token_id) == DONE
+        assert masks.allowed(DONE) == ()
+
+    def test_invalid_token_rejected(self, masks, tokenizer):
+        """Test that a token leaving the lexicon cannot be emitted."""
+        state = masks.advance(masks.start(), tokenizer.vocab.index("gacch"))
+        assert tokenizer.vocab.index("ah") not in masks.allowed(state)
+        assert tokenizer.vocab.index(" ") not in masks.allowed(state)
+        with pytest.raises(ValueError, match="not allowed"):
+            masks.advance(state, tokenizer.vocab.index("x"))
+
+    def test_beams_are_independent(self, masks, tokenizer):
+        """Test forking decoding state across beams."""
+        start = masks.advance(masks.start(), tokenizer.vocab.index("path"))
+        beams = [masks.advance(start, tokenizer.vocab.index("ati")),
+                 masks.advance(start, tokenizer.vocab.index("an"))]
+        singular, partial = masks.allowed_batch(beams)
+        assert masks.is_complete(beams[0]) and not masks.is_complete(beams[1])
+        assert tokenizer.vocab.index(" ") in singular
+        assert partial == tuple(sorted([tokenizer.vocab.index("ti"), tokenizer.vocab.index("t")]))
+        assert masks.mask(beams[1]).count(True) == 2
+
+    def test_byte_tokenizer(self):
+        """Test byte-level vocabularies with multi-byte Devanagari forms."""
+        tokenizer = ByteTokenizer()
+        masks = TokenMaskGenerator(["गच्छति"], tokenizer)
+        state = masks.start()
+        for byte in "गच्छति".encode('utf-8'):
+            assert masks.allowed(state) == (byte,)
+            state = masks.advance(state, byte)
+        assert masks.allowed(state) == (ord(" "), tokenizer.eos_token_id)
+        assert token_bytes(tokenizer)[tokenizer.pad_token_id] is None
+
+    def test_compile_forms_with_sandhi(self):
+        """Test that sandhi-joined forms enter the lexicon."""
+        rows = [{"output": "gacchati", "root": "√gam", "tense": "Present"}]
+        forms = compile_forms(rows, sandhi_pairs=[("Deva", "Alaya")])
+        assert forms == ["Alaya", "Deva", "Devalaya", "gacchati"]
+
+    def test_invalid_lexicon(self, tokenizer):
+        """Test lexicon validation."""
+        with pytest.raises(ValueError, match="separator"):
+            TokenMaskGenerator(["two words"], tokenizer)
+        with pytest.raises(ValueError, match="No valid forms"):
+            TokenMaskGenerator([], tokenizer)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Test cases for Packed Token Dataset Module
+
+Tests tokenization into flat token/offset files and memory-mapped reading.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataset.token_store import (
+    ByteTokenizer,
+    TokenDataset,
+    TokenDatasetWriter,
+    token_dtype,
+    tokenize_jsonl,
+)
+
+
+TOY_DATASET = Path(__file__).parent.parent / "datasets" / "toy_dataset.jsonl"
+
+
+class LargeVocabTokenizer:
+    """Word-level tokenizer whose ids need 32 bits."""
+
+    vocab_size = 100_000
+    eos_token_id = 99_999
+
+    def encode(self, text):
+        return [70_000 + len(word) for word in text.split()]
+
+
+class TestTokenStore:
+    """Test suite for the packed token format."""
+
+    def test_byte_tokenizer_round_trip(self):
+        """Test that the local tokenizer is lossless on Devanagari."""
+        tokenizer = ByteTokenizer()
+        assert tokenizer.decode(tokenizer.encode("बालः पठति") + [tokenizer.eos_token_id]) == "बालः पठति"
+
+    def test_dtype_selection(self):
+        """Test uint16 for small vocabularies and uint32 otherwise."""
+        assert token_dtype(258) == np.uint16
+        assert token_dtype(1 << 16) == np.uint16
+        assert token_dtype((1 << 16) + 1) == np.uint32
+
+    def test_toy_dataset_round_trip(self, tmp_path):
+        """Test that every field decodes back to the source text."""
+        prefix = tmp_path / "toy"
+        rows = tokenize_jsonl(TOY_DATASET, prefix)
+        data = TokenDataset(prefix)
+        tokenizer = ByteTokenizer()
+
+        with open(TOY_DATASET, 'r', encoding='utf-8') as f:
+            source = [json.loads(line) for line in f]
+        assert rows == len(data) == len(source)
+        assert isinstance(data.tokens, np.memmap)
+        for index, row in enumerate(source):
+            segments = data.segments(index)
+            assert [tokenizer.decode(segments[field]) for field in data.fields] == \
+                [row["instruction"], row["input"], row["output"]]
+            assert data.segment(index, "output")[-1] == tokenizer.eos_token_id
+        assert int(data.lengths.sum()) == data.num_tokens
+        assert np.array_equal(data[-1], data[len(data) - 1])
+        with pytest.raises(IndexError):
+            data[len(data)]
+
+    def test_rows_are_views(self, tmp_path):
+        """Test that rows share memory with the mapped token file."""
+        prefix = tmp_path / "views"
+        with TokenDatasetWriter(prefix, ByteTokenizer(), fields=("input", "output")) as writer:
+            writer.add({"input": "gam", "output": "gacchati"})
+            writer.add({"input": "path"})
+        data = TokenDataset(prefix)
+        assert np.shares_memory(data[0], data.tokens)
+        assert list(data.lengths) == [12, 5]
+        assert data.segment(1, "output").tolist() == [ByteTokenizer.eos_token_id]
+
+    def test_large_vocabulary_uses_uint32(self, tmp_path):
+        """Test that pluggable tokenizers with big vocabularies are stored losslessly."""
+        prefix = tmp_path / "wide"
+        with TokenDatasetWriter(prefix, LargeVocabTokenizer(), fields=("output",)) as writer:
+            writer.add({"output": "Baalah pustakam pathati"})
+        data = TokenDataset(prefix)
+        assert data.dtype == np.uint32
+        assert data[0].tolist() == [70_006, 70_008, 70_007, 99_999]
+
+    def test_out_of_vocabulary_id(self, tmp_path):
+        """Test that ids outside the declared vocabulary are rejected."""
+        tokenizer = LargeVocabTokenizer()
+        tokenizer.vocab_size = 10
+        tokenizer.eos_token_id = None
+        with TokenDatasetWriter(tmp_path / "bad", tokenizer) as writer:
+            with pytest.raises(ValueError, match="outside vocabulary"):
+                writer.add({"output": "gacchati"})
+
+    def test_error_leaves_no_dataset(self, tmp_path):
+        """Test that an exception inside the writer block leaves nothing readable."""
+        prefix = tmp_path / "partial"
+        tokenize_jsonl(TOY_DATASET, prefix)
+        with pytest.raises(RuntimeError, match="crash"):
+            with TokenDatasetWriter(prefix, ByteTokenizer()) as writer:
+                writer.add({"instruction": "i", "input": "x", "output": "gacchati"})
+                raise RuntimeError("crash")
+        assert not list(tmp_path.glob("partial.*"))
+        with pytest.raises(FileNotFoundError):
+            TokenDataset(prefix)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
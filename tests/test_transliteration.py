@@ -0,0 +1,162 @@
+"""
+Test cases for Transliteration Module
+
+Tests romanized Sanskrit to Devanagari conversion.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generator.transliteration import (
+    from_devanagari,
+    from_devanagari_batch,
+    iter_from_devanagari,
+    to_devanagari,
+    to_devanagari_batch,
+)
+
+
+class TestToDevanagari:
+    """Test suite for to_devanagari."""
+
+    @pytest.mark.parametrize("roman, expected", [
+        ("gacchati", "गच्छति"),
+        ("pustakam", "पुस्तकम्"),
+        ("Baalah", "बालः"),
+        ("shikshayati", "शिक्षयति"),
+        ("chhatrebhyah", "छत्रेभ्यः"),
+        ("Agnih", "अग्निः"),
+    ])
+    def test_loose_ascii_words(self, roman, expected):
+        """Test the ASCII spellings used in the toy dataset."""
+        assert to_devanagari(roman) == expected
+
+    @pytest.mark.parametrize("roman, expected", [
+        ("rāmaḥ", "रामः"),
+        ("kṛṣṇa", "कृष्ण"),
+        ("saṃskṛtam", "संस्कृतम्"),
+        ("devālaya", "देवालय"),
+        ("aiśvarya", "ऐश्वर्य"),
+    ])
+    def test_iast_words(self, roman, expected):
+        """Test IAST input with diacritics."""
+        assert to_devanagari(roman) == expected
+
+    def test_inherent_vowel_and_virama(self):
+        """Test inherent 'a', matras, conjuncts and final virama."""
+        assert to_devanagari("ka ki kta k") == "क कि क्त क्"
+
+    def test_vocalic_r_between_consonants(self):
+        """Test that 'r' inside a consonant cluster reads as vocalic ṛ."""
+        assert to_devanagari("Vrkshah") == "वृक्षः"
+        assert to_devanagari("prashnam") == "प्रश्नम्"
+
+    @pytest.mark.parametrize("roman, expected", [
+        ("Griha", "गृह"),
+        ("grihe", "गृहे"),
+        ("prichchhati", "पृच्छति"),
+        ("samskritam", "सम्स्कृतम्"),
+        ("priyati", "प्रियति"),
+        ("Stri", "स्त्रि"),
+    ])
+    def test_vocalic_ri_after_consonant(self, roman, expected):
+        """Test that 'ri' between consonants (other than y) reads as vocalic ṛ."""
+        assert to_devanagari(roman) == expected
+
+    def test_ambiguous_ri_dataset_words(self):
+        """Test that listed dataset words bypass the ri rule, and other words do not."""
+        assert to_devanagari("Balah kandukena kridati") == "बलः कन्दुकेन क्रीडति"
+        assert to_devanagari("Kridanti") == "क्रीडन्ति"
+        # Unlisted: ASCII "ri" before a consonant is always read as ṛ
+        assert to_devanagari("krida") == "कृद"
+
+    @pytest.mark.parametrize("roman, expected", [
+        ("tishthati", "तिष्ठति"),
+        ("ashtau", "अष्टौ"),
+        ("Pushpam", "पुष्पम्"),
+        ("pashchimasyam", "पश्चिमस्यम्"),
+        ("pashyati", "पश्यति"),
+        ("krishnah", "कृष्णः"),
+        ("varsha", "वर्ष"),
+        ("prashnam", "प्रश्नम्"),
+    ])
+    def test_retroflex_sh_clusters(self, roman, expected):
+        """Test that 'sh' before t, th or p, or after r/ṛ, is retroflex ṣ."""
+        assert to_devanagari(roman) == expected
+
+    def test_visarga_only_word_final(self):
+        """Test that 'h' is visarga only at the end of a word."""
+        assert to_devanagari("dahati") == "दहति"
+        assert to_devanagari("Ramah.") == "रमः."
+
+    def test_case_insensitive_and_spacing_preserved(self):
+        """Test that case is ignored and spaces are kept exactly."""
+        assert to_devanagari("GAM  gam") == "गम्  गम्"
+
+    def test_passthrough_symbols(self):
+        """Test that characters outside the scheme pass through."""
+        assert to_devanagari("√gam + 12 ||") == "√गम् + १२ ॥"
+
+    def test_batch_matches_single(self):
+        """Test that the batch API matches per-string conversion."""
+        texts = ["Baalah pathati", "Balaa likhati", "Baalah pathati"]
+        assert to_devanagari_batch(texts) == [to_devanagari(t) for t in texts]
+
+
+class TestFromDevanagari:
+    """Test suite for Devanagari to romanization."""
+
+    @pytest.mark.parametrize("devanagari, expected", [
+        ("रामः गृहं गच्छति", "rāmaḥ gṛhaṃ gacchati"),
+        ("क्षत्रियः", "kṣatriyaḥ"),
+        ("पुस्तकम्", "pustakam"),
+        ("ॐ नमः शिवाय ।", "oṃ namaḥ śivāya |"),
+        ("कृष्णार्जुनौ १२", "kṛṣṇārjunau 12"),
+    ])
+    def test_iast_output(self, devanagari, expected):
+        """Test inherent vowels, matras, virama and marks."""
+        assert from_devanagari(devanagari) == expected
+
+    def test_ascii_output_matches_dataset_spelling(self):
+        """Test the loose ASCII scheme used by the generators."""
+        assert from_devanagari("बालः पुस्तकम् पठति", scheme="ascii") == "baalah pustakam pathati"
+        assert from_devanagari("गच्छति", scheme="ascii") == "gacchati"
+        assert from_devanagari("गच्छति") == "gacchati"
+
+    @pytest.mark.parametrize("roman", [
+        "gacchati", "pathati", "likhati", "baalah pustakam pathati",
+        "shikshayati", "pashyati", "vrkshah", "prashnam",
+    ])
+    def test_ascii_round_trip(self, roman):
+        """Test that dataset outputs survive Devanagari and back unchanged."""
+        assert from_devanagari(to_devanagari(roman), scheme="ascii") == roman
+        assert from_devanagari_batch([to_devanagari(roman)], scheme="ascii") == [roman]
+
+    def test_round_trip(self):
+        """Test that IAST output converts back to the same Devanagari."""
+        for text in ["रामः गृहं गच्छति", "बालः पुस्तकम् पठति", "वृक्षे"]:
+            assert to_devanagari(from_devanagari(text)) == text
+
+    def test_non_devanagari_passthrough(self):
+        """Test that romanized text is left untouched."""
+        assert from_devanagari("Deva + Alaya") == "Deva + Alaya"
+
+    def test_unknown_scheme(self):
+        """Test that an unknown scheme raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown scheme"):
+            from_devanagari("राम", scheme="itrans")
+
+    def test_parallel_chunks_preserve_order(self):
+        """Test that chunked, multi-process conversion keeps input order."""
+        lines = [f"राम {i}" for i in range(25)]
+        expected = [from_devanagari(line) for line in lines]
+        assert from_devanagari_batch(lines, workers=2, chunk_size=4) == expected
+        assert list(iter_from_devanagari(iter(lines), chunk_size=7)) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])